@@ -1,15 +1,201 @@
 import os
 import base64
+import functools
+import inspect
+import logging
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from dataclasses import dataclass, field
 from typing import Optional, Any, List, Dict
 import pandas as pd
 import requests
+from .DBMS import add_write_listener, db_connect, db_settable, getquery, is_connected
+from .HTTP import http_get
+from .env import decode_base64, encode_base64, get_env
 from urllib.parse import urlencode
 
 
+# ----------------------------------------------------------------------
+# In‑process cache for meta‑table lookups
+# ----------------------------------------------------------------------
+# Seconds a cached lookup stays valid, per meta table (0 disables caching)
+_META_CACHE_TTL: Dict[str, float] = {
+    "mt_data_list": 3600,
+    "mt_api_url": 3600,
+    "mt_api_param": 3600,
+    "mt_api_paramset": 3600,
+    "mt_api_result": 3600,
+    "mt_api_key": 600,
+    "call_plan": 3600,
+}
+
+# Caches whose entries depend on the current user (API keys are per user)
+_USER_SCOPED_CACHES = {"mt_api_key", "call_plan"}
+
+# Meta tables a compiled call plan is built from
+_CALL_PLAN_SOURCES = {
+    "mt_data_list", "mt_api_url", "mt_api_key", "mt_api_param", "mt_api_result",
+}
+
+# Maximum number of cached lookups per meta table (least recently used out)
+_META_CACHE_MAXSIZE: Dict[str, int] = {table: 256 for table in _META_CACHE_TTL}
+
+
+class _MetaCache:
+    """TTL + LRU store of meta lookups with one bucket per meta table."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._buckets: Dict[str, OrderedDict] = {}
+        self.hits: Dict[str, int] = {}
+        self.misses: Dict[str, int] = {}
+
+    def get(self, table: str, key) -> tuple:
+        """Return ``(True, value)`` on a fresh hit, ``(False, None)`` otherwise."""
+        with self._lock:
+            bucket = self._buckets.get(table)
+            entry = bucket.get(key) if bucket is not None else None
+            if entry is not None and entry[0] > time.monotonic():
+                bucket.move_to_end(key)
+                self.hits[table] = self.hits.get(table, 0) + 1
+                return True, entry[1]
+            if entry is not None:
+                del bucket[key]
+            self.misses[table] = self.misses.get(table, 0) + 1
+            return False, None
+
+    def put(self, table: str, key, value) -> None:
+        ttl = _META_CACHE_TTL.get(table, 0)
+        if ttl <= 0:
+            return
+        with self._lock:
+            bucket = self._buckets.setdefault(table, OrderedDict())
+            bucket[key] = (time.monotonic() + ttl, value)
+            bucket.move_to_end(key)
+            while len(bucket) > _META_CACHE_MAXSIZE.get(table, 256):
+                bucket.popitem(last=False)
+
+    def invalidate(self, table: Optional[str] = None) -> None:
+        with self._lock:
+            if table is None:
+                self._buckets.clear()
+            else:
+                self._buckets.pop(table, None)
+
+    def info(self) -> pd.DataFrame:
+        with self._lock:
+            return pd.DataFrame([
+                {
+                    "table": table,
+                    "ttl": _META_CACHE_TTL[table],
+                    "maxsize": _META_CACHE_MAXSIZE[table],
+                    "size": len(self._buckets.get(table, ())),
+                    "hits": self.hits.get(table, 0),
+                    "misses": self.misses.get(table, 0),
+                }
+                for table in _META_CACHE_TTL
+            ])
+
+
+_meta_cache = _MetaCache()
+
+
+def _cacheable(value: Any) -> bool:
+    """
+    True if a lookup result may be cached. Decided from the result itself:
+    the shared STATUS can be flipped by ``getquery`` in another thread.
+    """
+    if value is None:
+        return False
+    if isinstance(value, pd.DataFrame):
+        return value.attrs.get("status") != "0" and not value.empty
+    return True
+
+
+def _cached_meta(table: str):
+    """
+    Cache the decorated ``from_meta_*`` lookup under *table*.
+
+    Arguments are normalised through the function signature so positional
+    and keyword calls share an entry. Failed queries (``attrs["status"]``
+    "0" of the returned frame), empty frames and ``None`` are not cached,
+    and DataFrames are copied so callers cannot mutate the cache.
+    """
+    def decorator(func):
+        signature = inspect.signature(func)
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            bound = signature.bind(*args, **kwargs)
+            bound.apply_defaults()
+            key = tuple(bound.arguments.items())
+            if table in _USER_SCOPED_CACHES:
+                # API keys are stored per user
+                key += (get_env("USERNAME"),)
+
+            hit, value = _meta_cache.get(table, key)
+            if not hit:
+                value = func(*args, **kwargs)
+                if _cacheable(value):
+                    _meta_cache.put(table, key, value)
+
+            if isinstance(value, pd.DataFrame):
+                return value.copy()
+            return value
+
+        return wrapper
+
+    return decorator
+
+
+def set_meta_cache_options(
+    table: Optional[str] = None,
+    ttl: Optional[float] = None,
+    maxsize: Optional[int] = None,
+) -> None:
+    """
+    Set the TTL (seconds) and/or LRU size of the meta cache for *table*,
+    or for every meta table when *table* is omitted.
+    """
+    tables = list(_META_CACHE_TTL) if table is None else [table]
+    for name in tables:
+        if name not in _META_CACHE_TTL:
+            raise ValueError(f"table must be one of {list(_META_CACHE_TTL)}")
+        if ttl is not None:
+            _META_CACHE_TTL[name] = ttl
+        if maxsize is not None:
+            _META_CACHE_MAXSIZE[name] = maxsize
+        _meta_cache.invalidate(name)
+
+
+def meta_cache_clear(table: Optional[str] = None) -> None:
+    """Drop cached lookups for *table*, or for every meta table."""
+    _meta_cache.invalidate(table)
+
+
+def meta_cache_info() -> pd.DataFrame:
+    """Return TTL, LRU size, current size and hit/miss counters per table."""
+    return _meta_cache.info()
+
+
+def _invalidate_meta_on_write(table: str, schema: str) -> None:
+    """Write listener: drop cached lookups of a meta table that changed."""
+    if schema == "meta" and table.startswith("mt_"):
+        _meta_cache.invalidate(table)
+        if table in _CALL_PLAN_SOURCES:
+            _meta_cache.invalidate("call_plan")
+
+
+add_write_listener(_invalidate_meta_on_write)
+
+
 # ----------------------------------------------------------------------
 # Functions that map directly from the R source
 # ----------------------------------------------------------------------
 
+@_cached_meta("mt_api_url")
 def from_meta_apiurl(api_url_id: Optional[str] = None) -> List[Dict[str, Any]]:
     """Retrieve rows from `mt_api_url` optionally filtered by `api_url_id`."""
     if not is_connected("meta"):
@@ -23,6 +209,7 @@ def from_meta_apiurl(api_url_id: Optional[str] = None) -> List[Dict[str, Any]]:
     return getquery(sql)
 
 
+@_cached_meta("mt_api_param")
 def from_meta_param(api_url_id: Optional[str] = None) -> List[Dict[str, Any]]:
     """Retrieve rows from `mt_api_param` optionally filtered by `api_url_id`."""
     if not is_connected("meta"):
@@ -40,6 +227,7 @@ def from_meta_param(api_url_id: Optional[str] = None) -> List[Dict[str, Any]]:
     return getquery(sql)
 
 
+@_cached_meta("mt_api_key")
 def from_meta_apikey(api_key_id: Optional[str] = None) -> Optional[str]:
     """Fetch and decode the encrypted API key for a given `api_key_id`."""
     if not is_connected("meta"):
@@ -80,6 +268,7 @@ def set_apikey_env(api_key_id: Optional[str] = None) -> None:
     # Function returns None (equivalent to R's invisible())
 
 
+@_cached_meta("mt_data_list")
 def from_meta_datalist(data_id: Optional[str] = None) -> List[Dict[str, Any]]:
     """Retrieve data list rows, optionally filtered by `data_id`."""
     if not is_connected("meta"):
@@ -93,6 +282,7 @@ def from_meta_datalist(data_id: Optional[str] = None) -> List[Dict[str, Any]]:
     return getquery(sql)
 
 
+@_cached_meta("mt_api_paramset")
 def from_meta_pramset(
     api_url_id: Optional[str] = None,
     param_seq: Optional[int] = None
@@ -127,19 +317,12 @@ def from_meta_pramset(
     return getquery(sql)
 
 
+@_cached_meta("mt_api_result")
 def from_meta_result(api_url_id: Optional[str] = None) -> List[Dict[str, Any]]:
     """Fetch result rows, optionally filtered by `api_url_id`."""
     if not is_connected("meta"):
         db_connect("meta")
 
-    # The R code always loads a specific data list row; replicate the same logic
-    data_list = from_meta_datalist(data_id="DA0001")
-    if data_list:
-        table_id = data_list[0].get("table_id")
-        # `table_id` is retrieved but not used further in the original R code.
-        # Keep it here in case future logic needs it.
-        _ = table_id
-
     if api_url_id is None:
         sql = "SELECT * FROM mt_api_result"
     else:
@@ -303,80 +486,119 @@ def from_meta_ddl(
 # ----------------------------------------------------------------------
 
 
-def get_api_url(data_id=None, **kwargs):
+@dataclass(frozen=True)
+class ApiCallPlan:
     """
-    Build the full API call URL for a given data_id.
-    Additional parameters are supplied via **kwargs.
+    Compiled call plan for one ``data_id``: base URL, decoded API key,
+    ordered parameter template and result schema. Building a URL from a
+    plan needs no database access.
+    """
+    data_id: str
+    api_url_id: str
+    base_url: str
+    api_key: Optional[str]
+    # (param_id, default_value, is_key) in param_seq order
+    params: tuple
+    result_info: pd.DataFrame = field(compare=False, repr=False)
+
+    def build_url(self, **kwargs) -> str:
+        """Fill the parameter template with *kwargs* and return the URL."""
+        query_params = {}
+        for param_id, default_value, is_key in self.params:
+            if is_key:
+                # Use API key for key parameters
+                query_params[param_id] = self.api_key
+            elif param_id in kwargs:
+                # Use supplied argument if present, otherwise default
+                query_params[param_id] = kwargs[param_id]
+            else:
+                query_params[param_id] = default_value
+
+        return f"{self.base_url}?{urlencode(query_params)}"
+
+
+@_cached_meta("call_plan")
+def compile_call_plan(data_id: Optional[str] = None) -> ApiCallPlan:
+    """
+    Build (or fetch from cache) the ``ApiCallPlan`` for *data_id*.
+
+    Data list, API URL, API key and parameters are read with a single
+    joined query; the result schema comes from the cached
+    ``from_meta_result``.
     """
     if data_id is None:
         raise ValueError("'data_id' must be provided.")
 
-    # ------------------------------------------------------------------
-    # Retrieve data list information
-    # ------------------------------------------------------------------
-    data_list = from_meta_datalist(data_id)
-    if data_list.empty:
-        raise ValueError(f"Data ID {data_id} not found in data list meta database.")
+    if not is_connected("meta"):
+        db_connect("meta")
 
-    api_url_id = data_list["api_url_id"].iloc[0]
+    user_id_enc = encode_base64(get_env("USERNAME"))
+
+    sql = f"""
+        SELECT d.api_url_id,
+               u.call_url,
+               u.is_usekey,
+               u.key_id,
+               k.key_enc,
+               p.param_seq,
+               p.param_id,
+               p.default_value,
+               p.is_key
+          FROM mt_data_list d
+          LEFT JOIN mt_api_url u
+            ON u.api_url_id = d.api_url_id
+          LEFT JOIN mt_api_key k
+            ON k.key_id = u.key_id
+           AND k.user_id_enc = '{user_id_enc}'
+          LEFT JOIN mt_api_param p
+            ON p.api_url_id = d.api_url_id
+         WHERE d.data_id = '{data_id}'
+         ORDER BY p.param_seq
+    """
+    plan_info = getquery(sql)
 
-    # ------------------------------------------------------------------
-    # Retrieve API URL information
-    # ------------------------------------------------------------------
-    api_url = from_meta_apiurl(api_url_id)
-    if api_url.empty:
-        raise ValueError(f"Data ID {data_id} not found in api url meta database.")
+    if plan_info.empty:
+        raise ValueError(f"Data ID {data_id} not found in data list meta database.")
 
-    base_url = api_url["call_url"].iloc[0]
-    is_usekey = api_url["is_usekey"].iloc[0]
-    api_key_id = api_url["key_id"].iloc[0]
+    first = plan_info.iloc[0]
+    if pd.isna(first["call_url"]):
+        raise ValueError(f"Data ID {data_id} not found in api url meta database.")
 
-    # ------------------------------------------------------------------
-    # Retrieve API key if needed
-    # ------------------------------------------------------------------
     api_key = None
-    if is_usekey == "Y":
-        api_key = from_meta_apikey(api_key_id)
-        if api_key is None or pd.isna(api_key):
+    if first["is_usekey"] == "Y":
+        if pd.isna(first["key_enc"]):
             raise ValueError(
-                f"API key for API Key ID {api_key_id} not found. Please register your API key first."
+                f"API key for API Key ID {first['key_id']} not found. Please register your API key first."
             )
+        api_key = decode_base64(first["key_enc"])
 
-    # ------------------------------------------------------------------
-    # Retrieve API parameter information
-    # ------------------------------------------------------------------
-    params = from_meta_param(api_url_id)
+    params = tuple(
+        (str(row["param_id"]), row["default_value"], row["is_key"] == "Y")
+        for _, row in plan_info.dropna(subset=["param_id"]).iterrows()
+    )
 
-    # parameters that are marked as key (is_key == "Y")
-    key_params = (
-        params.loc[params["is_key"] == "Y", "param_id"]
-        .astype(str)
-        .tolist()
+    return ApiCallPlan(
+        data_id=data_id,
+        api_url_id=first["api_url_id"],
+        base_url=first["call_url"],
+        api_key=api_key,
+        params=params,
+        result_info=from_meta_result(api_url_id=first["api_url_id"]),
     )
 
-    query_params = {}
 
-    # iterate over each parameter definition
-    for _, row in params.iterrows():
-        param_id = str(row["param_id"])
-        default_value = row["default_value"]
+def get_api_url(data_id=None, **kwargs):
+    """
+    Build the full API call URL for a given data_id.
+    Additional parameters are supplied via **kwargs.
 
-        if param_id in key_params:
-            # Use API key for key parameters
-            query_params[param_id] = api_key
-        else:
-            # Use supplied argument if present, otherwise default
-            if param_id in kwargs:
-                query_params[param_id] = kwargs[param_id]
-            else:
-                query_params[param_id] = default_value
+    The URL is built from the cached ``ApiCallPlan`` of *data_id*, so
+    repeated calls do not touch the meta database.
+    """
+    if data_id is None:
+        raise ValueError("'data_id' must be provided.")
 
-    # ------------------------------------------------------------------
-    # Build final URL
-    # ------------------------------------------------------------------
-    query_string = urlencode(query_params)
-    full_url = f"{base_url}?{query_string}"
-    return full_url
+    return compile_call_plan(data_id).build_url(**kwargs)
 
 
 def get_api_result(data_id=None, **kwargs):
@@ -388,7 +610,7 @@ def get_api_result(data_id=None, **kwargs):
 
     call_url = get_api_url(data_id=data_id, **kwargs)
 
-    response = requests.get(call_url)
+    response = http_get(call_url)
     response.raise_for_status()            # raise if HTTP error
 
     # Convert JSON payload to a pandas DataFrame
@@ -412,13 +634,9 @@ def get_api_data(data_id=None, **kwargs):
         raise ValueError("'data_id' must be provided.")
 
     # ------------------------------------------------------------------
-    # Retrieve meta information
+    # Retrieve meta information (compiled call plan)
     # ------------------------------------------------------------------
-    data_info = from_meta_datalist(data_id=data_id)
-    if data_info.empty:
-        raise ValueError(f"Data ID {data_id} not found in data list meta database.")
-
-    result_info = from_meta_result(api_url_id=data_info["api_url_id"].iloc[0])
+    result_info = compile_call_plan(data_id).result_info
 
     # ------------------------------------------------------------------
     # Initialise an empty DataFrame whose columns are the result IDs
@@ -463,3 +681,228 @@ def get_api_data(data_id=None, **kwargs):
 
     return df_data
 
+
+
+# ----------------------------------------------------------------------
+# Parameter grid fetching over mt_api_paramset
+# ----------------------------------------------------------------------
+def _grid_param_map(api_url_id: str, param_seqs: List[int]) -> Dict[int, str]:
+    """
+    Map ``mt_api_paramset.param_seq`` values to API parameter ids.
+
+    The value sets are numbered either like ``mt_api_param.param_seq`` or,
+    as in the shipped metadata, like the parameters without the API key
+    (which never has value sets). Value sets of constant parameters are
+    left out of the map, so they do not become grid dimensions.
+    """
+    params = from_meta_param(api_url_id).copy()
+    params["param_seq"] = params["param_seq"].astype(int)
+    params = params.sort_values("param_seq")
+
+    by_seq = params.set_index("param_seq")
+    if not set(param_seqs) <= set(by_seq.index) or (
+        by_seq.loc[param_seqs, "is_key"] == "Y"
+    ).any():
+        by_seq = params[params["is_key"] != "Y"].reset_index(drop=True)
+        by_seq.index = by_seq.index + 1
+
+    unknown = [seq for seq in param_seqs if seq not in by_seq.index]
+    if unknown:
+        raise ValueError(
+            f"Cannot map value sets {unknown} of {api_url_id} to parameters; "
+            "please supply 'param_map'."
+        )
+
+    return {
+        seq: str(by_seq.at[seq, "param_id"])
+        for seq in param_seqs
+        if by_seq.at[seq, "is_constant"] != "Y"
+    }
+
+
+def expand_param_grid(
+    data_id: Optional[str] = None,
+    param_map: Optional[Dict[int, str]] = None,
+    **fixed,
+) -> List[Dict[str, Any]]:
+    """
+    Expand the allowed values of ``mt_api_paramset`` into parameter
+    combinations for *data_id*.
+
+    Value sets are combined level by level in ``param_seq`` order. A value
+    whose ``parent_set`` is filled is only combined with that value of its
+    parent parameter (``mt_api_param.parent_seq``, or the previous level).
+
+    Parameters
+    ----------
+    data_id : str
+        Data identifier (required).
+    param_map : dict, optional
+        ``{param_seq: param_id}`` for the value sets. Derived from
+        ``mt_api_param`` when omitted; value sets left out of the map
+        are not expanded.
+    **fixed
+        A value (or list of values) restricting a grid parameter, e.g.
+        ``vwCd="MT_ZTITLE"``. Other keywords are ignored here.
+
+    Returns
+    -------
+    list of dict
+        One ``{param_id: value}`` mapping per combination.
+    """
+    if data_id is None:
+        raise ValueError("'data_id' must be provided.")
+
+    api_url_id = compile_call_plan(data_id).api_url_id
+    paramset = from_meta_pramset(api_url_id=api_url_id)
+    if paramset.empty:
+        return []
+
+    param_seqs = sorted(paramset["param_seq"].astype(int).unique().tolist())
+    if param_map is None:
+        param_map = _grid_param_map(api_url_id, param_seqs)
+    param_seqs = [seq for seq in param_seqs if seq in param_map]
+
+    # Parent parameter of each grid parameter (from mt_api_param.parent_seq)
+    params = from_meta_param(api_url_id)
+    seq_to_id = dict(zip(params["param_seq"].astype(int), params["param_id"].astype(str)))
+    parent_of: Dict[str, Optional[str]] = {}
+    for level, seq in enumerate(param_seqs):
+        param_id = param_map[seq]
+        parent_seq = params.loc[params["param_id"] == param_id, "parent_seq"]
+        if not parent_seq.empty and pd.notna(parent_seq.iloc[0]) and parent_seq.iloc[0] != "":
+            parent_of[param_id] = seq_to_id.get(int(parent_seq.iloc[0]))
+        else:
+            parent_of[param_id] = param_map[param_seqs[level - 1]] if level else None
+
+    combos: List[Dict[str, Any]] = [{}]
+    for seq in param_seqs:
+        param_id = param_map[seq]
+        rows = paramset[paramset["param_seq"].astype(int) == seq]
+        parent_set = rows["parent_set"].fillna("").astype(str)
+
+        allowed = fixed.get(param_id)
+        if allowed is not None and not isinstance(allowed, (list, tuple, set)):
+            allowed = [allowed]
+
+        expanded = []
+        for combo in combos:
+            parent_id = parent_of[param_id]
+            if parent_id in combo:
+                mask = (parent_set == "") | (parent_set == str(combo[parent_id]))
+                values = rows.loc[mask, "value_set"].tolist()
+            else:
+                values = rows["value_set"].tolist()
+
+            if allowed is not None:
+                values = [v for v in values if v in allowed]
+
+            expanded.extend({**combo, param_id: v} for v in values)
+        combos = expanded
+
+    return combos
+
+
+def get_api_data_grid(
+    data_id: Optional[str] = None,
+    grid: Optional[List[Dict[str, Any]]] = None,
+    max_workers: int = 4,
+    callback=None,
+    table_nm: Optional[str] = None,
+    schema: str = "ods",
+    mode: str = "append",
+    pk_cols: Optional[List[str]] = None,
+    param_map: Optional[Dict[int, str]] = None,
+    verbose: bool = False,
+    **kwargs,
+) -> pd.DataFrame:
+    """
+    Run ``get_api_data`` over a parameter grid with bounded concurrency.
+
+    Parameters
+    ----------
+    data_id : str
+        Data identifier (required).
+    grid : list of dict, optional
+        Parameter combinations; built with ``expand_param_grid`` (using
+        *param_map* and *kwargs* as restrictions) when omitted.
+    max_workers : int, default 4
+        Number of API calls in flight at the same time.
+    callback : callable, optional
+        ``callback(params, df)`` called for every non‑empty partial result.
+    table_nm : str, optional
+        When given, every partial result is written with ``db_settable``
+        into this table of *schema* using *mode* (and *pk_cols* for upsert).
+    verbose : bool, default False
+        If True, prints progress for every finished combination.
+    **kwargs
+        Grid restrictions and constant parameters passed to every call.
+
+    Returns
+    -------
+    pd.DataFrame
+        All partial results concatenated when neither *callback* nor
+        *table_nm* is given, otherwise an empty frame. Combinations whose
+        call or write failed are listed in ``result.attrs["errors"]``.
+    """
+    if data_id is None:
+        raise ValueError("'data_id' must be provided.")
+
+    if grid is None:
+        grid = expand_param_grid(data_id, param_map=param_map, **kwargs)
+
+    # Build the call plan once before the workers start
+    compile_call_plan(data_id)
+
+    grid_params = {k for combo in grid for k in combo}
+    constants = {k: v for k, v in kwargs.items() if k not in grid_params}
+
+    collected: List[pd.DataFrame] = []
+    errors: Dict[tuple, str] = {}
+
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        futures = {
+            executor.submit(get_api_data, data_id=data_id, **constants, **params): params
+            for params in grid
+        }
+
+        # Results are consumed here, in the calling thread, so callbacks
+        # and db_settable never run concurrently.
+        for done, future in enumerate(as_completed(futures), start=1):
+            params = futures[future]
+            try:
+                df_part = future.result()
+            except Exception as e:
+                errors[tuple(params.items())] = str(e)
+                logging.warning(f"API call failed for {params}: {e}")
+                continue
+
+            if verbose:
+                print(f"[{done}/{len(grid)}] {params}")
+
+            if not isinstance(df_part, pd.DataFrame) or df_part.empty:
+                continue
+
+            if callback is not None:
+                callback(params, df_part)
+            if table_nm is not None:
+                try:
+                    db_settable(
+                        name=table_nm,
+                        value=df_part,
+                        append=True,
+                        schema=schema,
+                        mode=mode,
+                        pk_cols=pk_cols,
+                        raise_error=True,
+                    )
+                except Exception as e:
+                    errors[tuple(params.items())] = f"write to {table_nm} failed: {e}"
+                    logging.warning(f"Writing {table_nm} failed for {params}: {e}")
+                    continue
+            if callback is None and table_nm is None:
+                collected.append(df_part)
+
+    result = pd.concat(collected, ignore_index=True) if collected else pd.DataFrame()
+    result.attrs["errors"] = errors
+    return result
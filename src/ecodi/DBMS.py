@@ -7,18 +7,27 @@ for three schemas (meta, ods, data) supporting PostgreSQL and MySQL.
 """
 
 import os
+import io
 import base64
+import atexit
+import tempfile
+import logging
+import queue
+import threading
+import time
 from typing import Optional, Union, List
 import sqlalchemy
-from sqlalchemy import create_engine, text, inspect, insert
+from sqlalchemy import create_engine, text, inspect, insert, event
 from sqlalchemy import MetaData
 from sqlalchemy import Table, Column, DateTime, Integer, String
 from sqlalchemy.engine import Engine, Connection
 from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.pool import QueuePool
 import random
 from datetime import datetime
 import pandas as pd
 import numpy as np
+from .env import get_env, set_env
 
 # ----------------------------------------------------------------------
 # Simple environment‑like storage (mirrors the R get_env / set_env helpers)
@@ -62,6 +71,488 @@ def _build_connection_string(
         raise ValueError(f"Unsupported DBMS: {dbms}")
 
 
+# ----------------------------------------------------------------------
+# Engine registry (one pooled engine per dbms/host/port/schema)
+# ----------------------------------------------------------------------
+_engine_registry: dict = {}
+_engine_metrics: dict = {}
+_engine_lock = threading.Lock()
+
+# Default pool settings, applied to engines created after the change
+_pool_options: dict = {
+    "pool_size": 5,
+    "max_overflow": 10,
+    "pool_timeout": 30,
+    "pool_recycle": 3600,
+    "pool_pre_ping": True,
+}
+
+
+class _MeteredQueuePool(QueuePool):
+    """``QueuePool`` that records checkout counts and wait times."""
+
+    def _do_get(self):
+        metrics = getattr(self, "_ecodi_metrics", None)
+        start = time.perf_counter()
+        try:
+            return super()._do_get()
+        except sqlalchemy.exc.TimeoutError:
+            if metrics is not None:
+                metrics["timeouts"] += 1
+            raise
+        finally:
+            if metrics is not None:
+                waited = time.perf_counter() - start
+                metrics["checkouts"] += 1
+                metrics["wait_total"] += waited
+                metrics["wait_max"] = max(metrics["wait_max"], waited)
+
+
+def set_pool_options(**options) -> None:
+    """
+    Change the pool settings used for newly created engines.
+
+    Accepted keys are ``pool_size``, ``max_overflow``, ``pool_timeout``,
+    ``pool_recycle`` and ``pool_pre_ping``. Engines that already live in
+    the registry keep their settings until ``dispose_engines`` is called.
+    """
+    unknown = set(options) - set(_pool_options)
+    if unknown:
+        raise ValueError(f"Unknown pool option(s): {sorted(unknown)}")
+    _pool_options.update(options)
+
+
+def _resolve_credentials(schema: str,
+                         user: Optional[str],
+                         password: Optional[str]) -> tuple:
+    """Fill missing user/password from the base64 ``{SCHEMA}_INFO`` value."""
+    if user is not None and password is not None:
+        return user, password
+
+    # The INFO variable is base‑64 encoded "user:password"
+    info_key = f"{schema.upper()}_INFO"
+    encoded = get_env(info_key)
+    if not encoded:
+        raise RuntimeError(f"Missing environment variable: {info_key}")
+
+    decoded = base64.b64decode(encoded).decode()
+    cred_user, cred_pass = decoded.split(":", 1)
+
+    return (user or cred_user), (password or cred_pass)
+
+
+def _get_engine(dbms: str,
+                host: str,
+                port: int,
+                dbname: str,
+                schema: str,
+                user: Optional[str] = None,
+                password: Optional[str] = None) -> Engine:
+    """
+    Return the registered engine for (dbms, host, port, schema), creating
+    it on first use. Credentials are only decoded when a new engine is built.
+    """
+    key = (dbms, host, port, schema)
+
+    with _engine_lock:
+        engine = _engine_registry.get(key)
+        if engine is not None:
+            return engine
+
+        user, password = _resolve_credentials(schema, user, password)
+        conn_str = _build_connection_string(
+            dbms=dbms,
+            user=user,
+            password=password,
+            host=host,
+            port=port,
+            dbname=dbname,
+            schema=schema,
+        )
+        # LOAD DATA LOCAL INFILE (bulk loads) must be enabled client side
+        connect_args = {"local_infile": True} if dbms == "mysql" else {}
+        engine = create_engine(
+            conn_str,
+            poolclass=_MeteredQueuePool,
+            connect_args=connect_args,
+            **_pool_options,
+        )
+
+        metrics = {
+            "connects": 0,
+            "checkouts": 0,
+            "timeouts": 0,
+            "wait_total": 0.0,
+            "wait_max": 0.0,
+        }
+        engine.pool._ecodi_metrics = metrics
+
+        def _on_connect(dbapi_connection, connection_record):
+            metrics["connects"] += 1
+
+        event.listen(engine, "connect", _on_connect)
+
+        _engine_registry[key] = engine
+        _engine_metrics[key] = metrics
+
+    return engine
+
+
+def dispose_engines() -> int:
+    """
+    Dispose every registered engine and empty the registry.
+    Returns the number of engines disposed.
+    """
+    with _engine_lock:
+        engines = list(_engine_registry.values())
+        _engine_registry.clear()
+        _engine_metrics.clear()
+
+    for engine in engines:
+        engine.dispose()
+
+    for schema in ("meta", "ods", "data"):
+        set_env(f"{schema.upper()}_ISCONNCT", False)
+
+    return len(engines)
+
+
+def pool_status() -> pd.DataFrame:
+    """
+    Report pool occupancy and checkout metrics for every registered engine.
+
+    Returns
+    -------
+    pandas.DataFrame
+        One row per engine with the registry key, the current pool state
+        (size, checked in/out, overflow) and the cumulative checkout count,
+        timeouts and wait times in seconds.
+    """
+    rows = []
+    with _engine_lock:
+        items = list(_engine_registry.items())
+
+    for (dbms, host, port, schema), engine in items:
+        pool = engine.pool
+        metrics = _engine_metrics.get((dbms, host, port, schema), {})
+        checkouts = metrics.get("checkouts", 0)
+        wait_total = metrics.get("wait_total", 0.0)
+        rows.append({
+            "dbms": dbms,
+            "host": host,
+            "port": port,
+            "schema": schema,
+            "pool_size": pool.size(),
+            "checkedin": pool.checkedin(),
+            "checkedout": pool.checkedout(),
+            "overflow": pool.overflow(),
+            "connects": metrics.get("connects", 0),
+            "checkouts": checkouts,
+            "timeouts": metrics.get("timeouts", 0),
+            "wait_total": wait_total,
+            "wait_avg": wait_total / checkouts if checkouts else 0.0,
+            "wait_max": metrics.get("wait_max", 0.0),
+        })
+
+    return pd.DataFrame(rows)
+
+
+# ----------------------------------------------------------------------
+# mt_log_manage writer (buffered background sink, synchronous fallback)
+# ----------------------------------------------------------------------
+_log_metadata = MetaData()
+
+_log_manage_table = Table(
+    "mt_log_manage",
+    _log_metadata,
+    Column("user_id", String(20), primary_key=True),
+    Column("db_id", String(20), primary_key=True),
+    Column("schema_nm", String(20), primary_key=True),
+    Column("start_dt", DateTime, primary_key=True),
+    Column("rand_key", Integer, primary_key=True),
+    Column("end_dt", DateTime),
+    Column("record_cnt", Integer),
+    Column("column_cnt", Integer),
+    Column("sql_stmt", String(4000)),
+    Column("status", String(20)),
+    Column("error_msg", String(1000)),
+    Column("cret_nm", String(20)),
+    schema="ecodi_meta",
+)
+
+# "async" buffers records for the background writer, "sync" inserts
+# every record immediately (strict auditing).
+_log_options: dict = {
+    "mode": "async",
+    "batch_size": 200,
+    "flush_interval": 2.0,
+    "queue_size": 10_000,
+}
+
+_log_queue: Optional[queue.Queue] = None
+_log_thread: Optional[threading.Thread] = None
+_log_start_lock = threading.Lock()
+_LOG_FLUSH = object()   # sentinel that forces the writer to flush
+
+
+def set_log_options(**options) -> None:
+    """
+    Change how ``mt_log_manage`` records are written.
+
+    Accepted keys are ``mode`` ("async" or "sync"), ``batch_size``,
+    ``flush_interval`` (seconds) and ``queue_size``. Pending records are
+    flushed before the new options take effect.
+    """
+    unknown = set(options) - set(_log_options)
+    if unknown:
+        raise ValueError(f"Unknown log option(s): {sorted(unknown)}")
+    if "mode" in options:
+        _match_arg(options["mode"], ["async", "sync"])
+
+    global _log_queue, _log_thread
+    flush_log()
+    with _log_start_lock:
+        _log_options.update(options)
+        # Restart the writer so a new queue size / interval is picked up
+        if _log_thread is not None and _log_thread.is_alive():
+            _log_queue.put(None)
+            _log_thread.join()
+        _log_queue = None
+        _log_thread = None
+
+
+def _log_manage_record(schema: str,
+                       start_dt: str,
+                       end_dt: str,
+                       record_cnt: int,
+                       column_cnt: int,
+                       sql_stmt: str,
+                       status: str,
+                       error_msg: str) -> dict:
+    """Build one ``mt_log_manage`` row for an operation on *schema*."""
+    uid = get_env("USERNAME") or "unknown_user"
+
+    # Decode the base64‑encoded DB info string ("dbid:password")
+    encoded_info = get_env(f"{schema.upper()}_INFO")
+    dbinfo_bytes = base64.b64decode(encoded_info) if encoded_info else b""
+    dbinfo = dbinfo_bytes.decode("utf-8", errors="ignore")
+    dbid = dbinfo.split(":")[0] if ":" in dbinfo else ""
+
+    # Random key generation (mirrors the R logic)
+    rnd = round(random.random() * 100_000_000)
+    rnd = rnd * 10 if rnd < 100_000_000 else rnd
+
+    return {
+        "user_id": uid,
+        "db_id": dbid,
+        "schema_nm": f"ecodi_{schema}",
+        "start_dt": start_dt,
+        "rand_key": rnd,
+        "end_dt": end_dt,
+        "record_cnt": int(record_cnt),
+        "column_cnt": int(column_cnt),
+        "sql_stmt": str(sql_stmt)[:3500],
+        "status": status,
+        "error_msg": str(error_msg)[:1000],
+        "cret_nm": uid,
+    }
+
+
+def _insert_log_records(records: List[dict]) -> None:
+    """Insert *records* into ``mt_log_manage`` with one multi‑row INSERT."""
+    if not records:
+        return
+
+    if not is_connected("meta"):
+        db_connect("meta")
+
+    meta_engine = get_connection("meta")
+    with meta_engine.begin() as conn:   # ensures transaction handling
+        conn.execute(insert(_log_manage_table).values(records))
+
+
+def _log_worker(log_queue: queue.Queue) -> None:
+    """Background loop: flush buffered records on size or time triggers."""
+    batch: List[dict] = []
+    handled = 0
+    deadline = time.monotonic() + _log_options["flush_interval"]
+
+    while True:
+        timeout = max(0.0, deadline - time.monotonic())
+        try:
+            item = log_queue.get(timeout=timeout)
+            handled += 1
+        except queue.Empty:
+            item = _LOG_FLUSH
+
+        stop = item is None
+        if isinstance(item, dict):
+            batch.append(item)
+
+        if (stop or item is _LOG_FLUSH
+                or len(batch) >= _log_options["batch_size"]):
+            try:
+                _insert_log_records(batch)
+            except Exception as e:
+                logging.warning(f"Failed to write {len(batch)} log record(s): {e}")
+            batch = []
+            deadline = time.monotonic() + _log_options["flush_interval"]
+
+            for _ in range(handled):
+                log_queue.task_done()
+            handled = 0
+
+        if stop:
+            return
+
+
+def _ensure_log_writer() -> queue.Queue:
+    """Start the background writer thread on first use."""
+    global _log_queue, _log_thread
+    with _log_start_lock:
+        if _log_thread is None or not _log_thread.is_alive():
+            _log_queue = queue.Queue(maxsize=_log_options["queue_size"])
+            _log_thread = threading.Thread(
+                target=_log_worker,
+                args=(_log_queue,),
+                name="ecodi-log-writer",
+                daemon=True,
+            )
+            _log_thread.start()
+        return _log_queue
+
+
+def write_log_manage(record: dict) -> None:
+    """
+    Hand one ``mt_log_manage`` record to the log writer.
+
+    In "async" mode the record is queued and written in a batch; when the
+    queue is full the record is written synchronously instead of dropped.
+    """
+    if _log_options["mode"] == "sync":
+        _insert_log_records([record])
+        return
+
+    log_queue = _ensure_log_writer()
+    try:
+        log_queue.put_nowait(record)
+    except queue.Full:
+        _insert_log_records([record])
+
+
+def flush_log() -> None:
+    """Block until every queued ``mt_log_manage`` record has been written."""
+    log_queue, log_thread = _log_queue, _log_thread
+    if log_queue is None or log_thread is None or not log_thread.is_alive():
+        return
+    log_queue.put(_LOG_FLUSH)
+    log_queue.join()
+
+
+atexit.register(flush_log)
+
+
+# ----------------------------------------------------------------------
+# mt_log_dataimp writer (one multi‑row INSERT per batch)
+# ----------------------------------------------------------------------
+_log_dataimp_table = Table(
+    "mt_log_dataimp",
+    _log_metadata,
+    Column("user_id", String(20), primary_key=True),
+    Column("db_id", String(20), primary_key=True),
+    Column("schema_nm", String(20), primary_key=True),
+    Column("start_dt", DateTime, primary_key=True),
+    Column("end_dt", DateTime),
+    Column("data_id", String(6)),
+    Column("table_id", String(50), primary_key=True),
+    Column("table_nm", String(50)),
+    Column("api_params", String(500), primary_key=True),
+    Column("record_cnt", Integer),
+    Column("column_cnt", Integer),
+    Column("status", String(20)),
+    Column("error_msg", String(1000)),
+    Column("cret_nm", String(20)),
+    schema="ecodi_meta",
+)
+
+
+def write_log_dataimp(records: List[dict], schema: str = "meta") -> int:
+    """
+    Write data import log rows into ``mt_log_dataimp`` in one transaction.
+
+    Parameters
+    ----------
+    records : list of dict
+        Rows with the keys start_dt, end_dt, data_id, table_id, table_nm,
+        api_params, record_cnt, column_cnt, status and error_msg.
+        user_id, db_id, schema_nm and cret_nm are filled in.
+    schema : str, default "meta"
+        Schema the imported data was written to.
+
+    Returns
+    -------
+    int
+        Number of log rows written.
+    """
+    if not records:
+        return 0
+
+    template = _log_manage_record(schema, "", "", 0, 0, "", "", "")
+    rows = [
+        {
+            "user_id": template["user_id"],
+            "db_id": template["db_id"],
+            "schema_nm": template["schema_nm"],
+            "start_dt": record["start_dt"],
+            "end_dt": record["end_dt"],
+            "data_id": record.get("data_id") or "",
+            "table_id": record["table_id"],
+            "table_nm": record["table_nm"],
+            "api_params": str(record.get("api_params") or "")[:500],
+            "record_cnt": int(record.get("record_cnt") or 0),
+            "column_cnt": int(record.get("column_cnt") or 0),
+            "status": record["status"],
+            "error_msg": str(record.get("error_msg") or "")[:1000],
+            "cret_nm": template["cret_nm"],
+        }
+        for record in records
+    ]
+
+    if not is_connected("meta"):
+        db_connect("meta")
+
+    meta_engine = get_connection("meta")
+    with meta_engine.begin() as conn:   # ensures transaction handling
+        conn.execute(insert(_log_dataimp_table).values(rows))
+
+    return len(rows)
+
+
+# ----------------------------------------------------------------------
+# Table write notifications (used e.g. to invalidate meta caches)
+# ----------------------------------------------------------------------
+_table_write_listeners: list = []
+
+
+def add_write_listener(listener) -> None:
+    """
+    Register ``listener(table_name, schema)`` to be called after
+    ``db_settable`` or ``deletequery`` has written to a table.
+    """
+    if listener not in _table_write_listeners:
+        _table_write_listeners.append(listener)
+
+
+def _notify_table_write(name: str, schema: str) -> None:
+    """Call every registered write listener; listener errors are logged."""
+    table = name.split(".")[-1].lower()
+    for listener in list(_table_write_listeners):
+        try:
+            listener(table, schema)
+        except Exception as e:
+            logging.warning(f"Write listener failed for {table}: {e}")
+
+
 # ----------------------------------------------------------------------
 # Core functions
 # ----------------------------------------------------------------------
@@ -74,10 +565,12 @@ def db_connect(
     dbms: str = get_env("ecoDI_DBMS") or "postgresql",
 ) -> None:
     """
-    Create (or replace) a database connection for the chosen *schema*.
+    Create (or reuse) a database connection for the chosen *schema*.
 
     The function stores the engine object in ``_env`` under the key
     ``"{SCHEMA}_CON"`` and a Boolean flag under ``"{SCHEMA}_ISCONNCT"``.
+    Engines come from the process‑wide registry, so reconnecting to the
+    same dbms/host/port/schema hands back the existing connection pool.
     """
     # Validate arguments
     dbms = _match_arg(dbms, ["postgresql", "mysql"])
@@ -91,38 +584,16 @@ def db_connect(
     else:  # postgresql
         port = port or 5432
 
-    # Close an existing connection for the same schema, if any
-    if is_connected(schema):
-        db_close(schema)
-
-    # Resolve missing credentials from the *_INFO* environment variable
-    if user is None or password is None:
-        # The INFO variable is base‑64 encoded "user:password"
-        info_key = f"{schema.upper()}_INFO"
-        encoded = get_env(info_key)
-        if encoded is None:
-            raise RuntimeError(f"Missing environment variable: {info_key}")
-
-        decoded_bytes = base64.b64decode(encoded)
-        decoded = decoded_bytes.decode()
-        cred_user, cred_pass = decoded.split(":", 1)
-
-        if user is None:
-            user = cred_user
-        if password is None:
-            password = cred_pass
-
-    # Build the SQLAlchemy engine
-    conn_str = _build_connection_string(
+    # Fetch the pooled engine (built once per dbms/host/port/schema)
+    engine: Engine = _get_engine(
         dbms=dbms,
-        user=user,
-        password=password,
         host=host,
         port=port,
         dbname=dbname,
         schema=schema,
+        user=user,
+        password=password,
     )
-    engine: Engine = sqlalchemy.create_engine(conn_str)
 
     # Store the connection and flag
     set_env(f"{schema.upper()}_CON", engine)
@@ -192,10 +663,14 @@ def is_connected(schema: Union[str, List[str]] = ["meta", "ods", "data"]) -> boo
     return bool(flag)
 
 
-def db_close(schema: Union[str, List[str]] = ["meta", "ods", "data"]) -> bool:
+def db_close(schema: Union[str, List[str]] = ["meta", "ods", "data"],
+             dispose: bool = False) -> bool:
     """
     Disconnect the stored engine for *schema*.
     Returns ``True`` if a connection was closed, ``False`` otherwise.
+
+    By default the engine stays in the registry so its pool can be reused
+    by the next ``db_connect``; pass ``dispose=True`` to drop the pool too.
     """
     schema = _match_arg(schema, ["meta", "ods", "data"])
 
@@ -203,7 +678,12 @@ def db_close(schema: Union[str, List[str]] = ["meta", "ods", "data"]) -> bool:
         return False
 
     engine: Engine = get_env(f"{schema.upper()}_CON")
-    if engine is not None:
+    if engine is not None and dispose:
+        with _engine_lock:
+            for key, registered in list(_engine_registry.items()):
+                if registered is engine:
+                    del _engine_registry[key]
+                    _engine_metrics.pop(key, None)
         engine.dispose()
 
     set_env(f"{schema.upper()}_ISCONNCT", False)
@@ -300,7 +780,9 @@ def getquery(sql: str,
     Returns
     -------
     pandas.DataFrame
-        The query result (empty DataFrame on error).
+        The query result (empty DataFrame on error). ``attrs["status"]``
+        and ``attrs["emsg"]`` hold the outcome of this call, which, unlike
+        the shared STATUS / EMSG, other threads cannot overwrite.
     """
     # ------------------------------------------------------------------
     # Argument handling
@@ -319,8 +801,8 @@ def getquery(sql: str,
     # ------------------------------------------------------------------
     # Initialise status tracking
     # ------------------------------------------------------------------
-    set_env("STATUS", "1")
-    set_env("EMSG", "")
+    status = "1"
+    emsg = ""
 
     sdt = datetime.now().strftime("%Y-%m-%d %H:%M:%S")  # start datetime
 
@@ -330,28 +812,15 @@ def getquery(sql: str,
         # Assuming ``conn`` follows the DBAPI2 interface (e.g., SQLAlchemy engine)
         result = pd.read_sql_query(sql, conn)
     except Exception as e:
-        set_env("STATUS", "0")
-        set_env("EMSG", str(e))
+        status = "0"
+        emsg = str(e)
 
     edt = datetime.now().strftime("%Y-%m-%d %H:%M:%S")  # end datetime
 
-    # ------------------------------------------------------------------
-    # Retrieve status / error message
-    # ------------------------------------------------------------------
-    status = get_env("STATUS")
-    emsg = str(get_env("EMSG"))
-    emsg = emsg.replace("'", r"\'")                # escape single quotes for logging
-
-    # ------------------------------------------------------------------
-    # User / DB identification
-    # ------------------------------------------------------------------
-    uid = get_env("USERNAME") or "unknown_user"
-
-    # Decode the base64‑encoded DB info string
-    encoded_info = get_env(f"{schema.upper()}_INFO")
-    dbinfo_bytes = base64.b64decode(encoded_info) if encoded_info else b""
-    dbinfo = dbinfo_bytes.decode("utf-8", errors="ignore")
-    dbid = dbinfo.split(":")[0] if ":" in dbinfo else ""
+    set_env("STATUS", status)
+    set_env("EMSG", emsg)
+    result.attrs["status"] = status
+    result.attrs["emsg"] = emsg
 
     # ------------------------------------------------------------------
     # Row / column counts (0 if the query failed)
@@ -364,85 +833,90 @@ def getquery(sql: str,
         ccnt = result.shape[1]
 
     # ------------------------------------------------------------------
-    # Prepare the logged SQL (escape single quotes, truncate)
+    # Log the execution in ecodi_meta.mt_log_manage (buffered writer)
     # ------------------------------------------------------------------
-    sql_for_log = sql.replace("'", "''")[:3500]
+    write_log_manage(_log_manage_record(
+        schema=schema,
+        start_dt=sdt,
+        end_dt=edt,
+        record_cnt=rcnt,
+        column_cnt=ccnt,
+        sql_stmt=sql,
+        status=status,
+        error_msg=emsg,
+    ))
 
-    # ------------------------------------------------------------------
-    # Random key generation (mirrors the R logic)
-    # ------------------------------------------------------------------
-    rnd = round(random.random() * 100_000_000)
-    rnd = rnd * 10 if rnd < 100_000_000 else rnd
+    return result
 
-    schema_nm = f"ecodi_{schema}"
 
-    # ------------------------------------------------------------------
-    # Build the INSERT statement for the logging table
-    # ------------------------------------------------------------------
-    if dbms == "mysql":
-        isql = f"""
-        INSERT INTO ecodi_meta.mt_log_manage 
-        SET user_id = '{uid}', db_id = '{dbid}', 
-            schema_nm = '{schema_nm}', start_dt = '{sdt}', 
-            rand_key = {rnd}, end_dt = '{edt}', 
-            record_cnt = {rcnt}, column_cnt = {ccnt}, 
-            sql_stmt = '{sql_for_log}', status = '{status}', 
-            error_msg = '{emsg}', cret_nm = '{uid}';
-        """
-    elif dbms == "postgresql":
-        isql = f"""
-        INSERT INTO ecodi_meta.mt_log_manage 
-        (user_id, db_id, schema_nm, start_dt, rand_key, end_dt, 
-         record_cnt, column_cnt, sql_stmt, status, 
-         error_msg, cret_nm)
-        VALUES ('{uid}', '{dbid}', '{schema_nm}', '{sdt}', {rnd},
-                '{edt}', {rcnt}, {ccnt}, '{sql_for_log}', '{status}', 
-                '{emsg}', '{uid}');
-        """
-    else:
-        raise ValueError(f"Unsupported DBMS: {dbms}")
+def getquery_chunked(sql: str,
+                     schema: str = "meta",
+                     chunksize: int = 10_000,
+                     dbms: str = None):
+    """
+    Execute a SELECT query and yield the result in DataFrame chunks.
 
-    # ------------------------------------------------------------------
-    # Log the execution in the *meta* schema
-    # ------------------------------------------------------------------
-    db_close(schema)                      # close the original schema connection
-    meta_schema = "meta"
-    db_connect(meta_schema)               # open a connection to the meta schema
-
-    meta_conn = get_connection(meta_schema)
-
-    # 메타데이터 객체 선언
-    metadata_obj = MetaData()
-
-    # 테이블 객체 선언
-    log_manage_table = Table(
-        "mt_log_manage",
-        metadata_obj,
-        Column("user_id", String(20), primary_key=True),
-        Column("db_id", String(20), primary_key=True),
-        Column("schema_nm", String(20), primary_key=True),
-        Column("start_dt", DateTime, primary_key=True),
-        Column("rand_key", Integer, primary_key=True),
-        Column("end_dt", DateTime),
-        Column("record_cnt", Integer),
-        Column("column_cnt", Integer),
-        Column("sql_stmt", String(4000)),
-        Column("status", String(20)),
-        Column("error_msg", String(1000)),
-        Column("cret_nm", String(20))
-    )
+    The query runs on a server‑side cursor (``stream_results``), so only
+    *chunksize* rows are held in memory at a time. A single
+    ``mt_log_manage`` row is written once the iteration ends (or is
+    abandoned) carrying the total number of records actually fetched.
+
+    Parameters
+    ----------
+    sql : str
+        The SQL statement to run.
+    schema : str, optional
+        One of "meta", "ods", "data". Default is "meta".
+    chunksize : int, default 10000
+        Number of rows per yielded DataFrame.
+    dbms : str, optional
+        Database engine name (e.g., "mysql" or "postgresql").
+        If omitted, it is read from the environment variable
+        ``ecoDI_DBMS``.
+    Yields
+    ------
+    pandas.DataFrame
+        Consecutive chunks of the query result.
+    """
+    schema = _match_arg(schema, ["meta", "ods", "data"])
+
+    if dbms is None:
+        dbms = get_env("ecoDI_DBMS")
 
-    # INSERT문 생성
-    stmt = insert(log_manage_table).values(user_id=uid, db_id=dbid, 
-                  schema_nm=schema_nm, start_dt=sdt, rand_key=rnd, end_dt=edt, 
-                  record_cnt=rcnt, column_cnt=ccnt, sql_stmt=sql_for_log,
-                  status=status, error_msg=emsg, cret_nm=uid)
+    if not is_connected(schema):
+        db_connect(schema)
 
-    with meta_conn.connect() as conn:
-        conn.execute(stmt)
-        conn.commit()
-        
-    return result
+    set_env("STATUS", "1")
+    set_env("EMSG", "")
+
+    sdt = datetime.now().strftime("%Y-%m-%d %H:%M:%S")  # start datetime
+
+    rcnt = 0
+    ccnt = 0
+    try:
+        engine = get_connection(schema)
+        with engine.connect().execution_options(stream_results=True) as conn:
+            for chunk in pd.read_sql_query(sql, conn, chunksize=chunksize):
+                rcnt += chunk.shape[0]
+                ccnt = chunk.shape[1]
+                yield chunk
+    except Exception as e:
+        set_env("STATUS", "0")
+        set_env("EMSG", str(e))
+    finally:
+        edt = datetime.now().strftime("%Y-%m-%d %H:%M:%S")  # end datetime
+
+        status = get_env("STATUS")
+        write_log_manage(_log_manage_record(
+            schema=schema,
+            start_dt=sdt,
+            end_dt=edt,
+            record_cnt=0 if status == "0" else rcnt,
+            column_cnt=0 if status == "0" else ccnt,
+            sql_stmt=sql,
+            status=status,
+            error_msg=str(get_env("EMSG")),
+        ))
 
 
 def deletequery(table_nm: str,
@@ -491,6 +965,8 @@ def deletequery(table_nm: str,
         set_env("EMSG", str(e))
         rows_affected = 0
 
+    _notify_table_write(table_nm, schema)
+
     return rows_affected
 
 
@@ -520,6 +996,289 @@ def is_tabled(name: str,
     return name in tables
 
 
+# ----------------------------------------------------------------------
+# Bulk‑load insertion methods for DataFrame.to_sql
+# ----------------------------------------------------------------------
+_BULK_NULL = "\\N"   # NULL marker for COPY (distinct from an empty string)
+
+
+def _bulk_table_name(pd_table, conn) -> str:
+    """Quoted (schema‑qualified) name of the table pandas is writing to."""
+    preparer = conn.dialect.identifier_preparer
+    if pd_table.schema:
+        return f"{preparer.quote(pd_table.schema)}.{preparer.quote(pd_table.name)}"
+    return preparer.quote(pd_table.name)
+
+
+def _copy_field(value) -> str:
+    """Render one value for ``COPY ... CSV`` (NULL unquoted, values quoted)."""
+    if value is None:
+        return _BULK_NULL
+    return '"' + str(value).replace('"', '""') + '"'
+
+
+def _copy_postgresql(pd_table, conn, keys, data_iter):
+    """
+    ``to_sql`` insertion method that streams each chunk to PostgreSQL
+    with ``COPY ... FROM STDIN`` in CSV format.
+    """
+    # Every value is quoted so that only the unquoted marker reads as NULL
+    # (a quoted "\N" stays the string \N)
+    buf = io.StringIO()
+    for row in data_iter:
+        buf.write(",".join(_copy_field(v) for v in row) + "\n")
+    buf.seek(0)
+
+    preparer = conn.dialect.identifier_preparer
+    columns = ", ".join(preparer.quote(k) for k in keys)
+    copy_sql = (
+        f"COPY {_bulk_table_name(pd_table, conn)} ({columns}) "
+        f"FROM STDIN WITH (FORMAT csv, NULL '{_BULK_NULL}')"
+    )
+
+    dbapi_conn = conn.connection
+    with dbapi_conn.cursor() as cur:
+        cur.copy_expert(copy_sql, buf)
+
+
+def _mysql_field(value) -> str:
+    """Render one value for ``LOAD DATA`` (NULL unquoted, text enclosed)."""
+    if value is None:
+        return "NULL"
+    if isinstance(value, bool):
+        value = int(value)
+    return '"' + str(value).replace('"', '""') + '"'
+
+
+# MySQL errors raised when LOAD DATA LOCAL is disabled on the server
+# (1148, 3948; ``local_infile=OFF`` is the MySQL 8 default) or refused by
+# the client (2068)
+_LOCAL_INFILE_ERRORS = (1148, 2068, 3948)
+_local_infile_disabled = False
+
+
+def _is_local_infile_error(error: Exception) -> bool:
+    """True if *error* means LOAD DATA LOCAL INFILE is not allowed."""
+    args = getattr(getattr(error, "orig", error), "args", ())
+    return bool(args) and args[0] in _LOCAL_INFILE_ERRORS
+
+
+def _insert_rows(pd_table, conn, keys, rows) -> int:
+    """Insert *rows* with an executemany INSERT on the SQLAlchemy table."""
+    if not rows:
+        return 0
+    result = conn.execute(pd_table.table.insert(), [dict(zip(keys, row)) for row in rows])
+    return result.rowcount
+
+
+def _load_data_mysql(pd_table, conn, keys, data_iter):
+    """
+    ``to_sql`` insertion method that writes each chunk to a temporary file
+    and loads it with ``LOAD DATA LOCAL INFILE``.
+
+    When the server (or client) does not allow local infile the chunk,
+    and every later one, is sent as multi‑row INSERT instead.
+    """
+    global _local_infile_disabled
+
+    rows = list(data_iter)
+    if _local_infile_disabled:
+        return _insert_rows(pd_table, conn, keys, rows)
+
+    with tempfile.NamedTemporaryFile(
+        "w", suffix=".csv", encoding="utf-8", newline="", delete=False
+    ) as f:
+        for row in rows:
+            f.write(",".join(_mysql_field(v) for v in row) + "\n")
+        path = f.name
+
+    preparer = conn.dialect.identifier_preparer
+    columns = ", ".join(preparer.quote(k) for k in keys)
+    load_sql = (
+        f"LOAD DATA LOCAL INFILE '{path.replace(os.sep, '/')}' "
+        f"INTO TABLE {_bulk_table_name(pd_table, conn)} "
+        "CHARACTER SET utf8mb4 "
+        "FIELDS TERMINATED BY ',' OPTIONALLY ENCLOSED BY '\"' ESCAPED BY '' "
+        "LINES TERMINATED BY '\\n' "
+        f"({columns})"
+    )
+
+    try:
+        conn.exec_driver_sql(load_sql)
+    except SQLAlchemyError as e:
+        if not _is_local_infile_error(e):
+            raise
+        logging.warning(f"LOAD DATA LOCAL INFILE is disabled, using INSERT: {e}")
+        _local_infile_disabled = True
+        return _insert_rows(pd_table, conn, keys, rows)
+    finally:
+        os.remove(path)
+
+
+def _resolve_bulk_method(bulk_method: Optional[str], dbms: Optional[str]):
+    """
+    Map *bulk_method* to a ``to_sql`` ``method`` argument.
+
+    "auto" picks COPY for PostgreSQL and LOAD DATA for MySQL (falling
+    back to multi‑row INSERT when local infile is disabled), "copy" and
+    "load" force one of them, "multi" keeps pandas' multi‑row INSERT and
+    ``None`` uses pandas' default row‑by‑row INSERT.
+    """
+    if bulk_method == "auto":
+        bulk_method = {"postgresql": "copy", "mysql": "load"}.get(dbms, "multi")
+
+    methods = {
+        "copy": _copy_postgresql,
+        "load": _load_data_mysql,
+        "multi": "multi",
+        None: None,
+    }
+    if bulk_method not in methods:
+        raise ValueError(
+            f"bulk_method must be one of {['auto'] + list(methods)}"
+        )
+    return methods[bulk_method]
+
+
+# ----------------------------------------------------------------------
+# Upsert (merge) helpers
+# ----------------------------------------------------------------------
+_AUDIT_COLUMNS = ("cret_dt", "cret_nm", "mdfy_dt", "mdfy_nm")
+
+
+def _result_pk_cols(api_url_id: Optional[str]) -> List[str]:
+    """Primary‑key columns (``is_pk = 'Y'``) of *api_url_id* in mt_api_result."""
+    if api_url_id is None:
+        raise ValueError(
+            "Either 'pk_cols' or 'api_url_id' must be provided for mode='upsert'."
+        )
+
+    from .API import from_meta_result  # API imports this module
+
+    result_info = from_meta_result(api_url_id=api_url_id)
+    pk_cols = (
+        result_info[result_info["is_pk"] == "Y"]["result_id"]
+        .str.lower()
+        .tolist()
+    )
+    if not pk_cols:
+        raise ValueError(f"No primary key columns defined for {api_url_id}.")
+
+    return pk_cols
+
+
+def _upsert_frame(name: str,
+                  value: pd.DataFrame,
+                  schema: str,
+                  pk_cols: List[str],
+                  dbms: str,
+                  is_postfix: bool,
+                  bulk_method: Optional[str],
+                  chunksize: Optional[int]) -> int:
+    """
+    Merge *value* into *name* through a staging table.
+
+    The frame is bulk‑loaded into ``{name}_stg_NNNNN``, created with the
+    column types of *name*, and merged with ``INSERT ... ON CONFLICT DO
+    UPDATE`` (PostgreSQL) or ``INSERT ... ON DUPLICATE KEY UPDATE``
+    (MySQL). A missing target is created first with a primary key on
+    *pk_cols*; rows with the same key keep the last one. Creation audit
+    columns are kept on updated rows and ``mdfy_dt``/``mdfy_nm`` are
+    filled. Returns the row count reported by the driver.
+    """
+    engine = get_connection(schema)
+    method = _resolve_bulk_method(bulk_method, dbms)
+
+    lower_cols = {c.lower(): c for c in value.columns}
+    missing = [c for c in pk_cols if c.lower() not in lower_cols]
+    if missing:
+        raise ValueError(f"Primary key column(s) {missing} not found in the data.")
+    pk_cols = [lower_cols[c.lower()] for c in pk_cols]
+
+    # ON CONFLICT cannot update the same row twice
+    value = value.drop_duplicates(subset=pk_cols, keep="last")
+
+    # First load: create the table with its primary key, then merge into it
+    if not is_tabled(name, schema):
+        dtype = {c: String(200) for c in pk_cols}
+        dtype.update({
+            c: DateTime() for c in value.columns if c.lower() in ("cret_dt", "mdfy_dt")
+        })
+        ddl = pd.io.sql.get_schema(value, name, keys=pk_cols, con=engine, dtype=dtype)
+        with engine.begin() as conn:
+            conn.execute(text(ddl))
+
+    quote = engine.dialect.identifier_preparer.quote
+    columns = list(value.columns)
+    update_cols = [
+        c for c in columns
+        if c not in pk_cols and c.lower() not in _AUDIT_COLUMNS
+    ]
+
+    stage = f"{name[:50]}_stg_{random.randint(0, 99_999):05d}"
+    target_sql = quote(name)
+    stage_sql = quote(stage)
+    cols_sql = ", ".join(quote(c) for c in columns)
+
+    if dbms == "postgresql":
+        assignments = [f"{quote(c)} = EXCLUDED.{quote(c)}" for c in update_cols]
+        if is_postfix:
+            assignments += ["mdfy_dt = CURRENT_TIMESTAMP", "mdfy_nm = 'ecoDI'"]
+        conflict = ", ".join(quote(c) for c in pk_cols)
+        action = (
+            f"DO UPDATE SET {', '.join(assignments)}" if assignments
+            else "DO NOTHING"
+        )
+        merge_sql = (
+            f"INSERT INTO {target_sql} ({cols_sql}) "
+            f"SELECT {cols_sql} FROM {stage_sql} "
+            f"ON CONFLICT ({conflict}) {action}"
+        )
+    elif dbms == "mysql":
+        assignments = [f"{quote(c)} = s.{quote(c)}" for c in update_cols]
+        if is_postfix:
+            assignments += ["mdfy_dt = NOW()", "mdfy_nm = 'ecoDI'"]
+        stage_cols = ", ".join(f"s.{quote(c)}" for c in columns)
+        if assignments:
+            merge_sql = (
+                f"INSERT INTO {target_sql} ({cols_sql}) "
+                f"SELECT {stage_cols} FROM {stage_sql} AS s "
+                f"ON DUPLICATE KEY UPDATE {', '.join(assignments)}"
+            )
+        else:
+            merge_sql = (
+                f"INSERT IGNORE INTO {target_sql} ({cols_sql}) "
+                f"SELECT {stage_cols} FROM {stage_sql} AS s"
+            )
+    else:
+        raise ValueError(f"Unsupported DBMS: {dbms}")
+
+    # The stage copies the target's column types, so the merge SELECT does
+    # not depend on the dtypes pandas inferred (e.g. an all‑NA mdfy_dt)
+    if dbms == "postgresql":
+        create_stage = (
+            f"CREATE TEMPORARY TABLE {stage_sql} "
+            f"(LIKE {target_sql} INCLUDING DEFAULTS) ON COMMIT DROP"
+        )
+    else:
+        create_stage = f"CREATE TABLE {stage_sql} LIKE {target_sql}"
+
+    with engine.begin() as conn:
+        conn.execute(text(create_stage))
+        try:
+            value.to_sql(name=stage, con=conn, if_exists="append", index=False,
+                         chunksize=chunksize, method=method)
+            rowcount = conn.execute(text(merge_sql)).rowcount
+        except Exception:
+            # MySQL DDL is not transactional; PostgreSQL rolls the stage back
+            if dbms == "mysql":
+                conn.execute(text(f"DROP TABLE IF EXISTS {stage_sql}"))
+            raise
+        conn.execute(text(f"DROP TABLE IF EXISTS {stage_sql}"))
+
+    return rowcount
+
+
 # ----------------------------------------------------------------------
 # Main function translated from R
 # ----------------------------------------------------------------------
@@ -531,11 +1290,31 @@ def db_settable(
     append: bool = False,
     schema: str = "meta",
     is_postfix: bool = True,
-    dbms: str = get_env("ecoDI_DBMS")
+    dbms: str = get_env("ecoDI_DBMS"),
+    bulk_method: Optional[str] = "auto",
+    chunksize: Optional[int] = 100_000,
+    mode: Optional[str] = None,
+    pk_cols: Optional[List[str]] = None,
+    api_url_id: Optional[str] = None,
+    raise_error: bool = False,
 ) -> pd.DataFrame | None:
     """
     Write a pandas DataFrame to a database table, log the operation and
     return the result of the write (or None on failure).
+
+    Rows are sent with the native bulk loader of *dbms* by default
+    (``COPY FROM STDIN`` on PostgreSQL, ``LOAD DATA LOCAL INFILE`` on
+    MySQL), *chunksize* rows at a time. Pass ``bulk_method="multi"`` to
+    fall back to multi‑row INSERT statements.
+
+    *mode* is one of "fail", "replace", "append" or "upsert"; when omitted
+    it is derived from *append* / *overwrite*. "upsert" merges the rows on
+    *pk_cols*, or on the ``is_pk = 'Y'`` columns of *api_url_id* in
+    ``mt_api_result``, and returns the affected row count.
+
+    A failed write sets STATUS "0" / EMSG; with *raise_error* the error
+    is raised (after logging) instead, which is the reliable check when
+    other threads use ``getquery`` or ``db_settable`` at the same time.
     """
     # ------------------------------------------------------------------
     # Validate schema argument (matches R's match.arg)
@@ -544,6 +1323,13 @@ def db_settable(
     if schema not in allowed_schemas:
         raise ValueError(f"schema must be one of {allowed_schemas}")
 
+    if mode is None:
+        mode = "append" if append else "replace" if overwrite else "fail"
+    mode = _match_arg(mode, ["fail", "replace", "append", "upsert"])
+
+    if mode == "upsert" and pk_cols is None:
+        pk_cols = _result_pk_cols(api_url_id)
+
     # ------------------------------------------------------------------
     # Ensure DB connection is live
     # ------------------------------------------------------------------
@@ -553,8 +1339,9 @@ def db_settable(
     # ------------------------------------------------------------------
     # Initialise status flags in the environment
     # ------------------------------------------------------------------
-    set_env("STATUS", "1")
-    set_env("EMSG", "")
+    status = "1"
+    emsg = ""
+    error: Optional[Exception] = None
 
     # Record start timestamp (format: YYYY-MM-DD HH:MM:SS)
     start_dt = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
@@ -586,101 +1373,320 @@ def db_settable(
     # ------------------------------------------------------------------
     try:
         engine = get_env(f"{schema.upper()}_CON")
-        if_append = "append" if append else "replace" if overwrite else "fail"
-        # pandas uses `if_exists` values: 'fail', 'replace', 'append'
-        value.to_sql(
-            name=name,
-            con=engine,
-            if_exists=if_append,
-            index=row_names,
-            method="multi"   # improve performance for bulk inserts
-        )
-        result = None  # pandas `to_sql` does not return a useful value
+        if mode == "upsert":
+            result = _upsert_frame(
+                name=name,
+                value=value,
+                schema=schema,
+                pk_cols=pk_cols,
+                dbms=dbms,
+                is_postfix=is_postfix,
+                bulk_method=bulk_method,
+                chunksize=chunksize,
+            )
+        else:
+            # pandas uses `if_exists` values: 'fail', 'replace', 'append'
+            value.to_sql(
+                name=name,
+                con=engine,
+                if_exists=mode,
+                index=row_names,
+                chunksize=chunksize,
+                method=_resolve_bulk_method(bulk_method, dbms),
+            )
+            result = None  # pandas `to_sql` does not return a useful value
     except Exception as e:
         # Capture error information in the environment
-        set_env("STATUS", "0")
-        set_env("EMSG", str(e))
+        status = "0"
+        emsg = str(e)
+        error = e
         result = None
 
+    set_env("STATUS", status)
+    set_env("EMSG", emsg)
+
+    _notify_table_write(name, schema)
+
     # ------------------------------------------------------------------
     # Record end timestamp
     # ------------------------------------------------------------------
     end_dt = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
 
     # ------------------------------------------------------------------
-    # Build logging information
+    # Log the operation in ecodi_meta.mt_log_manage (buffered writer)
     # ------------------------------------------------------------------
-    status = get_env("STATUS")
-    emsg = str(get_env("EMSG")).replace("'", r"\'")
+    rcnt = 0 if status == "0" else len(value)
+    ccnt = 0 if status == "0" else value.shape[1]
 
-    uid = get_env("USERNAME") or "unknown_user"
+    sql_stmt = {
+        "upsert": f"upsert into {name}",
+        "append": f"insert into {name}",
+    }.get(mode, f"create table {name}")
 
-    # Decode DB info (expects base64 string like "dbid:otherinfo")
-    encoded_info = get_env(f"{schema.upper()}_INFO")
-    dbinfo = ""
-    if encoded_info:
-        decoded_bytes = base64.b64decode(encoded_info)
-        dbinfo = decoded_bytes.decode()
-    dbid = dbinfo.split(":")[0] if dbinfo else "unknown_db"
+    write_log_manage(_log_manage_record(
+        schema=schema,
+        start_dt=start_dt,
+        end_dt=end_dt,
+        record_cnt=rcnt,
+        column_cnt=ccnt,
+        sql_stmt=sql_stmt,
+        status=status,
+        error_msg=emsg,
+    ))
+
+    if error is not None and raise_error:
+        raise error
 
-    rcnt = 0 if status == "0" else len(value)
-    ccnt = 0 if status == "0" else value.shape[1]
+    return result
 
-    sql_stmt = f"insert into {name}" if append else f"create table {name}"
 
-    # Generate a random key (mimics R's runif logic)
-    rnd = int(random.random() * 100_000_000)
-    rnd = rnd * 10 if rnd < 100_000_000 else rnd
+# ----------------------------------------------------------------------
+# Row‑hash change detection (write only what changed)
+# ----------------------------------------------------------------------
+def _canonical_strings(col: pd.Series) -> pd.Series:
+    """
+    *col* as strings, with numbers in one canonical form: whole floats are
+    written as integers, so 1, 1.0 and "1" (an int column that came back
+    as float because of a null) all give "1".
+    """
+    if pd.api.types.is_bool_dtype(col) or not (
+        pd.api.types.is_numeric_dtype(col) or col.dtype == object
+    ):
+        return col.astype("string")
+
+    if col.dtype == object:
+        def canonical(v):
+            if isinstance(v, (float, np.floating)) and np.isfinite(v) and float(v).is_integer():
+                return str(int(v))
+            return v if v is None or isinstance(v, str) else str(v)
+        return col.map(canonical).astype("string")
+
+    out = col.astype("string")
+    if pd.api.types.is_float_dtype(col):
+        floats = col.to_numpy(dtype=np.float64, na_value=np.nan)
+        with np.errstate(invalid="ignore"):
+            whole = np.isfinite(floats) & (np.floor(floats) == floats) & (np.abs(floats) < 2.0 ** 63)
+        out[whole] = floats[whole].astype(np.int64).astype(str)
+    return out
+
+
+def _row_hashes(value: pd.DataFrame) -> pd.Series:
+    """
+    64‑bit hash of every row over its non‑audit columns.
 
-    schema_nm = f"ecodi_{schema}"
+    Values are normalised to canonical strings first (see
+    ``_canonical_strings``) so that the hash does not depend on the dtype
+    pandas inferred for a fetch.
+    """
+    cols = sorted(c for c in value.columns if c.lower() not in _AUDIT_COLUMNS)
+    normalised = pd.DataFrame(
+        {c: _canonical_strings(value[c]) for c in cols}, index=value.index
+    ).fillna("\x00")
+    hashes = pd.util.hash_pandas_object(normalised, index=False)
+    return pd.Series(hashes.to_numpy().view(np.int64), index=value.index)
+
+
+def _hash_table(name: str, pk_cols: List[str]) -> Table:
+    """SQLAlchemy table ``{name}_hash``: the key columns and ``row_hash``."""
+    return Table(
+        f"{name}_hash",
+        MetaData(),
+        *[Column(c, String(200), primary_key=True) for c in pk_cols],
+        Column("row_hash", sqlalchemy.BigInteger, nullable=False),
+    )
 
-    # ------------------------------------------------------------------
-    # Compose the INSERT statement for the logging table (ecodi_meta.mt_log_manage)
-    # ------------------------------------------------------------------
-    if dbms == "mysql":
-        isql = f"""
-        INSERT INTO ecodi_meta.mt_log_manage 
-        SET user_id = '{uid}', db_id = '{dbid}', 
-            schema_nm = '{schema_nm}', start_dt = '{start_dt}', 
-            rand_key = {rnd}, end_dt = '{end_dt}', 
-            record_cnt = {rcnt},
-            column_cnt = {ccnt}, sql_stmt = '{sql_stmt}', 
-            status = '{status}', 
-            error_msg = '{emsg}', cret_nm = '{uid}';
-        """
-    elif dbms == "postgresql":
-        isql = f"""
-        INSERT INTO ecodi_meta.mt_log_manage 
-        (user_id, db_id, schema_nm, start_dt, rand_key, end_dt, 
-         record_cnt, column_cnt, sql_stmt, status, 
-         error_msg, cret_nm)
-        VALUES ('{uid}', '{dbid}', '{schema_nm}', '{start_dt}', {rnd},
-                '{end_dt}', {rcnt}, {ccnt}, '{sql_stmt}', '{status}', 
-                '{emsg}', '{uid}');
-        """
+
+def diff_rows(name: str,
+              value: pd.DataFrame,
+              schema: str = "ods",
+              pk_cols: Optional[List[str]] = None,
+              api_url_id: Optional[str] = None,
+              detect_deletes: bool = False,
+              dbms: str = get_env("ecoDI_DBMS")) -> dict:
+    """
+    Compare *value* with the row hashes stored for table *name*.
+
+    Parameters
+    ----------
+    name : str
+        Target table; its hashes are kept in ``{name}_hash``.
+    value : pd.DataFrame
+        Freshly fetched rows.
+    schema : str, default "ods"
+        One of "meta", "ods", "data".
+    pk_cols : list of str, optional
+        Key columns; defaults to the ``is_pk = 'Y'`` columns of
+        *api_url_id* in ``mt_api_result``.
+    api_url_id : str, optional
+        API whose result definition provides the key columns.
+    detect_deletes : bool, default False
+        Report stored keys missing from *value* as deleted. Only use it
+        when *value* is a full pull, not a partial (incremental) one.
+
+    Returns
+    -------
+    dict
+        ``insert`` / ``update``: the rows of *value* that are new / changed,
+        ``delete``: the key columns of removed rows, ``hashes``: key
+        columns and ``row_hash`` of the inserted and updated rows,
+        ``unchanged``: the number of rows that did not change.
+    """
+    schema = _match_arg(schema, ["meta", "ods", "data"])
+
+    if pk_cols is None:
+        pk_cols = _result_pk_cols(api_url_id)
+
+    if dbms == "postgresql":
+        name = name.lower()
+        value = value.rename(columns=str.lower)
+        pk_cols = [c.lower() for c in pk_cols]
+
+    missing = [c for c in pk_cols if c not in value.columns]
+    if missing:
+        raise ValueError(f"Primary key column(s) {missing} not found in the data.")
+
+    if value.duplicated(subset=pk_cols).any():
+        raise ValueError(f"Duplicated keys {pk_cols} in the data.")
+
+    # Hashes of the fetched rows, keys as strings
+    # Nullable Int64: keys missing on one side must not turn the 64‑bit
+    # hashes into (rounded) floats
+    fetched = value[pk_cols].astype("string")
+    fetched["row_hash"] = _row_hashes(value).astype("Int64")
+    fetched["_pos"] = np.arange(len(value))
+
+    # Hashes stored with the table
+    hash_name = f"{name}_hash"
+    if is_tabled(hash_name, schema):
+        cols_sql = ", ".join(pk_cols + ["row_hash"])
+        stored = getquery(f"SELECT {cols_sql} FROM {hash_name}", schema)
     else:
-        raise ValueError(f"Unsupported DBMS '{dbms}'")
+        stored = pd.DataFrame(columns=pk_cols + ["row_hash"])
+    stored = stored.astype({**{c: "string" for c in pk_cols}, "row_hash": "Int64"})
+
+    merged = fetched.merge(
+        stored, how="outer", on=pk_cols, suffixes=("", "_stored"), indicator=True
+    )
+
+    is_insert = (merged["_merge"] == "left_only").to_numpy()
+    is_update = ((merged["_merge"] == "both")
+                 & (merged["row_hash"] != merged["row_hash_stored"])).fillna(False).to_numpy(dtype=bool)
+    is_delete = (merged["_merge"] == "right_only").to_numpy()
+
+    in_value = (merged["_merge"] != "right_only").to_numpy()
+    position = merged["_pos"].fillna(-1).astype(np.int64).to_numpy()
+
+    changed = is_insert | is_update
+    changed_pos = np.sort(position[changed])
+    hashes = fetched.iloc[changed_pos][pk_cols + ["row_hash"]].reset_index(drop=True)
+    hashes["row_hash"] = hashes["row_hash"].astype(np.int64)
+
+    return {
+        "insert": value.iloc[np.sort(position[is_insert])],
+        "update": value.iloc[np.sort(position[is_update])],
+        "delete": (merged.loc[is_delete, pk_cols].reset_index(drop=True)
+                   if detect_deletes else merged.loc[[], pk_cols]),
+        "hashes": hashes,
+        "unchanged": int(in_value.sum() - changed.sum()),
+    }
+
+
+def _delete_keys(name: str, keys: pd.DataFrame, schema: str) -> int:
+    """Delete the rows of *name* whose key columns match a row of *keys*."""
+    if keys.empty:
+        return 0
+
+    engine = get_connection(schema)
+    quote = engine.dialect.identifier_preparer.quote
+    cols = list(keys.columns)
+    where = " AND ".join(f"{quote(c)} = :k{i}" for i, c in enumerate(cols))
+    params = [
+        {f"k{i}": v for i, v in enumerate(row)}
+        for row in keys.astype(object).itertuples(index=False, name=None)
+    ]
+
+    with engine.begin() as conn:
+        result = conn.execute(text(f"DELETE FROM {quote(name)} WHERE {where}"), params)
+
+    return result.rowcount
+
+
+def db_settable_diff(name: str,
+                     value: pd.DataFrame,
+                     schema: str = "ods",
+                     pk_cols: Optional[List[str]] = None,
+                     api_url_id: Optional[str] = None,
+                     detect_deletes: bool = False,
+                     dbms: str = get_env("ecoDI_DBMS"),
+                     bulk_method: Optional[str] = "auto",
+                     chunksize: Optional[int] = 100_000) -> dict:
+    """
+    Write only the rows of *value* that changed since the last write.
+
+    The rows are compared with ``{name}_hash`` (see ``diff_rows``); new and
+    changed rows are upserted into *name*, deleted rows removed (with
+    ``detect_deletes``) and the hashes updated. The first write of a
+    table loads every row.
+
+    Returns
+    -------
+    dict
+        Counts of ``inserted``, ``updated``, ``deleted`` and ``unchanged``
+        rows.
+    """
+    if pk_cols is None:
+        pk_cols = _result_pk_cols(api_url_id)
+
+    if not is_connected(schema):
+        db_connect(schema)
+
+    diff = diff_rows(name, value, schema=schema, pk_cols=pk_cols,
+                     detect_deletes=detect_deletes, dbms=dbms)
+
+    if dbms == "postgresql":
+        name = name.lower()
+        pk_cols = [c.lower() for c in pk_cols]
+
+    changed = pd.concat([diff["insert"], diff["update"]])
 
     # ------------------------------------------------------------------
-    # Log the operation
+    # Target table: upsert the changed rows, remove the deleted ones
     # ------------------------------------------------------------------
-    db_close(schema)               # close the original schema connection
-
-    # Re‑connect to the META schema to write the log entry
-    meta_schema = "meta"
-    if not is_connected(meta_schema):
-        db_connect(meta_schema)
+    if not changed.empty:
+        db_settable(name=name, value=changed, schema=schema, mode="upsert",
+                    pk_cols=pk_cols, dbms=dbms, bulk_method=bulk_method,
+                    chunksize=chunksize)
+        if get_env("STATUS") == "0":
+            raise ValueError(f"Writing {name} failed: {get_env('EMSG')}")
 
-    meta_engine = get_env(f"{meta_schema.upper()}_CON")
-    with meta_engine.begin() as conn:   # ensures transaction handling
-        conn.execute(text(isql))
+    deleted = _delete_keys(name, diff["delete"], schema)
 
-    if dbms == "mysql":
-        # MySQL autocommit handling – the `begin()` context already commits,
-        # but we keep the explicit call for parity with the original R code.
-        conn.commit()
+    # ------------------------------------------------------------------
+    # Hash table: created with its primary key on first use
+    # ------------------------------------------------------------------
+    hash_table = _hash_table(name, pk_cols)
+    hash_table.create(get_connection(schema), checkfirst=True)
+
+    if not diff["hashes"].empty:
+        _upsert_frame(
+            name=hash_table.name,
+            value=diff["hashes"],
+            schema=schema,
+            pk_cols=pk_cols,
+            dbms=dbms,
+            is_postfix=False,
+            bulk_method=bulk_method,
+            chunksize=chunksize,
+        )
+    _delete_keys(hash_table.name, diff["delete"], schema)
+    _notify_table_write(hash_table.name, schema)
 
-    return result
+    return {
+        "inserted": len(diff["insert"]),
+        "updated": len(diff["update"]),
+        "deleted": deleted,
+        "unchanged": diff["unchanged"],
+    }
 
 
 def ddl_from_text(con, txt: str = None, verbose: bool = False):
@@ -722,7 +1728,8 @@ def db_load_csv(name: str,
                 append: bool = False,
                 schema: str = "meta",
                 is_postfix: bool = True,
-                dbms: str = None):
+                dbms: str = None,
+                bulk_method: Optional[str] = "auto"):
     """
     Load a CSV file into a database table.
 
@@ -744,6 +1751,9 @@ def db_load_csv(name: str,
         Whether to add audit columns (creation / modification info).
     dbms : str, optional
         Database management system identifier (e.g., 'mysql').
+    bulk_method : str, optional
+        Insertion method passed to ``db_settable`` ("auto", "copy",
+        "load", "multi" or None).
     """
     schema = schema.lower()
     if schema not in ("meta", "ods", "data"):
@@ -793,14 +1803,15 @@ def db_load_csv(name: str,
     
     try:
         db_settable(
-            name = table_name,
+            name = name,
             value = df,
             row_names = row_names,
             overwrite = overwrite,
             append = append,
             schema = schema,
             is_postfix = is_postfix, 
-            dbms = dbms)
+            dbms = dbms,
+            bulk_method = bulk_method)
     except Exception as e:   
         set_env("STATUS", "0")
         set_env("EMSG", str(e))
@@ -812,48 +1823,27 @@ def db_load_csv(name: str,
     # Build log entry (mirrors the R implementation)
     # ------------------------------------------------------------------
     status = get_env("STATUS")
-    emsg = get_env("EMSG")
-    emsg = emsg.replace("'", r"\'")   # escape single quotes for SQL
-
-    uid = get_env("USERNAME")
-    dbinfo_b64 = get_env(f"{schema.upper()}_INFO")
-    dbinfo = base64.b64decode(dbinfo_b64).decode() if dbinfo_b64 else ""
-    dbid = dbinfo.split(":")[0] if ":" in dbinfo else ""
+    emsg = str(get_env("EMSG"))
 
     rcnt = 0 if status == "0" else len(df)
     ccnt = 0 if status == "0" else len(df.columns)
 
     sql_placeholder = f"Insert table {name}" if append else f"Create table {name}"
-    rnd = np.random.randint(0, 100_000_000)
-    rnd = rnd * 10 if rnd < 100_000_000 else rnd
-
-    schema_nm = f"ecodi_{schema}"
-
-    log_sql = f"""
-        INSERT INTO ecodi_meta.mt_log_manage
-        (user_id, db_id, schema_nm, start_dt, rand_key, end_dt,
-         record_cnt, column_cnt, sql_stmt, status, error_msg, cret_nm)
-        VALUES ('{uid}', '{dbid}', '{schema_nm}', '{start_dt}', {rnd},
-                '{end_dt}', {rcnt}, {ccnt}, '{sql_placeholder}',
-                '{status}', '{emsg}', '{uid}');
-    """
 
     # ------------------------------------------------------------------
     # Commit the log
     # ------------------------------------------------------------------
-    db_close(schema)
-
-    # ensure we are connected to the meta schema for logging
-    db_connect("meta")
-    meta_conn = get_env("META_CON")
-    if meta_conn is None:
-        raise RuntimeError("Meta connection not found in environment.")
-        
     try:
-        with meta_conn.begin() as conn:   # ensures transaction handling
-            conn.execute(text(log_sql))
-        if dbms == "mysql":
-            meta_conn.commit()
+        write_log_manage(_log_manage_record(
+            schema=schema,
+            start_dt=start_dt,
+            end_dt=end_dt,
+            record_cnt=rcnt,
+            column_cnt=ccnt,
+            sql_stmt=sql_placeholder,
+            status=status,
+            error_msg=emsg,
+        ))
     except SQLAlchemyError as e:
         # Even if logging fails, we don't want to raise – original code ignores it.
         pass
@@ -872,9 +1862,20 @@ __all__ = [
     "data_connect",
     "is_connected",
     "db_close",
+    "set_pool_options",
+    "dispose_engines",
+    "pool_status",
+    "set_log_options",
+    "write_log_manage",
+    "flush_log",
+    "write_log_dataimp",
+    "add_write_listener",
     "query_from_file",
     "get_connection",
     "getquery",
+    "getquery_chunked",
+    "diff_rows",
+    "db_settable_diff",
     "deletequery",
     "is_tabled",
     "db_settable",
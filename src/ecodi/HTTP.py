@@ -0,0 +1,179 @@
+# -*- coding: utf-8 -*-
+"""
+Shared HTTP client for the open API calls made from API.py and KOSIS.py.
+
+A single pooled ``requests.Session`` is reused for every request so that
+TCP/TLS connections are kept alive between calls. Requests are sent with
+gzip enabled, connect/read timeouts and retries with jittered exponential
+backoff on 5xx responses, connection errors and timeouts.
+"""
+
+import random
+import threading
+import time
+from typing import Any, Dict, Optional, Union
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+# ----------------------------------------------------------------------
+# Client settings
+# ----------------------------------------------------------------------
+_http_options: Dict[str, Any] = {
+    "connect_timeout": 5.0,
+    "read_timeout": 60.0,
+    "retries": 3,
+    "backoff_factor": 0.5,     # 0.5, 1, 2, ... seconds between attempts
+    "backoff_jitter": 0.5,     # random extra delay added to every backoff
+    "backoff_max": 30.0,
+    "status_forcelist": (429, 500, 502, 503, 504),
+    "pool_connections": 10,    # number of hosts kept in the pool
+    "pool_maxsize": 10,        # connections kept (and allowed) per host
+}
+
+_session: Optional[requests.Session] = None
+_session_lock = threading.Lock()
+
+
+class _JitteredRetry(Retry):
+    """``Retry`` whose exponential backoff gets a random jitter added."""
+
+    def get_backoff_time(self) -> float:
+        backoff = super().get_backoff_time()
+        if backoff <= 0:
+            return backoff
+        backoff += random.uniform(0, _http_options["backoff_jitter"])
+        return min(backoff, _http_options["backoff_max"])
+
+
+def _build_retry() -> Retry:
+    """Retry policy for idempotent requests built from ``_http_options``."""
+    retries = _http_options["retries"]
+    return _JitteredRetry(
+        total=retries,
+        connect=retries,
+        read=retries,
+        status=retries,
+        backoff_factor=_http_options["backoff_factor"],
+        status_forcelist=_http_options["status_forcelist"],
+        allowed_methods=frozenset({"GET", "HEAD"}),
+        respect_retry_after_header=True,
+        raise_on_status=False,
+    )
+
+
+def set_http_options(**options) -> None:
+    """
+    Change the HTTP client settings.
+
+    Accepted keys are the ones of ``_http_options`` (timeouts, retry and
+    backoff settings, pool sizes). The shared session is rebuilt on the
+    next request.
+    """
+    unknown = set(options) - set(_http_options)
+    if unknown:
+        raise ValueError(f"Unknown HTTP option(s): {sorted(unknown)}")
+    _http_options.update(options)
+    close_session()
+
+
+def get_session() -> requests.Session:
+    """Return the shared ``requests.Session``, creating it on first use."""
+    global _session
+    with _session_lock:
+        if _session is None:
+            session = requests.Session()
+            adapter = HTTPAdapter(
+                pool_connections=_http_options["pool_connections"],
+                pool_maxsize=_http_options["pool_maxsize"],
+                pool_block=True,   # never open more than pool_maxsize per host
+                max_retries=_build_retry(),
+            )
+            session.mount("https://", adapter)
+            session.mount("http://", adapter)
+            session.headers.update({"Accept-Encoding": "gzip, deflate"})
+            _session = session
+        return _session
+
+
+def close_session() -> None:
+    """Close the shared session and its pooled connections."""
+    global _session
+    with _session_lock:
+        if _session is not None:
+            _session.close()
+        _session = None
+
+
+def http_get(
+    url: str,
+    params: Optional[Dict[str, Any]] = None,
+    timeout: Union[float, tuple, None] = None,
+    **kwargs,
+) -> requests.Response:
+    """
+    Send a GET request through the shared session.
+
+    Parameters
+    ----------
+    url : str
+        Request URL.
+    params : dict, optional
+        Query parameters appended to *url*.
+    timeout : float or (connect, read) tuple, optional
+        Overrides the configured connect/read timeouts.
+    **kwargs
+        Passed to ``requests.Session.get``.
+
+    Returns
+    -------
+    requests.Response
+        The final response (after retries); call ``raise_for_status``
+        to turn HTTP errors into exceptions.
+    """
+    if timeout is None:
+        timeout = (_http_options["connect_timeout"], _http_options["read_timeout"])
+
+    return get_session().get(url, params=params, timeout=timeout, **kwargs)
+
+
+# ----------------------------------------------------------------------
+# Client side rate limiting
+# ----------------------------------------------------------------------
+class RateLimiter:
+    """
+    Token bucket shared by threads: at most *rate* requests per second on
+    average, with bursts of up to *burst* requests.
+    """
+
+    def __init__(self, rate: float, burst: int = 1):
+        if rate <= 0:
+            raise ValueError("rate must be positive.")
+        self.rate = float(rate)
+        self.burst = max(1, int(burst))
+        self._tokens = float(self.burst)
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self) -> None:
+        """Block until a request may be sent."""
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._tokens = min(self.burst, self._tokens + (now - self._updated) * self.rate)
+                self._updated = now
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                wait = (1 - self._tokens) / self.rate
+            time.sleep(wait)
+
+
+# Exported symbols (similar to R's @export)
+__all__ = [
+    "set_http_options",
+    "get_session",
+    "close_session",
+    "http_get",
+    "RateLimiter",
+]
@@ -1,4 +1,5 @@
 import os
+import base64
 import json
 import re
 import logging
@@ -6,7 +7,25 @@ import time
 from typing import Any, List, Optional, Dict
 import pandas as pd
 import requests
+from sqlalchemy import text
+from .API import from_meta_apiurl
+from .DBMS import (
+    db_close,
+    db_connect,
+    db_settable,
+    deletequery,
+    get_connection,
+    getquery,
+    is_connected,
+    write_log_dataimp,
+)
+from .HTTP import RateLimiter, http_get
+from .env import get_env, set_env
 import itertools
+import pickle
+import threading
+import numpy as np
+from concurrent.futures import ThreadPoolExecutor, as_completed, wait, FIRST_COMPLETED
 from datetime import datetime
 
 # ----------------------------------------------------------------------
@@ -18,6 +37,7 @@ def desc_kosis_stats(
     type_: str = "TBL",
     api_key: Optional[str] = None,
     verbose: bool = False,
+    timeout: Optional[float] = None,
 ) -> pd.DataFrame:
     """
     Retrieve KOSIS table metadata and optionally prune columns for ITEM type.
@@ -34,6 +54,9 @@ def desc_kosis_stats(
         KOSIS API key. If omitted, taken from the KOSIS_API_KEY environment variable.
     verbose : bool, default False
         If True, prints the constructed API URL.
+    timeout : float, optional
+        Read timeout of the request in seconds. Defaults to the shared
+        HTTP client setting.
 
     Returns
     -------
@@ -71,7 +94,7 @@ def desc_kosis_stats(
     if verbose:
         logging.info(f"KOSIS API URL: {api_url}")
 
-    response = requests.get(api_url)
+    response = http_get(api_url, timeout=timeout)
     response.raise_for_status()
     raw_text = response.text
 
@@ -141,9 +164,11 @@ def from_meta_kosisdesc(
     if type_ not in allowed_types:
         raise ValueError(f"type must be one of {allowed_types}")
 
+    table = _KOSIS_DESC_STORE.get(type_, {}).get("table", f"mt_kosis_{type_.lower()}")
+
     sql = (
         f"SELECT *\n"
-        f"  FROM ecodi_meta.mt_kosis_{type_.lower()}\n"
+        f"  FROM ecodi_meta.{table}\n"
         f" WHERE tbl_id = '{tbl_id}'\n"
         f"   AND org_id = '{org_id}'"
     )
@@ -161,6 +186,206 @@ def from_meta_kosisdesc(
     return result
 
 
+# ----------------------------------------------------------------------
+# Read‑through / write‑through cache of KOSIS metadata
+# ----------------------------------------------------------------------
+# Metadata types stored in ecodi_meta: table name and stored columns
+# (besides tbl_id / org_id and the audit columns)
+_KOSIS_DESC_STORE: Dict[str, Dict[str, Any]] = {
+    "TBL": {
+        "table": "mt_kosis_tbl",
+        "columns": ["tbl_nm", "tbl_nm_eng"],
+    },
+    "ITM": {
+        "table": "mt_kosis_itm",
+        "columns": [
+            "obj_id", "obj_nm", "obj_id_sn", "obj_nm_eng", "up_itm_id",
+            "itm_nm", "itm_id", "itm_nm_eng", "unit_id", "unit_nm",
+            "unit_eng_nm",
+        ],
+    },
+    "PRD": {
+        "table": "mt_kosis_prd",
+        "columns": ["prd_se", "strt_prd_de", "end_prd_de"],
+    },
+    "SOURCE": {
+        "table": "mt_kosis_src",
+        "columns": ["stat_id", "josa_nm", "dept_phone", "dept_nm"],
+    },
+}
+
+
+def _kosis_desc_to_store(
+    type_: str,
+    tbl_id: str,
+    org_id: str,
+    df_desc: pd.DataFrame,
+) -> pd.DataFrame:
+    """Convert a ``desc_kosis_stats`` result to the rows of its meta table."""
+    columns = _KOSIS_DESC_STORE[type_]["columns"]
+
+    df_store = df_desc.copy()
+    df_store.columns = df_store.columns.str.lower()
+    df_store = df_store.reindex(columns=columns)
+    df_store.insert(0, "org_id", org_id)
+    df_store.insert(0, "tbl_id", tbl_id)
+
+    if type_ == "ITM":
+        df_store.insert(2, "itm_seq", range(1, len(df_store) + 1))
+        df_store["obj_id_sn"] = pd.to_numeric(df_store["obj_id_sn"], errors="coerce")
+    elif type_ == "PRD":
+        # prd_cd is the period code ("M", "Y", ...) of the period name
+        df_prd_se = getquery(sql="select prd_se, prd_cd from mt_kosis_prdse", schema="meta")
+        prd_cd = dict(zip(df_prd_se["prd_se"], df_prd_se["prd_cd"]))
+        df_store.insert(2, "prd_cd", df_store["prd_se"].map(prd_cd))
+        df_store = df_store.dropna(subset=["prd_cd"])
+    elif type_ == "TBL":
+        df_store["tbl_nm_eng"] = df_store["tbl_nm_eng"].fillna("")
+
+    return df_store
+
+
+def _kosis_desc_from_store(type_: str, df_store: pd.DataFrame) -> pd.DataFrame:
+    """Convert stored meta table rows back to the ``desc_kosis_stats`` layout."""
+    if type_ == "ITM":
+        df_store = df_store.sort_values("itm_seq")
+        df_store["obj_id_sn"] = df_store["obj_id_sn"].map(
+            lambda v: None if pd.isna(v) else str(int(v))
+        )
+        columns = ["org_id"] + _KOSIS_DESC_STORE[type_]["columns"]
+    else:
+        columns = _KOSIS_DESC_STORE[type_]["columns"]
+
+    df_desc = df_store[columns].reset_index(drop=True)
+    df_desc.columns = df_desc.columns.str.upper()
+
+    return df_desc
+
+
+def _kosis_send_de(tbl_id: str, org_id: str) -> Optional[datetime]:
+    """Latest ``send_de`` (KOSIS update date) of a table in ``mt_kosis_stat``."""
+    sql = (
+        f"SELECT MAX(send_de) AS send_de\n"
+        f"  FROM ecodi_meta.mt_kosis_stat\n"
+        f" WHERE tbl_id = '{tbl_id}'\n"
+        f"   AND org_id = '{org_id}'"
+    )
+    df_send = getquery(sql)
+    if df_send is None or df_send.empty or pd.isna(df_send.iloc[0, 0]):
+        return None
+
+    send_de = re.sub(r"[^0-9]", "", str(df_send.iloc[0, 0]))[:8]
+    try:
+        return datetime.strptime(send_de, "%Y%m%d")
+    except ValueError:
+        return None
+
+
+def desc_kosis_stats_cached(
+    tbl_id: Optional[str] = None,
+    org_id: Optional[str] = None,
+    type_: str = "TBL",
+    api_key: Optional[str] = None,
+    changed_de: Optional[str] = None,
+    max_age_days: Optional[int] = 30,
+    refresh: bool = False,
+    verbose: bool = False,
+    timeout: Optional[float] = None,
+) -> pd.DataFrame:
+    """
+    ``desc_kosis_stats`` backed by the ``ecodi_meta.mt_kosis_*`` tables.
+
+    The stored metadata of the table is returned when present and fresh;
+    otherwise the KOSIS API is called and the result is written back to
+    the meta table (replacing the stored rows of the table). Types without
+    a meta table ("ORG", "CMMT", "UNIT", "NCD") always go to the API.
+
+    Parameters
+    ----------
+    tbl_id, org_id, type_, api_key, verbose, timeout
+        As in ``desc_kosis_stats``.
+    changed_de : str, optional
+        Last change date of the statistics (e.g. ``LST_CHN_DE``). When
+        omitted, the ``send_de`` of the table in ``mt_kosis_stat`` is used.
+        Stored metadata older than this date is stale.
+    max_age_days : int, optional, default 30
+        Stored metadata older than this many days is stale. ``None``
+        disables the age check.
+    refresh : bool, default False
+        If True, skip the lookup and always call the API.
+
+    Returns
+    -------
+    pd.DataFrame
+        Same layout as ``desc_kosis_stats``.
+    """
+    if tbl_id is None or org_id is None:
+        raise ValueError("Both 'tbl_id' and 'org_id' must be provided.")
+
+    if type_ not in _KOSIS_DESC_STORE:
+        return desc_kosis_stats(tbl_id=tbl_id, org_id=org_id, type_=type_,
+                                api_key=api_key, verbose=verbose, timeout=timeout)
+
+    table = _KOSIS_DESC_STORE[type_]["table"]
+
+    # ------------------------------------------------------------------
+    # Read through the meta table
+    # ------------------------------------------------------------------
+    if not refresh:
+        try:
+            sql = (
+                f"SELECT *\n"
+                f"  FROM ecodi_meta.{table}\n"
+                f" WHERE tbl_id = '{tbl_id}'\n"
+                f"   AND org_id = '{org_id}'"
+            )
+            df_store = getquery(sql)
+
+            if isinstance(df_store, pd.DataFrame) and not df_store.empty:
+                stored_dt = pd.to_datetime(
+                    df_store["mdfy_dt"].fillna(df_store["cret_dt"])
+                ).max()
+
+                if changed_de is not None:
+                    changed_de = re.sub(r"[^0-9]", "", str(changed_de))[:8]
+                    changed_dt = datetime.strptime(changed_de, "%Y%m%d") if changed_de else None
+                else:
+                    changed_dt = _kosis_send_de(tbl_id, org_id)
+
+                is_stale = (
+                    (changed_dt is not None and stored_dt < changed_dt)
+                    or (max_age_days is not None
+                        and stored_dt < datetime.now() - pd.Timedelta(days=max_age_days))
+                )
+
+                if not is_stale:
+                    if verbose:
+                        logging.info(f"Using stored KOSIS {type_} metadata of {tbl_id}")
+                    return _kosis_desc_from_store(type_, df_store)
+        except Exception as e:
+            if verbose:
+                logging.info(f"Lookup of stored KOSIS {type_} metadata failed: {e}")
+
+    # ------------------------------------------------------------------
+    # Fetch from the API and write through
+    # ------------------------------------------------------------------
+    df_desc = desc_kosis_stats(tbl_id=tbl_id, org_id=org_id, type_=type_,
+                               api_key=api_key, verbose=verbose, timeout=timeout)
+
+    if isinstance(df_desc, pd.DataFrame) and not df_desc.empty:
+        try:
+            df_store = _kosis_desc_to_store(type_, tbl_id, org_id, df_desc)
+            deletequery(table, schema="meta", tbl_id=tbl_id, org_id=org_id)
+            db_settable(name=table, value=df_store, append=True, schema="meta")
+            if get_env("STATUS") == "0":
+                raise ValueError(get_env("EMSG"))
+        except Exception as e:
+            # The fetched metadata is still returned; only the store is stale
+            logging.warning(f"Storing KOSIS {type_} metadata of {tbl_id} failed: {e}")
+
+    return df_desc
+
+
 def get_kosis_indexpl(
     ind_id: Optional[str] = None,
     api_key: Optional[str] = None,
@@ -207,7 +432,7 @@ def get_kosis_indexpl(
     if verbose:
         logging.info(f"KOSIS API URL: {api_url}")
 
-    response = requests.get(api_url)
+    response = http_get(api_url)
     response.raise_for_status()
     result_json = response.json()
 
@@ -255,6 +480,301 @@ import requests
 
 
 
+# ----------------------------------------------------------------------
+# Cell‑limit planning for get_kosis_stats
+# ----------------------------------------------------------------------
+# KOSIS rejects requests above this many cells (mt_api_url.limit_cell_cnt)
+KOSIS_CELL_LIMIT: int = 400_000
+
+# objL parameter strings at or above this length are not accepted by KOSIS
+KOSIS_OBJ_PARAM_LEN: int = 500
+
+
+def _kosis_period_range(
+    start_prd: Optional[str],
+    end_prd: Optional[str],
+    prd_se: str,
+) -> Optional[List[str]]:
+    """
+    Enumerate the KOSIS periods (``PRD_DE`` values) from *start_prd* to
+    *end_prd* for the period type *prd_se*.
+
+    Supported formats are ``YYYY`` (Y), ``YYYYHH`` (H), ``YYYYQQ`` (Q),
+    ``YYYYMM`` (M) and ``YYYYMMDD`` (D). ``None`` is returned when the
+    range cannot be enumerated (other period types or unexpected formats).
+    """
+    if not start_prd or not end_prd:
+        return None
+
+    start_prd, end_prd = str(start_prd), str(end_prd)
+    widths = {"Y": 4, "H": 6, "Q": 6, "M": 6, "D": 8}
+    width = widths.get(prd_se)
+    if width is None or len(start_prd) != width or len(end_prd) != width:
+        return None
+    if not (start_prd.isdigit() and end_prd.isdigit()) or start_prd > end_prd:
+        return None
+
+    if prd_se == "Y":
+        return [str(y) for y in range(int(start_prd), int(end_prd) + 1)]
+
+    if prd_se == "D":
+        days = pd.date_range(start_prd, end_prd, freq="D")
+        return days.strftime("%Y%m%d").tolist()
+
+    # Sub‑annual periods numbered 1..n within each year
+    per_year = {"H": 2, "Q": 4, "M": 12}[prd_se]
+    start_y, start_p = int(start_prd[:4]), int(start_prd[4:])
+    end_y, end_p = int(end_prd[:4]), int(end_prd[4:])
+    if not (1 <= start_p <= per_year and 1 <= end_p <= per_year):
+        return None
+
+    periods = []
+    year, part = start_y, start_p
+    while (year, part) <= (end_y, end_p):
+        periods.append(f"{year}{part:02d}")
+        part += 1
+        if part > per_year:
+            year, part = year + 1, 1
+    return periods
+
+
+def _kosis_cell_limit() -> int:
+    """Cell limit of the statistics data API from ``mt_api_url`` (AU0002)."""
+    try:
+        api_url = from_meta_apiurl("AU0002")
+        limit = api_url["limit_cell_cnt"].iloc[0]
+        if pd.notna(limit):
+            return int(limit)
+    except Exception:
+        pass
+    return KOSIS_CELL_LIMIT
+
+
+def _kosis_cell_count(chunk: Dict[str, Any]) -> int:
+    """Estimated cells of a request: items × objL values × periods."""
+    cells = max(1, len(chunk["items"]))
+    for values in chunk["levels"].values():
+        cells *= max(1, len(values))
+    if chunk["periods"] is not None:
+        cells *= max(1, len(chunk["periods"]))
+    else:
+        cells *= max(1, chunk["newest"])
+    return cells
+
+
+def _kosis_halve(chunk: Dict[str, Any], axis: str, level: Optional[int] = None) -> List[Dict[str, Any]]:
+    """Split *chunk* into two along *axis* ("items", "periods" or an objL level)."""
+    values = chunk["levels"][level] if axis == "levels" else chunk[axis]
+    mid = len(values) // 2
+
+    halves = []
+    for part in (values[:mid], values[mid:]):
+        new_chunk = dict(chunk, levels=dict(chunk["levels"]))
+        if axis == "levels":
+            new_chunk["levels"][level] = part
+        else:
+            new_chunk[axis] = part
+        halves.append(new_chunk)
+    return halves
+
+
+def _kosis_split_chunks(chunk: Dict[str, Any], limit: int) -> List[Dict[str, Any]]:
+    """
+    Split a request along the item, objL and period axes until every part
+    is estimated under *limit* cells and every objL string stays below
+    ``KOSIS_OBJ_PARAM_LEN`` characters. The largest axis is halved first.
+    """
+    pending = [chunk]
+    done = []
+
+    while pending:
+        part = pending.pop()
+
+        # objL strings that KOSIS would not accept are split first
+        too_long = [
+            level for level, values in part["levels"].items()
+            if len(values) > 1 and len("+".join(values)) >= KOSIS_OBJ_PARAM_LEN
+        ]
+        if too_long:
+            pending.extend(_kosis_halve(part, "levels", too_long[0]))
+            continue
+
+        if _kosis_cell_count(part) <= limit:
+            done.append(part)
+            continue
+
+        axes = [("items", None, len(part["items"]))]
+        if part["periods"] is not None:
+            axes.append(("periods", None, len(part["periods"])))
+        axes.extend(
+            ("levels", level, len(values))
+            for level, values in part["levels"].items()
+        )
+        axis, level, size = max(axes, key=lambda a: a[2])
+
+        if size <= 1:
+            # Nothing left to split; let the server decide
+            done.append(part)
+        else:
+            pending.extend(_kosis_halve(part, axis, level))
+
+    return done
+
+
+def _kosis_stats_url(
+    api_key: str,
+    org_id: str,
+    tbl_id: str,
+    prd_se: str,
+    chunk: Dict[str, Any],
+) -> str:
+    """Build the statisticsParameterData URL for one request chunk."""
+    obj_params = {}
+    for level in range(1, 9):
+        param_str = "+".join(chunk["levels"].get(level, []))
+        # Truncate long parameter strings
+        if len(param_str) >= KOSIS_OBJ_PARAM_LEN:
+            param_str = "ALL"
+        obj_params[f"objL{level}"] = param_str
+
+    url = (
+        "https://kosis.kr/openapi/Param/statisticsParameterData.do"
+        f"?method=getList&apiKey={api_key}&format=json&orgId={org_id}"
+        f"&tblId={tbl_id}&objL1={obj_params['objL1']}"
+        f"&itmId={'+'.join(chunk['items'])}&prdSe={prd_se}"
+    )
+
+    # Append remaining objL* parameters (2‑8) and request flags
+    url += "".join(f"&objL{level}={obj_params[f'objL{level}']}" for level in range(2, 9))
+    url += "&jsonVD=Y"
+
+    if chunk["periods"] is not None:
+        url += f"&startPrdDe={chunk['periods'][0]}&endPrdDe={chunk['periods'][-1]}"
+    elif chunk["newest"]:
+        url += f"&newEstPrdCnt={chunk['newest']}"
+    else:
+        url += f"&startPrdDe={chunk['start_prd']}&endPrdDe={chunk['end_prd']}"
+
+    return url
+
+
+def _kosis_fetch_json(url: str) -> Any:
+    """GET *url* through the shared HTTP session and return the JSON body."""
+    response = http_get(url)
+    response.raise_for_status()
+    return response.json()
+
+
+def _kosis_fetch_chunks(
+    chunks: List[Dict[str, Any]],
+    build_url,
+    max_workers: int = 4,
+    verbose: bool = False,
+) -> List[Dict[str, Any]]:
+    """
+    Fetch request chunks concurrently and return all records.
+
+    Chunks without data (err 30) are skipped; chunks rejected as too large
+    (err 31) are split further and retried. Any other error is raised.
+    """
+    records: List[Dict[str, Any]] = []
+
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        pending = {executor.submit(_kosis_fetch_json, build_url(c)): c for c in chunks}
+
+        while pending:
+            finished, _ = wait(pending, return_when=FIRST_COMPLETED)
+            for future in finished:
+                chunk = pending.pop(future)
+                content = future.result()
+
+                if isinstance(content, list):
+                    records.extend(item for item in content if isinstance(item, dict))
+                    continue
+
+                err = str(content.get("err", "")) if isinstance(content, dict) else ""
+                if err == "30":
+                    # 조회결과 없음
+                    continue
+                if err == "31":
+                    # 조회결과 초과: split the chunk once more
+                    parts = _kosis_split_chunks(chunk, max(1, _kosis_cell_count(chunk) // 2))
+                    if len(parts) > 1:
+                        if verbose:
+                            print(f"Splitting oversized KOSIS request into {len(parts)} parts")
+                        for part in parts:
+                            pending[executor.submit(_kosis_fetch_json, build_url(part))] = part
+                        continue
+
+                raise RuntimeError(f"KOSIS request failed: {content}")
+
+    return records
+
+
+# ----------------------------------------------------------------------
+# Typed / columnar results of get_kosis_stats
+# ----------------------------------------------------------------------
+# PRD_SE -> (PRD_DE parse format, pandas period frequency)
+_KOSIS_PERIOD_FREQ: Dict[str, tuple] = {
+    "Y": ("%Y", "Y"),
+    "M": ("%Y%m", "M"),
+    "D": ("%Y%m%d", "D"),
+}
+
+
+def _kosis_period_values(prd_de: pd.Series, prd_se: str) -> Optional[pd.Series]:
+    """``PRD_DE`` strings as a period dtype, or ``None`` for other cycles."""
+    prd_de = prd_de.astype(str)
+
+    if prd_se == "Q":
+        # YYYYQQ -> YYYYQn
+        quarters = prd_de.str[:4] + "Q" + prd_de.str[4:].str.lstrip("0")
+        return pd.Series(pd.PeriodIndex(quarters, freq="Q"), index=prd_de.index)
+
+    if prd_se in _KOSIS_PERIOD_FREQ:
+        fmt, freq = _KOSIS_PERIOD_FREQ[prd_se]
+        dates = pd.to_datetime(prd_de, format=fmt, errors="coerce")
+        return dates.dt.to_period(freq)
+
+    return None
+
+
+def _kosis_typed_frame(df_desc: pd.DataFrame) -> pd.DataFrame:
+    """
+    Compact dtypes for a ``get_kosis_stats`` result: ``DT`` as float ("-"
+    and blanks become NaN), ``PRD_DE`` as a period (single Y/Q/M/D cycle)
+    and the repeated codes and labels as categoricals.
+    """
+    if "DT" in df_desc.columns:
+        values = df_desc["DT"].astype("string").str.replace(",", "", regex=False).str.strip()
+        df_desc["DT"] = pd.to_numeric(values, errors="coerce").astype("float64")
+
+    prd_converted = False
+    if "PRD_DE" in df_desc.columns and "PRD_SE" in df_desc.columns:
+        cycles = df_desc["PRD_SE"].dropna().unique()
+        if len(cycles) == 1:
+            try:
+                periods = _kosis_period_values(df_desc["PRD_DE"], cycles[0])
+            except (ValueError, TypeError):
+                periods = None
+            if periods is not None:
+                df_desc["PRD_DE"] = periods
+                prd_converted = True
+
+    for col in df_desc.columns:
+        if col == "DT" or (col == "PRD_DE" and prd_converted):
+            continue
+        df_desc[col] = df_desc[col].astype("category")
+
+    return df_desc
+
+
+def _kosis_arrow_table(df_desc: pd.DataFrame):
+    """Convert a typed ``get_kosis_stats`` result to a ``pyarrow.Table``."""
+    pa, _ = _import_pyarrow()
+    return pa.Table.from_pandas(df_desc, preserve_index=False)
+
+
 # ----------------------------------------------------------------------
 # Main function
 # ----------------------------------------------------------------------
@@ -277,12 +797,32 @@ def get_kosis_stats(
     auto_period: bool = True,
     api_key: Optional[str] = None,
     verbose: bool = False,
+    split_cells: bool = True,
+    max_workers: int = 4,
+    use_meta: bool = True,
+    output: str = "object",
     **_: Any,
 ) -> pd.DataFrame:
     """
     Retrieve KOSIS statistical data.
 
     Mirrors the behaviour of the original R function `get_kosis_stats`.
+
+    With ``split_cells=True`` the number of cells (items × objL values ×
+    periods) is estimated from the ITM/PRD metadata; a request above the
+    KOSIS cell limit (``mt_api_url.limit_cell_cnt``) is split along the
+    item, objL and period axes, the parts are fetched concurrently with
+    *max_workers* threads and the results are concatenated and
+    de‑duplicated.
+
+    With ``use_meta=True`` the ITM/PRD metadata is read through the
+    ``mt_kosis_itm`` / ``mt_kosis_prd`` tables (see
+    ``desc_kosis_stats_cached``) instead of being requested every time.
+
+    *output* selects the result type: "object" (strings, as returned by
+    KOSIS), "typed" (``DT`` as float, ``PRD_DE`` as a period of its
+    ``PRD_SE`` cycle and the codes/labels as categoricals) or "arrow"
+    (the typed result as a ``pyarrow.Table``; requires pyarrow).
     """
 
     # ------------------------------------------------------------------
@@ -294,6 +834,9 @@ def get_kosis_stats(
     if tbl_id is None or org_id is None:
         raise ValueError("Both `tbl_id` and `org_id` must be provided.")
 
+    if output not in {"object", "typed", "arrow"}:
+        raise ValueError("output must be one of {'object', 'typed', 'arrow'}")
+
     api_key = api_key or os.getenv("KOSIS_API_KEY", "")
     if not api_key:
         raise ValueError("API key is missing. Set `api_key` argument or KOSIS_API_KEY env var.")
@@ -301,26 +844,28 @@ def get_kosis_stats(
     # ------------------------------------------------------------------
     # ITEM (ITM) metadata
     # ------------------------------------------------------------------
-    df_itm = desc_kosis_stats(tbl_id=tbl_id, org_id=org_id, type_="ITM", verbose=verbose)
+    desc_stats = desc_kosis_stats_cached if use_meta else desc_kosis_stats
+    df_itm = desc_stats(tbl_id=tbl_id, org_id=org_id, type_="ITM", api_key=api_key, verbose=verbose)
 
     if df_itm.empty:
         raise ValueError("No ITEM metadata returned.")
 
-    # itmId = concatenated ITM_ID values where OBJ_ID == "ITEM"
+    # item ids = ITM_ID values where OBJ_ID == "ITEM"
     itm_filter = df_itm["OBJ_ID"] == "ITEM"
-    itm_id_series = df_itm.loc[itm_filter, "ITM_ID"]
-    itmId = "+".join(itm_id_series.astype(str).tolist())
+    itm_ids = df_itm.loc[itm_filter, "ITM_ID"].astype(str).tolist()
 
-    if not itmId:
+    if not itm_ids:
         raise ValueError("Item ID string is empty – cannot continue.")
 
     # ------------------------------------------------------------------
     # Optional object level handling
     # ------------------------------------------------------------------
-    # Prepare a mutable mapping for objL1 … objL8 that can be overridden later
-    obj_levels: Dict[int, str] = {
-        1: objL1, 2: objL2, 3: objL3, 4: objL4,
-        5: objL5, 6: objL6, 7: objL7, 8: objL8,
+    # Values of objL1 … objL8 (explicit arguments, overridden below)
+    obj_levels: Dict[int, List[str]] = {
+        idx: [v for v in str(obj).split("+") if v]
+        for idx, obj in enumerate(
+            [objL1, objL2, objL3, objL4, objL5, objL6, objL7, objL8], start=1
+        )
     }
 
     if all_obj:
@@ -328,23 +873,17 @@ def get_kosis_stats(
         obj_sn_series = df_itm["OBJ_ID_SN"].dropna().unique()
 
         for idx, obj_sn in enumerate(obj_sn_series, start=1):
-            # Concatenate ITM_ID for the current OBJ_ID_SN
+            # ITM_ID values of the current OBJ_ID_SN
             mask = df_itm["OBJ_ID_SN"] == obj_sn
-            itm_ids = df_itm.loc[mask, "ITM_ID"]
-            param_str = "+".join(itm_ids.astype(str).tolist())
-
-            # Truncate long parameter strings
-            if len(param_str) >= 500:
-                param_str = "ALL"
 
             # Assign to the appropriate objL* variable (if within 1‑8)
             if idx <= 8:
-                obj_levels[idx] = param_str
+                obj_levels[idx] = df_itm.loc[mask, "ITM_ID"].astype(str).tolist()
 
     # ------------------------------------------------------------------
     # PERIOD (PRD) metadata
     # ------------------------------------------------------------------
-    df_prd = desc_kosis_stats(tbl_id=tbl_id, org_id=org_id, type_="PRD", verbose=verbose)
+    df_prd = desc_stats(tbl_id=tbl_id, org_id=org_id, type_="PRD", api_key=api_key, verbose=verbose)
     df_prd.columns = df_prd.columns.str.lower()
     df_prd.rename(columns={df_prd.columns[0]: "prd_nm"}, inplace=True)
 
@@ -387,59 +926,41 @@ def get_kosis_stats(
     prd_se = df_prd.at[0, "prd_se"]
 
     # ------------------------------------------------------------------
-    # Build request URL
+    # Plan the request(s)
     # ------------------------------------------------------------------
-    base_url = (
-        "https://kosis.kr/openapi/Param/statisticsParameterData.do"
-        "?method=getList&apiKey={api_key}&format=json&orgId={org_id}"
-        "&tblId={tbl_id}&objL1={objL1}&itmId={itmId}&prdSe={prd_se}"
-    ).format(
-        api_key=api_key,
-        org_id=org_id,
-        tbl_id=tbl_id,
-        objL1=obj_levels.get(1, ""),
-        itmId=itmId,
-        prd_se=prd_se,
-    )
-
-    # Append remaining objL* parameters (2‑8) and request flags
-    base_url += (
-        "&objL2={objL2}&objL3={objL3}&objL4={objL4}"
-        "&objL5={objL5}&objL6={objL6}&objL7={objL7}&objL8={objL8}"
-        "&jsonVD=Y"
-    ).format(
-        objL2=obj_levels.get(2, ""),
-        objL3=obj_levels.get(3, ""),
-        objL4=obj_levels.get(4, ""),
-        objL5=obj_levels.get(5, ""),
-        objL6=obj_levels.get(6, ""),
-        objL7=obj_levels.get(7, ""),
-        objL8=obj_levels.get(8, ""),
-    )
+    request = {
+        "items": itm_ids,
+        "levels": {idx: values for idx, values in obj_levels.items() if values},
+        "periods": None if newest_prdcnt else _kosis_period_range(start_prd, end_prd, prd_se),
+        "newest": newest_prdcnt,
+        "start_prd": start_prd,
+        "end_prd": end_prd,
+    }
 
-    if newest_prdcnt == 0:
-        base_url += f"&startPrdDe={start_prd}&endPrdDe={end_prd}"
+    if split_cells:
+        chunks = _kosis_split_chunks(request, _kosis_cell_limit())
     else:
-        base_url += f"&newEstPrdCnt={newest_prdcnt}"
+        chunks = [request]
 
-    if verbose:
-        print(f"KOSIS API URL: {api_url}")
+    def _build_url(chunk: Dict[str, Any]) -> str:
+        url = _kosis_stats_url(api_key, org_id, tbl_id, prd_se, chunk)
+        if verbose:
+            print(f"KOSIS API URL: {url}")
+        return url
 
     # ------------------------------------------------------------------
     # Request data
     # ------------------------------------------------------------------
-    response = requests.get(base_url)
-    response.raise_for_status()
-    json_content = response.json()
-
-    # If the returned JSON is not a tabular structure, return it as‑is
-    if not isinstance(json_content, list) or not all(isinstance(item, dict) for item in json_content):
-        return json_content
+    if len(chunks) == 1:
+        json_content = _kosis_fetch_json(_build_url(chunks[0]))
 
-    df_desc = pd.json_normalize(json_content)
-
-    if not isinstance(df_desc, pd.DataFrame):
-        return json_content
+        # If the returned JSON is not a tabular structure, return it as‑is
+        if not isinstance(json_content, list) or not all(isinstance(item, dict) for item in json_content):
+            return json_content
+    else:
+        if verbose:
+            print(f"Estimated {_kosis_cell_count(request)} cells; fetching {len(chunks)} chunks")
+        json_content = _kosis_fetch_chunks(chunks, _build_url, max_workers=max_workers, verbose=verbose)
 
     # ------------------------------------------------------------------
     # Column selection logic (mirrors original R code)
@@ -462,21 +983,553 @@ def get_kosis_stats(
     ]
 
     all_possible = base_stats + extra_stats
-    valid_columns = [col for col in all_possible if col in df_desc.columns]
 
-    # Return the dataframe limited to the selected columns
-    return df_desc[valid_columns].copy()
+    if output == "object":
+        df_desc = pd.json_normalize(json_content)
+
+        if not isinstance(df_desc, pd.DataFrame):
+            return json_content
+
+        valid_columns = [col for col in all_possible if col in df_desc.columns]
+
+        # Return the dataframe limited to the selected columns
+        df_desc = df_desc[valid_columns].copy()
+    else:
+        # Records are flat: build the selected columns directly
+        present = set().union(*(record.keys() for record in json_content))
+        valid_columns = [col for col in all_possible if col in present]
+        df_desc = pd.DataFrame.from_records(json_content, columns=valid_columns)
+
+    # Chunks may overlap when the server splits its answer differently
+    if len(chunks) > 1:
+        df_desc = df_desc.drop_duplicates(ignore_index=True)
+
+    if output == "object":
+        return df_desc
+
+    df_desc = _kosis_typed_frame(df_desc)
+
+    if output == "arrow":
+        return _kosis_arrow_table(df_desc)
+
+    return df_desc
   
 
+# ----------------------------------------------------------------------
+# Local Parquet store of KOSIS statistics
+# ----------------------------------------------------------------------
+# Hive partitions of the store: <root>/ORG_ID=.../TBL_ID=.../PRD_SE=.../
+KOSIS_PARQUET_PARTITIONS: List[str] = ["ORG_ID", "TBL_ID", "PRD_SE"]
+
+
+def _import_pyarrow():
+    """Import pyarrow (and its dataset module) or explain how to install it."""
+    try:
+        import pyarrow as pa
+        import pyarrow.dataset as ds
+    except ImportError as e:
+        raise ImportError(
+            "This feature requires pyarrow. Install it with `pip install pyarrow`."
+        ) from e
+    return pa, ds
+
+
+def _kosis_parquet_partitioning():
+    pa, ds = _import_pyarrow()
+    schema = pa.schema([(col, pa.string()) for col in KOSIS_PARQUET_PARTITIONS])
+    return ds.partitioning(schema, flavor="hive")
+
+
+def _kosis_period_strings(prd_de: pd.Series) -> pd.Series:
+    """``PRD_DE`` back to KOSIS strings (undoes the period dtype of output="typed")."""
+    if not isinstance(prd_de.dtype, pd.PeriodDtype):
+        return prd_de.astype("string")
+
+    freq = prd_de.dt.freqstr[0]
+    if freq == "Q":
+        return prd_de.dt.year.astype(str) + prd_de.dt.quarter.map("{:02d}".format)
+    fmt = {"Y": "%Y", "A": "%Y", "M": "%Y%m", "D": "%Y%m%d"}[freq]
+    return prd_de.dt.strftime(fmt).astype("string")
+
+
+def _kosis_parquet_filter(
+    org_id: Optional[str] = None,
+    tbl_id: Optional[str] = None,
+    prd_se: Optional[str] = None,
+    start_prd: Optional[str] = None,
+    end_prd: Optional[str] = None,
+    filters: Optional[Dict[str, Any]] = None,
+):
+    """``pyarrow.dataset`` expression of the reader arguments (``None`` = all rows)."""
+    _, ds = _import_pyarrow()
+
+    conditions = []
+    for col, value in (("ORG_ID", org_id), ("TBL_ID", tbl_id), ("PRD_SE", prd_se)):
+        if value is not None:
+            filters = dict(filters or {}, **{col: value})
+    if start_prd is not None:
+        conditions.append(ds.field("PRD_DE") >= str(start_prd))
+    if end_prd is not None:
+        conditions.append(ds.field("PRD_DE") <= str(end_prd))
+
+    for col, value in (filters or {}).items():
+        if isinstance(value, (list, tuple, set)):
+            conditions.append(ds.field(col).isin([str(v) for v in value]))
+        else:
+            conditions.append(ds.field(col) == str(value))
+
+    if not conditions:
+        return None
+    expression = conditions[0]
+    for condition in conditions[1:]:
+        expression = expression & condition
+    return expression
+
+
+def write_kosis_parquet(
+    df_stats: pd.DataFrame,
+    root: str,
+    replace_periods: bool = False,
+    verbose: bool = False,
+) -> int:
+    """
+    Append a ``get_kosis_stats`` result to a local Parquet store.
+
+    Rows are written under ``<root>/ORG_ID=<org>/TBL_ID=<tbl>/PRD_SE=<se>/``.
+    Only rows whose key (``PRD_DE`` with the ``C1``..``C8`` / ``ITM_ID``
+    columns) is not yet stored in their partition are added, so
+    re‑writing an overlapping pull appends just the new rows, while a pull
+    of the same periods with other ``objL`` / ``itmId`` filters is kept.
+
+    Parameters
+    ----------
+    df_stats : pd.DataFrame
+        Result of ``get_kosis_stats`` (output "object" or "typed").
+    root : str
+        Directory of the store.
+    replace_periods : bool, default False
+        Rewrite the rows already stored (e.g. revised figures) instead
+        of skipping them. The partitions concerned are rewritten.
+    verbose : bool, default False
+        Print the number of rows written.
+
+    Returns
+    -------
+    int
+        Number of rows written.
+    """
+    pa, ds = _import_pyarrow()
+
+    missing = [col for col in KOSIS_PARQUET_PARTITIONS + ["PRD_DE"] if col not in df_stats.columns]
+    if missing:
+        raise ValueError(f"Column(s) {missing} not found in the data.")
+
+    # Storage types: strings, DT as float
+    df_store = df_stats.copy()
+    for col in df_store.columns:
+        if col == "PRD_DE":
+            df_store[col] = _kosis_period_strings(df_store[col])
+        elif col == "DT":
+            values = df_store[col].astype("string").str.replace(",", "", regex=False).str.strip()
+            df_store[col] = pd.to_numeric(values, errors="coerce").astype("float64")
+        else:
+            df_store[col] = df_store[col].astype("string")
+
+    partitioning = _kosis_parquet_partitioning()
+    keys = df_store[KOSIS_PARQUET_PARTITIONS].drop_duplicates()
+    stored = pd.DataFrame()
+
+    if os.path.isdir(root):
+        dataset = ds.dataset(root, format="parquet", partitioning=partitioning)
+        key_filter = None
+        for key in keys.itertuples(index=False):
+            expression = _kosis_parquet_filter(*key)
+            key_filter = expression if key_filter is None else key_filter | expression
+        # Row key: partition, period and the classification / item codes
+        row_key = [
+            col for col in _KOSIS_STATS_KEY
+            if col in df_store.columns and col in dataset.schema.names
+        ]
+        stored = dataset.to_table(filter=key_filter).to_pandas()
+
+    behavior = "overwrite_or_ignore"
+    if not stored.empty:
+        stored_keys = stored[row_key].astype("string").drop_duplicates()
+        is_stored = df_store[row_key].merge(
+            stored_keys, how="left", on=row_key, indicator=True
+        )["_merge"].eq("both").to_numpy()
+
+        if replace_periods:
+            # Keep the stored rows that are not rewritten
+            stored = stored.astype({col: "string" for col in row_key})
+            is_new = stored[row_key].merge(
+                df_store[row_key].drop_duplicates(), how="left", on=row_key, indicator=True
+            )["_merge"].eq("both").to_numpy()
+            kept = stored.loc[~is_new]
+            df_store = pd.concat([kept, df_store], ignore_index=True)
+            behavior = "delete_matching"
+        else:
+            df_store = df_store.loc[~is_stored]
+
+    if df_store.empty:
+        if verbose:
+            print("No new rows to store.")
+        return 0
+
+    ds.write_dataset(
+        pa.Table.from_pandas(df_store, preserve_index=False),
+        root,
+        format="parquet",
+        partitioning=partitioning,
+        basename_template=f"part-{datetime.now():%Y%m%d%H%M%S%f}-{{i}}.parquet",
+        existing_data_behavior=behavior,
+    )
+
+    if verbose:
+        print(f"Stored {len(df_store)} rows in {root}")
+
+    return len(df_store)
+
+
+def read_kosis_parquet(
+    root: str,
+    org_id: Optional[str] = None,
+    tbl_id: Optional[str] = None,
+    prd_se: Optional[str] = None,
+    start_prd: Optional[str] = None,
+    end_prd: Optional[str] = None,
+    columns: Optional[List[str]] = None,
+    filters: Optional[Dict[str, Any]] = None,
+    output: str = "object",
+) -> pd.DataFrame:
+    """
+    Read KOSIS statistics from the local Parquet store.
+
+    Partition arguments prune whole directories; *start_prd* / *end_prd*
+    and *filters* are pushed down to the Parquet row groups, and only the
+    requested *columns* are read.
+
+    Parameters
+    ----------
+    root : str
+        Directory of the store.
+    org_id, tbl_id, prd_se : str, optional
+        Partitions to read.
+    start_prd, end_prd : str, optional
+        Period range (inclusive), in the ``PRD_DE`` format of the cycle.
+    columns : list of str, optional
+        Columns to read (all when omitted).
+    filters : dict, optional
+        ``{column: value}`` or ``{column: [values]}``, e.g.
+        ``{"C1": ["11", "26"], "ITM_ID": "T2"}``.
+    output : {"object", "typed", "arrow"}, default "object"
+        Result type, as in ``get_kosis_stats``.
+
+    Returns
+    -------
+    pd.DataFrame or pyarrow.Table
+    """
+    if output not in {"object", "typed", "arrow"}:
+        raise ValueError("output must be one of {'object', 'typed', 'arrow'}")
+
+    _, ds = _import_pyarrow()
+
+    dataset = ds.dataset(root, format="parquet", partitioning=_kosis_parquet_partitioning())
+    table = dataset.to_table(
+        columns=columns,
+        filter=_kosis_parquet_filter(org_id, tbl_id, prd_se, start_prd, end_prd, filters),
+    )
+
+    if output == "arrow":
+        return table
+
+    df_stats = table.to_pandas()
+    if output == "typed":
+        df_stats = _kosis_typed_frame(df_stats)
+    return df_stats
+
+
+# ----------------------------------------------------------------------
+# Incremental refresh of KOSIS statistics tables
+# ----------------------------------------------------------------------
+# Columns identifying a row of get_kosis_stats output
+_KOSIS_STATS_KEY: List[str] = (
+    ["ORG_ID", "TBL_ID"] + [f"C{x}" for x in range(1, 9)] + ["ITM_ID", "PRD_SE", "PRD_DE"]
+)
+
+
+def _kosis_period_shift(prd_de: str, prd_se: str, n: int) -> Optional[str]:
+    """Move the KOSIS period *prd_de* by *n* periods of type *prd_se*."""
+    prd_de = re.sub(r"[^0-9]", "", str(prd_de))
+
+    if prd_se == "Y" and len(prd_de) == 4:
+        return str(int(prd_de) + n)
+
+    if prd_se == "D" and len(prd_de) == 8:
+        shifted = pd.Timestamp(prd_de) + pd.Timedelta(days=n)
+        return shifted.strftime("%Y%m%d")
+
+    per_year = {"H": 2, "Q": 4, "M": 12}.get(prd_se)
+    if per_year and len(prd_de) == 6:
+        pos = int(prd_de[:4]) * per_year + int(prd_de[4:]) - 1 + n
+        return f"{pos // per_year}{pos % per_year + 1:02d}"
+
+    return None
+
+
+def _kosis_date(value: Any) -> Optional[str]:
+    """Normalise a KOSIS date (``LST_CHN_DE``, ``send_de``) to YYYY-MM-DD."""
+    if value is None or (not isinstance(value, str) and pd.isna(value)):
+        return None
+    digits = re.sub(r"[^0-9]", "", str(value))[:8]
+    if len(digits) != 8:
+        return None
+    return f"{digits[:4]}-{digits[4:6]}-{digits[6:]}"
+
+
+def _data_update_watermark(data_id: str) -> Optional[pd.Series]:
+    """Latest ``mt_data_update`` row of *data_id* (``None`` when absent)."""
+    sql = f"""
+        SELECT data_prvdr_cycle, data_base_pov, data_update_date
+        FROM ecodi_meta.mt_data_update
+        WHERE data_id = '{data_id}'
+        ORDER BY data_base_pov DESC, data_update_date DESC;
+    """
+    df_update = getquery(sql, schema="meta")
+    if not isinstance(df_update, pd.DataFrame) or df_update.empty:
+        return None
+    return df_update.iloc[0]
+
+
+def refresh_kosis_stats(
+    data_id: str,
+    tbl_id: str,
+    org_id: str,
+    table_nm: str,
+    schema: str = "ods",
+    revision_prds: int = 2,
+    force: bool = False,
+    api_key: Optional[str] = None,
+    verbose: bool = False,
+    **kwargs: Any,
+) -> pd.DataFrame:
+    """
+    Refresh a stored KOSIS statistics table with the periods that changed.
+
+    The watermark of *data_id* in ``mt_data_update`` (latest period
+    ``data_base_pov`` and the KOSIS change date ``data_update_date``) is
+    compared with the ``send_de`` of the table in ``mt_kosis_stat``:
+
+    * unchanged tables are skipped without calling the data API;
+    * otherwise only the periods from the stored latest period minus
+      *revision_prds* (to pick up revisions of recent periods) onwards
+      are requested, upserted into *table_nm* and the new watermark is
+      recorded in ``mt_data_update``.
+
+    Without a watermark the whole table is pulled.
+
+    Parameters
+    ----------
+    data_id : str
+        Data identifier (``mt_data_list.data_id``) the watermark is kept under.
+    tbl_id, org_id : str
+        KOSIS table and organization.
+    table_nm : str
+        Target table of the statistics.
+    schema : str, default "ods"
+        Schema of *table_nm*.
+    revision_prds : int, default 2
+        Number of already stored periods that are fetched again.
+    force : bool, default False
+        Refresh even when the watermarks say nothing changed.
+    api_key, verbose
+        As in ``get_kosis_stats``.
+    **kwargs
+        Passed to ``get_kosis_stats`` (objL*, all_obj, ...).
+
+    Returns
+    -------
+    pd.DataFrame
+        The rows fetched (empty when skipped); ``attrs["status"]`` is
+        "skipped", "unchanged" or "refreshed" and ``attrs["watermark"]``
+        holds the recorded ``mt_data_update`` row.
+    """
+    if not data_id or not tbl_id or not org_id or not table_nm:
+        raise ValueError("'data_id', 'tbl_id', 'org_id' and 'table_nm' must be provided.")
+
+    watermark = _data_update_watermark(data_id)
+    send_de = _kosis_date(_kosis_send_de(tbl_id, org_id))
+
+    def _result(df: pd.DataFrame, status: str, record: Optional[Dict[str, Any]] = None):
+        df.attrs["status"] = status
+        df.attrs["watermark"] = record
+        if verbose:
+            print(f"KOSIS table {tbl_id} ({data_id}): {status}")
+        return df
+
+    # ------------------------------------------------------------------
+    # Skip tables KOSIS has not changed since the last refresh
+    # ------------------------------------------------------------------
+    if (
+        not force
+        and watermark is not None
+        and send_de is not None
+        and send_de <= str(watermark["data_update_date"])
+    ):
+        return _result(pd.DataFrame(), "skipped")
+
+    # ------------------------------------------------------------------
+    # Fetch the periods after the stored one (minus the revision window)
+    # ------------------------------------------------------------------
+    start_prd = None
+    if watermark is not None:
+        start_prd = _kosis_period_shift(
+            watermark["data_base_pov"], watermark["data_prvdr_cycle"], -revision_prds
+        )
+
+    df_stats = get_kosis_stats(
+        tbl_id=tbl_id,
+        org_id=org_id,
+        start_prd=start_prd,
+        all_prd=start_prd is None,
+        api_key=api_key,
+        verbose=verbose,
+        **kwargs,
+    )
+
+    if not isinstance(df_stats, pd.DataFrame):
+        # err 30: no data for the requested periods
+        if isinstance(df_stats, dict) and str(df_stats.get("err")) == "30":
+            return _result(pd.DataFrame(), "unchanged")
+        raise ValueError(f"KOSIS request failed: {df_stats}")
+
+    if df_stats.empty:
+        return _result(df_stats, "unchanged")
+
+    # ------------------------------------------------------------------
+    # New watermark
+    # ------------------------------------------------------------------
+    base_pov = str(df_stats["PRD_DE"].max())
+    update_date = None
+    if "LST_CHN_DE" in df_stats.columns:
+        update_date = _kosis_date(df_stats["LST_CHN_DE"].max())
+    update_date = update_date or send_de or datetime.now().strftime("%Y-%m-%d")
+
+    if (
+        not force
+        and watermark is not None
+        and base_pov <= str(watermark["data_base_pov"])
+        and update_date <= str(watermark["data_update_date"])
+    ):
+        return _result(df_stats, "unchanged")
+
+    # ------------------------------------------------------------------
+    # Upsert the rows and record the watermark
+    # ------------------------------------------------------------------
+    # The first upsert creates table_nm with its primary key on pk_cols
+    pk_cols = [col for col in _KOSIS_STATS_KEY if col in df_stats.columns]
+    if "PRD_DE" not in pk_cols:
+        raise ValueError(f"KOSIS response of {tbl_id} has no key columns {_KOSIS_STATS_KEY}.")
+    db_settable(name=table_nm, value=df_stats, schema=schema, mode="upsert", pk_cols=pk_cols)
+
+    if get_env("STATUS") == "0":
+        raise ValueError(f"Writing {table_nm} failed: {get_env('EMSG')}")
+
+    record = {
+        "data_id": data_id,
+        "data_prvdr_cycle": str(df_stats["PRD_SE"].iloc[0]),
+        "data_base_pov": base_pov,
+        "data_update_date": update_date,
+    }
+    db_settable(
+        name="mt_data_update",
+        value=pd.DataFrame([record]),
+        schema="meta",
+        mode="upsert",
+        pk_cols=["data_id", "data_prvdr_cycle", "data_base_pov"],
+    )
+
+    # Without the watermark the next refresh would pull the whole table
+    if get_env("STATUS") == "0":
+        raise ValueError(f"Recording the watermark of {data_id} failed: {get_env('EMSG')}")
+
+    return _result(df_stats, "refreshed", record)
+
+
+# Metadata types of get_kosis_info and the keys they are returned under
+KOSIS_INFO_TYPES: Dict[str, str] = {
+    "TBL": "info_tbl",
+    "ORG": "info_org",
+    "ITM": "info_itm",
+    "PRD": "info_prd",
+    "CMMT": "info_cmt",
+    "UNIT": "info_unt",
+    "SOURCE": "info_src",
+    "NCD": "info_ncd",
+}
+
+
+def _kosis_info_fanout(
+    pairs: List[tuple],
+    api_key: Optional[str],
+    timeout: Optional[float],
+    max_workers: int,
+    verbose: bool,
+) -> List[Dict[str, Any]]:
+    """
+    Fetch every metadata type of every (tbl_id, org_id) pair concurrently.
+
+    One result dictionary is returned per pair, in the order of *pairs*.
+    A type that fails (or times out) is returned as ``None`` and its error
+    message is recorded under the ``"errors"`` key of that dictionary.
+    """
+    results = [
+        dict({key: None for key in KOSIS_INFO_TYPES.values()}, errors={})
+        for _ in pairs
+    ]
+
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        futures = {
+            executor.submit(
+                desc_kosis_stats,
+                tbl_id=tbl_id,
+                org_id=org_id,
+                type_=type_name,
+                api_key=api_key,
+                verbose=verbose,
+                timeout=timeout,
+            ): (idx, type_name)
+            for idx, (tbl_id, org_id) in enumerate(pairs)
+            for type_name in KOSIS_INFO_TYPES
+        }
+
+        for future in as_completed(futures):
+            idx, type_name = futures[future]
+            try:
+                results[idx][KOSIS_INFO_TYPES[type_name]] = future.result()
+            except Exception as e:
+                results[idx]["errors"][type_name] = str(e)
+                if verbose:
+                    logging.info(f"KOSIS {type_name} metadata of {pairs[idx]} failed: {e}")
+
+    return results
+
+
 def get_kosis_info(
     tbl_id: Optional[str] = None,
     org_id: Optional[str] = None,
     api_key: Optional[str] = None,
     verbose: bool = False,
+    timeout: Optional[float] = 30,
+    max_workers: int = 8,
 ) -> Dict[str, Any]:
     """
     Retrieve various KOSIS metadata for a given table and organization.
 
+    The eight metadata types are requested concurrently. A type that fails
+    does not discard the others: it is returned as ``None`` and the error
+    message is kept in ``result["errors"]``.
+
     Parameters
     ----------
     tbl_id : str, optional
@@ -488,16 +1541,18 @@ def get_kosis_info(
         ``KOSIS_API_KEY`` is used.
     verbose : bool, default False
         If ``True`` enables verbose output in the underlying API calls.
-    **kwargs
-        Additional arguments passed to ``desc_kosis_stats`` (kept for
-        compatibility with the original R ``...`` argument).
+    timeout : float, default 30
+        Read timeout in seconds of each metadata request.
+    max_workers : int, default 8
+        Number of concurrent requests.
 
     Returns
     -------
     dict
         A dictionary containing the metadata objects for the requested
         table, organization, items, products, comments, units, sources,
-        and non‑code dimensions.
+        and non‑code dimensions, plus an ``errors`` dictionary keyed by
+        metadata type.
     """
     # Resolve API key from environment if not explicitly provided
     if api_key is None:
@@ -507,37 +1562,45 @@ def get_kosis_info(
     if tbl_id is None or org_id is None:
         raise ValueError("Both 'tbl_id' and 'org_id' must be provided.")
 
-    # Helper to call the (assumed) Python version of `desc_kosis_stats`
-    def _fetch(type_name: str) -> Any:
-        return desc_kosis_stats(
-            tbl_id=tbl_id,
-            org_id=org_id,
-            type_=type_name,
-            api_key=api_key,
-            verbose=verbose,
-        )
+    return _kosis_info_fanout(
+        [(tbl_id, org_id)], api_key, timeout, max_workers, verbose
+    )[0]
 
-    # Retrieve each piece of information
-    info_tbl = _fetch("TBL")
-    info_org = _fetch("ORG")
-    info_itm = _fetch("ITM")
-    info_prd = _fetch("PRD")
-    info_cmt = _fetch("CMMT")
-    info_unt = _fetch("UNIT")
-    info_src = _fetch("SOURCE")
-    info_ncd = _fetch("NCD")
-
-    # Assemble results in a dictionary (mirrors R's named list)
-    return {
-        "info_tbl": info_tbl,
-        "info_org": info_org,
-        "info_itm": info_itm,
-        "info_prd": info_prd,
-        "info_cmt": info_cmt,
-        "info_unt": info_unt,
-        "info_src": info_src,
-        "info_ncd": info_ncd,
-    }
+
+def get_kosis_info_many(
+    pairs: List[tuple],
+    api_key: Optional[str] = None,
+    verbose: bool = False,
+    timeout: Optional[float] = 30,
+    max_workers: int = 8,
+) -> Dict[tuple, Dict[str, Any]]:
+    """
+    Retrieve the KOSIS metadata of many tables at once.
+
+    Parameters
+    ----------
+    pairs : list of (tbl_id, org_id)
+        Tables to describe. Duplicated pairs are fetched once.
+    api_key, verbose, timeout, max_workers
+        As in ``get_kosis_info``; *max_workers* bounds the requests in
+        flight across all pairs.
+
+    Returns
+    -------
+    dict
+        ``{(tbl_id, org_id): info}`` where *info* is the dictionary
+        returned by ``get_kosis_info``.
+    """
+    if api_key is None:
+        api_key = os.getenv("KOSIS_API_KEY")
+
+    pairs = list(dict.fromkeys((str(t), str(o)) for t, o in pairs))
+    if not pairs:
+        return {}
+
+    results = _kosis_info_fanout(pairs, api_key, timeout, max_workers, verbose)
+
+    return dict(zip(pairs, results))
 
 
 import os
@@ -602,7 +1665,7 @@ def get_kosis_explanation(
         logging.info(f"KOSIS API URL: {api_url}")
 
     # Perform request
-    response = requests.get(api_url, timeout=30)
+    response = http_get(api_url, timeout=30)
     response.raise_for_status()
     result_json = response.json()
 
@@ -684,17 +1747,178 @@ def get_kosis_explanation(
     }
     df = df.rename(columns=rename_map)
 
-    # Attach the provided STAT_ID as a new column
-    df.insert(0, "STAT_ID", stat_id)
+    # Attach the provided STAT_ID as a new column
+    df.insert(0, "STAT_ID", stat_id)
+
+    return df
+
+
+def import_kosis_statexpl(
+    stat_ids: Optional[List[str]] = None,
+    only: str = "missing",
+    max_age_days: int = 90,
+    max_workers: int = 4,
+    rate: float = 5.0,
+    batch_size: int = 200,
+    api_key: Optional[str] = None,
+    verbose: bool = True,
+) -> pd.DataFrame:
+    """
+    Import KOSIS statistics explanations into `mt_kosis_statexpl`.
+
+    The explanations are fetched with *max_workers* threads, throttled to
+    *rate* requests per second, and upserted on ``stat_id`` every
+    *batch_size* results.
+
+    Parameters
+    ----------
+    stat_ids : list of str, optional
+        Statistics to import. Defaults to the distinct ``stat_id`` values
+        of `mt_kosis_stat`, filtered by *only*.
+    only : {"missing", "stale", "all"}, default "missing"
+        "missing" imports the stat_ids without an explanation, "stale"
+        also those stored before the latest ``send_de`` of their tables
+        or more than *max_age_days* ago, "all" every stat_id.
+    max_age_days : int, default 90
+        Age after which a stored explanation is stale.
+    max_workers : int, default 4
+        Number of concurrent requests.
+    rate : float, default 5.0
+        Maximum number of requests per second.
+    batch_size : int, default 200
+        Number of explanations per write.
+    api_key : str, optional
+        KOSIS API key. If omitted, taken from the KOSIS_API_KEY environment variable.
+    verbose : bool, default True
+        Whether to print progress and throughput.
+
+    Returns
+    -------
+    pd.DataFrame
+        One row per stat_id: ``stat_id``, ``status`` ("1" imported, "0"
+        failed) and ``error_msg``. ``attrs`` holds ``requested``,
+        ``imported``, ``failed``, ``elapsed`` (seconds) and ``per_sec``.
+    """
+    if only not in {"missing", "stale", "all"}:
+        raise ValueError("only must be one of {'missing', 'stale', 'all'}")
+
+    schema = "meta"
+    table_id = "mt_kosis_statexpl"
+
+    # ------------------------------------------------------------------
+    # stat_ids to import
+    # ------------------------------------------------------------------
+    if stat_ids is None:
+        sql = """
+            SELECT s.stat_id,
+                   MAX(s.send_de) AS send_de,
+                   MAX(COALESCE(e.mdfy_dt, e.cret_dt)) AS stored_dt
+            FROM ecodi_meta.mt_kosis_stat s
+            LEFT JOIN ecodi_meta.mt_kosis_statexpl e
+              ON e.stat_id = s.stat_id
+            WHERE s.stat_id <> ''
+            GROUP BY s.stat_id
+            ORDER BY s.stat_id;
+        """
+        df_ids = getquery(sql, schema=schema)
+        stored_dt = pd.to_datetime(df_ids["stored_dt"])
+
+        if only == "all":
+            selected = pd.Series(True, index=df_ids.index)
+        else:
+            selected = stored_dt.isna()
+            if only == "stale":
+                send_dt = pd.to_datetime(
+                    df_ids["send_de"].astype(str).str.replace(r"[^0-9]", "", regex=True).str[:8],
+                    format="%Y%m%d",
+                    errors="coerce",
+                )
+                selected |= stored_dt < send_dt
+                selected |= stored_dt < datetime.now() - pd.Timedelta(days=max_age_days)
+        stat_ids = df_ids.loc[selected, "stat_id"].tolist()
+
+    stat_ids = list(dict.fromkeys(str(stat_id) for stat_id in stat_ids if stat_id))
+
+    limiter = RateLimiter(rate, burst=max_workers)
+    started = time.monotonic()
+    errors: Dict[str, str] = {}
+    imported: List[str] = []
+    pending: List[pd.DataFrame] = []
+
+    def _fetch(stat_id: str) -> pd.DataFrame:
+        limiter.acquire()
+        explain = get_kosis_explanation(stat_id=stat_id, api_key=api_key)
+        if not isinstance(explain, pd.DataFrame):
+            raise ValueError(str(explain.get("errMsg", explain)) if isinstance(explain, dict) else str(explain))
+        if explain.empty:
+            raise ValueError("No data retrieved")
+        return explain
+
+    def _write(frames: List[pd.DataFrame]) -> None:
+        df_data = pd.concat(frames, ignore_index=True).drop_duplicates(subset=["STAT_ID"], keep="last")
+        df_data["STAT_NM"] = df_data["STAT_NM"].fillna("")
+        db_settable(name=table_id, value=df_data, schema=schema, mode="upsert", pk_cols=["STAT_ID"])
+
+        ids = df_data["STAT_ID"].astype(str).tolist()
+        if get_env("STATUS") == "0":
+            errors.update({stat_id: str(get_env("EMSG")) for stat_id in ids})
+        else:
+            imported.extend(ids)
 
-    return df
+    # ------------------------------------------------------------------
+    # Fetch concurrently, write in batches from this thread
+    # ------------------------------------------------------------------
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        futures = {executor.submit(_fetch, stat_id): stat_id for stat_id in stat_ids}
+
+        for done, future in enumerate(as_completed(futures), start=1):
+            stat_id = futures[future]
+            try:
+                pending.append(future.result())
+            except Exception as exc:
+                errors[stat_id] = str(exc)
+
+            if len(pending) >= batch_size:
+                _write(pending)
+                pending = []
+
+            if verbose and done % batch_size == 0:
+                print(f"{done}/{len(stat_ids)} explanations fetched, {len(errors)} failed")
+
+        if pending:
+            _write(pending)
+
+    elapsed = time.monotonic() - started
+
+    result = pd.DataFrame(
+        [{"stat_id": stat_id,
+          "status": "0" if stat_id in errors else "1",
+          "error_msg": errors.get(stat_id, "")} for stat_id in stat_ids],
+        columns=["stat_id", "status", "error_msg"],
+    )
+    result.attrs.update({
+        "requested": len(stat_ids),
+        "imported": len(imported),
+        "failed": len(errors),
+        "elapsed": round(elapsed, 3),
+        "per_sec": round(len(stat_ids) / elapsed, 2) if elapsed > 0 else 0.0,
+    })
+
+    if verbose:
+        print(
+            f"Imported {len(imported)} of {len(stat_ids)} explanations "
+            f"({len(errors)} failed) in {elapsed:.1f}s, "
+            f"{result.attrs['per_sec']} per second"
+        )
+
+    return result
   
 
 
 # ----------------------------------------------------------------------
 # Function: kosis_stats_list
 # ----------------------------------------------------------------------
-def kosis_stats_list(vw_cd: Optional[str] = None) -> pd.DataFrame:
+def kosis_stats_list(vw_cd: Optional[str] = None, use_index: bool = False) -> pd.DataFrame:
     """
     Retrieve statistics list. If `vw_cd` is not supplied the function returns
     the top‑level value‑sets; otherwise it returns the children of the given
@@ -704,12 +1928,25 @@ def kosis_stats_list(vw_cd: Optional[str] = None) -> pd.DataFrame:
     ----------
     vw_cd : str or None, default None
         Parent value‑set code.
+    use_index : bool, default False
+        When ``True`` the lists are taken from the in‑process catalog index
+        (see ``get_kosis_catalog``) instead of ``mt_api_paramset``.
 
     Returns
     -------
     pd.DataFrame
         Result of the SQL query.
     """
+    if use_index:
+        catalog = get_kosis_catalog()
+        if vw_cd is None:
+            result = catalog.rows[["vw_cd", "vw_nm"]].drop_duplicates("vw_cd")
+        else:
+            result = catalog.children(vw_cd)
+            result = result.loc[result["tbl_id"] == "", ["list_id", "list_nm"]]
+            result.columns = ["parent_id", "parent_nm"]
+        return result.reset_index(drop=True)
+
     if vw_cd is None:
         sql = """
             SELECT value_set AS vw_cd,
@@ -737,7 +1974,7 @@ DEFAULT_VW_CD_LEVEL1: List[str] = [
     "MT_STOP_TITLE", "MT_TM1_TITLE", "MT_TM2_TITLE"
 ]
 
-def kosis_list_level1(vw_cd: Optional[str] = None) -> pd.DataFrame:
+def kosis_list_level1(vw_cd: Optional[str] = None, use_index: bool = False) -> pd.DataFrame:
     """
     List level‑1 statistics for a selected `vw_cd`.
 
@@ -746,6 +1983,9 @@ def kosis_list_level1(vw_cd: Optional[str] = None) -> pd.DataFrame:
     vw_cd : str or None, default None
         One of the predefined statistic codes. If omitted, the first code in
         `DEFAULT_VW_CD_LEVEL1` is used.
+    use_index : bool, default False
+        When ``True`` the lists are taken from the in‑process catalog index
+        (see ``get_kosis_catalog``) instead of the database.
 
     Returns
     -------
@@ -758,6 +1998,11 @@ def kosis_list_level1(vw_cd: Optional[str] = None) -> pd.DataFrame:
     elif vw_cd not in DEFAULT_VW_CD_LEVEL1:
         raise ValueError(f"`vw_cd` must be one of {DEFAULT_VW_CD_LEVEL1}")
 
+    if use_index:
+        result = get_kosis_catalog().children(vw_cd)
+        result = result.loc[result["tbl_id"] == "", ["vw_cd", "vw_nm", "list_id", "list_nm"]]
+        return result.drop_duplicates().sort_values("list_id").reset_index(drop=True)
+
     sql = f"""
         SELECT vw_cd,
                vw_nm,
@@ -778,7 +2023,8 @@ def kosis_list_level1(vw_cd: Optional[str] = None) -> pd.DataFrame:
 # Function: kosis_list_parent
 # ----------------------------------------------------------------------
 def kosis_list_parent(vw_cd: Optional[str] = None,
-                      parent_id: Optional[str] = None) -> pd.DataFrame:
+                      parent_id: Optional[str] = None,
+                      use_index: bool = False) -> pd.DataFrame:
     """
     Retrieve statistics for a specific parent identifier.
 
@@ -789,6 +2035,9 @@ def kosis_list_parent(vw_cd: Optional[str] = None,
         If omitted, the first code in the default list is used.
     parent_id : str, required
         Identifier of the parent record. Must be supplied.
+    use_index : bool, default False
+        When ``True`` the lists are taken from the in‑process catalog index
+        (see ``get_kosis_catalog``) instead of the database.
 
     Returns
     -------
@@ -803,6 +2052,10 @@ def kosis_list_parent(vw_cd: Optional[str] = None,
     if parent_id is None:
         raise ValueError("'parent_id' must be provided.")
 
+    if use_index:
+        result = get_kosis_catalog().children(vw_cd, parent_id)
+        return result[result["tbl_id"] == ""].reset_index(drop=True)
+
     sql = f"""
         SELECT parent_id,
                vw_cd,
@@ -824,12 +2077,17 @@ def kosis_list_parent(vw_cd: Optional[str] = None,
     return getquery(sql, schema="meta")
   
   
+# Guard against cycles in the mt_kosis_stat hierarchy
+KOSIS_LIST_MAX_DEPTH: int = 32
+
+
 def kosis_list_stats(
     vw_cd: str = "MT_ZTITLE",
     parent_id: Optional[str] = None,
     parent_nm: Optional[str] = None,
     recursive: bool = False,
     verbose: bool = False,
+    use_index: bool = False,
 ) -> pd.DataFrame:
     """
     Retrieve KOSIS statistics metadata.
@@ -843,9 +2101,15 @@ def kosis_list_stats(
     parent_nm : str, optional
         Name of the parent node. If omitted it will be fetched from the DB.
     recursive : bool, default False
-        When ``True`` the function walks the hierarchy recursively.
+        When ``True`` the statistics of the whole subtree are returned,
+        fetched with a single ``WITH RECURSIVE`` query (PostgreSQL,
+        MySQL 8+); ``parent_nm`` then holds the ``parent > child`` path.
     verbose : bool, default False
         Verbosity flag (currently only used for printing info messages).
+    use_index : bool, default False
+        When ``True`` the parent name and the statistics are taken from the
+        in‑process catalog index (see ``get_kosis_catalog``) instead of
+        the database.
 
     Returns
     -------
@@ -868,10 +2132,16 @@ def kosis_list_stats(
     if parent_id is None:
         raise ValueError("'parent_id' must be provided.")
 
+    catalog = get_kosis_catalog() if use_index else None
+
     # --------------------------------------------------------------
     # Resolve parent name if it was not supplied
     # --------------------------------------------------------------
-    if parent_nm is None:
+    if parent_nm is None and catalog is not None:
+        parent_nm = catalog.name(vw_cd, parent_id)
+        if parent_nm is None:
+            raise ValueError("Parent name not found in the catalog index.")
+    elif parent_nm is None:
         sql = f"""
             SELECT list_nm AS parent_nm
             FROM ecodi_meta.mt_kosis_stat
@@ -889,17 +2159,22 @@ def kosis_list_stats(
     # Non‑recursive mode
     # --------------------------------------------------------------
     if not recursive:
-        sql = f"""
-            SELECT parent_id, vw_cd, vw_nm, list_id, list_nm, org_id,
-                   tbl_id, tbl_nm, stat_id, send_de, rec_tbl_se,
-                   '' AS path_nm
-            FROM ecodi_meta.mt_kosis_stat
-            WHERE 1 = 1
-              AND tbl_id <> ''
-              AND parent_id = '{parent_id}'
-              AND vw_cd = '{vw_cd}';
-            """
-        result = getquery(sql, schema="meta")
+        if catalog is not None:
+            result = catalog.children(vw_cd, parent_id)
+            result = result[result["tbl_id"] != ""].reset_index(drop=True)
+            result["path_nm"] = ""
+        else:
+            sql = f"""
+                SELECT parent_id, vw_cd, vw_nm, list_id, list_nm, org_id,
+                       tbl_id, tbl_nm, stat_id, send_de, rec_tbl_se,
+                       '' AS path_nm
+                FROM ecodi_meta.mt_kosis_stat
+                WHERE 1 = 1
+                  AND tbl_id <> ''
+                  AND parent_id = '{parent_id}'
+                  AND vw_cd = '{vw_cd}';
+                """
+            result = getquery(sql, schema="meta")
 
         if result.empty:
             raise ValueError(
@@ -917,15 +2192,60 @@ def kosis_list_stats(
         return result
 
     # --------------------------------------------------------------
-    # Recursive mode
+    # Recursive mode: the whole subtree in one WITH RECURSIVE query
     # --------------------------------------------------------------
+    if catalog is not None:
+        result = catalog.subtree(vw_cd, parent_id, parent_nm=parent_nm)
+        if result.empty:
+            raise ValueError(
+                "Data not found. Please set 'recursive=True' to retrieve all "
+                "statistics information under the specified parent ID."
+            )
+        return result
+
+    dbms = get_env("ecoDI_DBMS") or "postgresql"
+    root_nm = str(parent_nm).replace("'", "''")
+
+    text_type = "CHAR(4000)" if dbms == "mysql" else "TEXT"
+
+    def concat(*args: str) -> str:
+        # MySQL treats || as OR unless PIPES_AS_CONCAT is set
+        if dbms == "mysql":
+            return f"CONCAT({', '.join(args)})"
+        return " || ".join(args)
+
     sql = f"""
-        SELECT parent_id, vw_cd, vw_nm, list_id, list_nm, org_id,
+        WITH RECURSIVE stat_tree AS (
+            SELECT s.parent_id, s.vw_cd, s.vw_nm, s.list_id, s.list_nm, s.org_id,
+                   s.tbl_id, s.tbl_nm, s.stat_id, s.send_de, s.rec_tbl_se,
+                   CAST(CASE WHEN s.list_nm IS NULL THEN '{root_nm}'
+                             ELSE {concat(f"'{root_nm}'", "' > '", "s.list_nm")}
+                        END AS {text_type}) AS parent_nm,
+                   CAST('' AS {text_type}) AS id_path,
+                   1 AS depth
+            FROM ecodi_meta.mt_kosis_stat s
+            WHERE s.parent_id = '{parent_id}'
+              AND s.vw_cd = '{vw_cd}'
+            UNION ALL
+            SELECT c.parent_id, c.vw_cd, c.vw_nm, c.list_id, c.list_nm, c.org_id,
+                   c.tbl_id, c.tbl_nm, c.stat_id, c.send_de, c.rec_tbl_se,
+                   CAST(CASE WHEN c.list_nm IS NULL THEN t.parent_nm
+                             ELSE {concat("t.parent_nm", "' > '", "c.list_nm")}
+                        END AS {text_type}),
+                   CAST({concat("t.id_path", "'>'", "t.list_id")} AS {text_type}),
+                   t.depth + 1
+            FROM ecodi_meta.mt_kosis_stat c
+            JOIN stat_tree t
+              ON c.parent_id = t.list_id
+             AND c.vw_cd = t.vw_cd
+            WHERE t.tbl_id = ''
+              AND t.depth < {KOSIS_LIST_MAX_DEPTH}
+        )
+        SELECT parent_nm, parent_id, vw_cd, vw_nm, list_id, list_nm, org_id,
                tbl_id, tbl_nm, stat_id, send_de, rec_tbl_se
-        FROM ecodi_meta.mt_kosis_stat
-        WHERE 1 = 1
-          AND parent_id = '{parent_id}'
-          AND vw_cd = '{vw_cd}';
+        FROM stat_tree
+        WHERE tbl_id <> ''
+        ORDER BY id_path, list_id, tbl_id;
         """
     result = getquery(sql, schema="meta")
 
@@ -935,42 +2255,747 @@ def kosis_list_stats(
             "statistics information under the specified parent ID."
         )
 
-    # Build hierarchical name (parent_nm > list_nm) when list_nm exists
-    result["parent_nm"] = result.apply(
-        lambda row: parent_nm
-        if pd.isna(row["list_nm"])
-        else f'{parent_nm} > {row["list_nm"]}',
-        axis=1,
+    if verbose:
+        print(f"Retrieved {len(result)} statistics under parent_id: {parent_id}")
+
+    return result
+
+
+# ----------------------------------------------------------------------
+# In‑memory index of the KOSIS statistics catalog (mt_kosis_stat)
+# ----------------------------------------------------------------------
+_CATALOG_COLUMNS: List[str] = [
+    "parent_id", "vw_cd", "vw_nm", "list_id", "list_nm", "org_id",
+    "tbl_id", "tbl_nm", "stat_id", "send_de", "rec_tbl_se",
+]
+
+# Bumped whenever the layout of KosisCatalogIndex changes
+_CATALOG_SNAPSHOT_FORMAT: int = 1
+
+
+def _kosis_catalog_version() -> tuple:
+    """Version of ``mt_kosis_stat``: row count and max ``cret_dt`` / ``mdfy_dt``."""
+    sql = """
+        SELECT COUNT(*) AS cnt,
+               MAX(cret_dt) AS max_cret_dt,
+               MAX(mdfy_dt) AS max_mdfy_dt
+        FROM ecodi_meta.mt_kosis_stat;
+    """
+    df_version = getquery(sql, schema="meta")
+    return tuple(str(v) for v in df_version.iloc[0].tolist())
+
+
+class KosisCatalogIndex:
+    """
+    Parent/child index of ``mt_kosis_stat`` held in memory.
+
+    Rows are kept in a DataFrame; the hierarchy is stored as a CSR style
+    adjacency (``offsets`` / ``order`` integer arrays) in which every
+    ``vw_cd`` has its own virtual root node, so children, ancestors,
+    subtree and path lookups do not touch the database.
+    """
+
+    def __init__(self, rows: pd.DataFrame, version: tuple = ()):
+        rows = rows.reindex(columns=_CATALOG_COLUMNS).reset_index(drop=True)
+        for col in ("parent_id", "list_id", "tbl_id"):
+            rows[col] = rows[col].fillna("").astype(str)
+
+        n_rows = len(rows)
+        vw_cd = rows["vw_cd"].astype(str).to_numpy()
+        list_id = rows["list_id"].to_numpy()
+        parent_id = rows["parent_id"].to_numpy()
+        is_container = (rows["tbl_id"] == "").to_numpy()
+
+        # Node ids: rows are 0..n_rows-1, virtual roots follow
+        self._roots: Dict[str, int] = {
+            vw: n_rows + idx for idx, vw in enumerate(pd.unique(vw_cd))
+        }
+        self._node_of: Dict[tuple, int] = {(vw, ""): node for vw, node in self._roots.items()}
+        for idx in np.flatnonzero(is_container):
+            self._node_of.setdefault((vw_cd[idx], list_id[idx]), int(idx))
+
+        # Parent node of every row (-1 for rows whose parent is missing)
+        parent = np.fromiter(
+            (self._node_of.get((vw, pid), -1) for vw, pid in zip(vw_cd, parent_id)),
+            dtype=np.int64,
+            count=n_rows,
+        )
+
+        linked = np.flatnonzero(parent >= 0)
+        counts = np.bincount(parent[linked], minlength=n_rows + len(self._roots))
+
+        self._parent = parent
+        self._order = linked[np.argsort(parent[linked], kind="stable")]
+        self._offsets = np.zeros(len(counts) + 1, dtype=np.int64)
+        np.cumsum(counts, out=self._offsets[1:])
+
+        self.n_rows = n_rows
+        self.rows = rows
+        self.version = version
+
+    # ------------------------------------------------------------------
+    # Construction / snapshots
+    # ------------------------------------------------------------------
+    @classmethod
+    def from_db(cls) -> "KosisCatalogIndex":
+        """Build the index from ``ecodi_meta.mt_kosis_stat``."""
+        version = _kosis_catalog_version()
+        sql = f"""
+            SELECT {', '.join(_CATALOG_COLUMNS)}
+            FROM ecodi_meta.mt_kosis_stat
+            ORDER BY vw_cd, parent_id, list_id, tbl_id;
+        """
+        return cls(getquery(sql, schema="meta"), version=version)
+
+    def save(self, path: str) -> None:
+        """Write a snapshot of the index to *path*."""
+        with open(path, "wb") as f:
+            pickle.dump((_CATALOG_SNAPSHOT_FORMAT, self), f, protocol=pickle.HIGHEST_PROTOCOL)
+
+    @classmethod
+    def load(cls, path: str) -> Optional["KosisCatalogIndex"]:
+        """Read a snapshot written by ``save``; ``None`` if unusable."""
+        try:
+            with open(path, "rb") as f:
+                fmt, index = pickle.load(f)
+        except Exception:
+            return None
+        if fmt != _CATALOG_SNAPSHOT_FORMAT or not isinstance(index, cls):
+            return None
+        return index
+
+    def is_current(self) -> bool:
+        """Whether ``mt_kosis_stat`` is unchanged since the index was built."""
+        return self.version == _kosis_catalog_version()
+
+    # ------------------------------------------------------------------
+    # Lookups
+    # ------------------------------------------------------------------
+    def _node(self, vw_cd: str, list_id: str) -> int:
+        node = self._node_of.get((vw_cd, list_id or ""))
+        if node is None:
+            raise ValueError(f"'{list_id}' is not a list of '{vw_cd}'.")
+        return node
+
+    def _children(self, node: int) -> np.ndarray:
+        return self._order[self._offsets[node]:self._offsets[node + 1]]
+
+    def _ancestors(self, node: int) -> List[int]:
+        nodes = []
+        while 0 <= node < self.n_rows and len(nodes) < KOSIS_LIST_MAX_DEPTH:
+            nodes.append(node)
+            node = int(self._parent[node])
+        return nodes[::-1]
+
+    def children(self, vw_cd: str, parent_id: str = "") -> pd.DataFrame:
+        """Direct children of *parent_id* (level 1 lists when omitted)."""
+        return self.rows.iloc[self._children(self._node(vw_cd, parent_id))]
+
+    def ancestors(self, vw_cd: str, list_id: str) -> pd.DataFrame:
+        """The lists from the top level down to *list_id* (inclusive)."""
+        return self.rows.iloc[self._ancestors(self._node(vw_cd, list_id))]
+
+    def name(self, vw_cd: str, list_id: str) -> Optional[str]:
+        """``list_nm`` of *list_id*, or ``None`` if it is not a list of *vw_cd*."""
+        node = self._node_of.get((vw_cd, list_id or ""))
+        if node is None or node >= self.n_rows:
+            return None
+        return self.rows.at[node, "list_nm"]
+
+    def path(self, vw_cd: str, list_id: str, sep: str = " > ") -> str:
+        """Names of the lists from the top level down to *list_id*."""
+        names = self.ancestors(vw_cd, list_id)["list_nm"].dropna()
+        return sep.join(names.astype(str))
+
+    def subtree(
+        self,
+        vw_cd: str,
+        parent_id: str,
+        parent_nm: Optional[str] = None,
+        tables_only: bool = True,
+    ) -> pd.DataFrame:
+        """
+        All rows below *parent_id*, with the ``parent > child`` path in
+        ``parent_nm`` (same layout as ``kosis_list_stats(recursive=True)``).
+        """
+        root = self._node(vw_cd, parent_id)
+        if parent_nm is None:
+            parent_nm = self.path(vw_cd, parent_id)
+
+        list_nm = self.rows["list_nm"].to_numpy()
+        is_container = (self.rows["tbl_id"] == "").to_numpy()
+
+        rows, names = [], []
+        stack = [(root, parent_nm, 0)]
+        while stack:
+            node, node_nm, depth = stack.pop()
+            containers = []
+            for child in self._children(node):
+                child_nm = node_nm if pd.isna(list_nm[child]) else f"{node_nm} > {list_nm[child]}"
+                if is_container[child]:
+                    if depth + 1 < KOSIS_LIST_MAX_DEPTH:
+                        containers.append((int(child), child_nm, depth + 1))
+                    if tables_only:
+                        continue
+                rows.append(child)
+                names.append(child_nm)
+            # Depth‑first, in list order
+            stack.extend(reversed(containers))
+
+        result = self.rows.iloc[rows].reset_index(drop=True)
+        result.insert(0, "parent_nm", names)
+        return result
+
+
+# Seconds between two version checks of the in‑process catalog index
+KOSIS_CATALOG_CHECK_INTERVAL = 300.0
+
+_catalog_index: Optional[KosisCatalogIndex] = None
+_catalog_checked = 0.0
+_catalog_lock = threading.Lock()
+
+
+def get_kosis_catalog(
+    snapshot: Optional[str] = None,
+    refresh: bool = False,
+    check_version: bool = True,
+) -> KosisCatalogIndex:
+    """
+    Return the in‑process ``KosisCatalogIndex``, loading it on first use.
+
+    Parameters
+    ----------
+    snapshot : str, optional
+        Snapshot file. When it exists and matches the current version of
+        ``mt_kosis_stat`` it is loaded instead of querying the table;
+        otherwise the index is rebuilt and the snapshot rewritten.
+    refresh : bool, default False
+        Rebuild the index from the database unconditionally.
+    check_version : bool, default True
+        Compare the loaded index with the max ``cret_dt`` / ``mdfy_dt``
+        (and row count) of ``mt_kosis_stat`` and rebuild it when stale.
+        The check runs at most once every ``KOSIS_CATALOG_CHECK_INTERVAL``
+        seconds; in between the index is returned without any query.
+
+    Returns
+    -------
+    KosisCatalogIndex
+    """
+    global _catalog_index, _catalog_checked
+
+    with _catalog_lock:
+        index = None if refresh else _catalog_index
+        now = time.monotonic()
+
+        if index is not None and (
+            not check_version or now - _catalog_checked < KOSIS_CATALOG_CHECK_INTERVAL
+        ):
+            return index
+
+        version = _kosis_catalog_version()
+        _catalog_checked = now
+
+        if index is not None and index.version != version:
+            index = None
+
+        if index is None and snapshot and not refresh and os.path.exists(snapshot):
+            index = KosisCatalogIndex.load(snapshot)
+            if index is not None and index.version != version:
+                index = None
+
+        if index is None:
+            index = KosisCatalogIndex.from_db()
+            if snapshot:
+                index.save(snapshot)
+
+        _catalog_index = index
+        return index
+
+
+# ----------------------------------------------------------------------
+# Full‑text search over the KOSIS catalog
+# ----------------------------------------------------------------------
+# Explanation columns of mt_kosis_statexpl included in the search text
+_SEARCH_EXPL_COLUMNS: List[str] = [
+    "stat_nm", "writing_purps", "josa_itm", "main_term_expl",
+]
+
+# Weight of a matching n‑gram per field (title = tbl_nm / list_nm)
+_SEARCH_FIELD_WEIGHTS: Dict[str, float] = {"title": 1.0, "expl": 0.2}
+
+_SEARCH_SPLIT = re.compile(r"[^0-9a-z가-힣]+")
+
+_SEARCH_SNAPSHOT_FORMAT: int = 1
+
+
+def _kosis_ngrams(text: Any, n: int = 2) -> List[str]:
+    """Character n‑grams of the words of *text* (shorter words kept whole)."""
+    if text is None or (not isinstance(text, str) and pd.isna(text)):
+        return []
+
+    grams = []
+    for word in _SEARCH_SPLIT.split(str(text).lower()):
+        if len(word) < n:
+            if word:
+                grams.append(word)
+        else:
+            grams.extend(word[i:i + n] for i in range(len(word) - n + 1))
+    return grams
+
+
+def _kosis_search_rows(since: Optional[str] = None) -> pd.DataFrame:
+    """Catalog rows with their explanation text, optionally changed after *since*."""
+    where = ""
+    if since:
+        where = f"""
+            WHERE COALESCE(s.mdfy_dt, s.cret_dt) > '{since}'
+               OR COALESCE(e.mdfy_dt, e.cret_dt) > '{since}'"""
+
+    sql = f"""
+        SELECT s.parent_id, s.vw_cd, s.vw_nm, s.list_id, s.list_nm,
+               s.org_id, s.tbl_id, s.tbl_nm, s.stat_id,
+               {', '.join(f'e.{col}' for col in _SEARCH_EXPL_COLUMNS)}
+        FROM ecodi_meta.mt_kosis_stat s
+        LEFT JOIN ecodi_meta.mt_kosis_statexpl e
+          ON e.stat_id = s.stat_id{where};
+    """
+    return getquery(sql, schema="meta")
+
+
+def _kosis_search_watermark() -> Optional[str]:
+    """Latest change time over ``mt_kosis_stat`` and ``mt_kosis_statexpl``."""
+    sql = """
+        SELECT MAX(COALESCE(mdfy_dt, cret_dt)) AS changed_dt FROM ecodi_meta.mt_kosis_stat
+        UNION ALL
+        SELECT MAX(COALESCE(mdfy_dt, cret_dt)) AS changed_dt FROM ecodi_meta.mt_kosis_statexpl;
+    """
+    changed = pd.to_datetime(getquery(sql, schema="meta")["changed_dt"]).dropna()
+    return None if changed.empty else str(changed.max())
+
+
+class KosisSearchIndex:
+    """
+    Inverted index of character bigrams over the KOSIS catalog.
+
+    Every ``mt_kosis_stat`` row is a document whose title is its
+    ``tbl_nm`` (or ``list_nm``) and whose body is the explanation of its
+    survey in ``mt_kosis_statexpl``. Bigrams make partial Korean words
+    match; documents are ranked by the idf weighted sum of the matching
+    bigrams, title matches counting more than explanation matches.
+    """
+
+    _KEY = ["parent_id", "vw_cd", "list_id", "tbl_id"]
+
+    def __init__(self):
+        self.docs = pd.DataFrame()
+        self.watermark: Optional[str] = None
+        self._doc_of: Dict[tuple, int] = {}
+        self._alive = np.zeros(0, dtype=bool)
+        self._titles: List[str] = []
+        self._postings: Dict[str, tuple] = {}
+
+    # ------------------------------------------------------------------
+    # Indexing
+    # ------------------------------------------------------------------
+    def add(self, rows: pd.DataFrame) -> int:
+        """Index *rows*, replacing documents with the same key. Returns the count."""
+        if rows is None or rows.empty:
+            return 0
+
+        rows = rows.reset_index(drop=True).copy()
+        for col in self._KEY:
+            rows[col] = rows[col].fillna("").astype(str)
+
+        # Documents indexed before are retired, not rewritten
+        keys = list(rows[self._KEY].itertuples(index=False, name=None))
+        retired = [self._doc_of[k] for k in keys if k in self._doc_of]
+        if retired:
+            self._alive[retired] = False
+
+        first_id = len(self._titles)
+        new_postings: Dict[str, tuple] = {}
+
+        for offset, row in enumerate(rows.itertuples(index=False)):
+            doc_id = first_id + offset
+            title = row.tbl_nm if row.tbl_id else row.list_nm
+            title = "" if title is None or pd.isna(title) else str(title)
+            self._titles.append(_SEARCH_SPLIT.sub("", title.lower()))
+
+            weights: Dict[str, float] = {}
+            for gram in _kosis_ngrams(title):
+                weights[gram] = weights.get(gram, 0.0) + _SEARCH_FIELD_WEIGHTS["title"]
+            for col in _SEARCH_EXPL_COLUMNS:
+                for gram in _kosis_ngrams(getattr(row, col, None)):
+                    weights[gram] = weights.get(gram, 0.0) + _SEARCH_FIELD_WEIGHTS["expl"]
+
+            for gram, weight in weights.items():
+                ids, ws = new_postings.setdefault(gram, ([], []))
+                ids.append(doc_id)
+                # Dampen repeated n‑grams (long explanations)
+                ws.append(np.log1p(weight))
+
+        for gram, (ids, ws) in new_postings.items():
+            ids = np.asarray(ids, dtype=np.int32)
+            ws = np.asarray(ws, dtype=np.float32)
+            if gram in self._postings:
+                old_ids, old_ws = self._postings[gram]
+                ids, ws = np.concatenate([old_ids, ids]), np.concatenate([old_ws, ws])
+            self._postings[gram] = (ids, ws)
+
+        self._doc_of.update({k: first_id + i for i, k in enumerate(keys)})
+        self._alive = np.concatenate([self._alive, np.ones(len(rows), dtype=bool)])
+        self.docs = pd.concat([self.docs, rows], ignore_index=True)
+
+        return len(rows)
+
+    @classmethod
+    def from_db(cls) -> "KosisSearchIndex":
+        """Build the index over the whole catalog."""
+        index = cls()
+        index.watermark = _kosis_search_watermark()
+        index.add(_kosis_search_rows())
+        return index
+
+    def update(self) -> int:
+        """Index the rows added or modified since the last build/update."""
+        watermark = _kosis_search_watermark()
+        if watermark is None or watermark == self.watermark:
+            return 0
+
+        count = self.add(_kosis_search_rows(since=self.watermark))
+        self.watermark = watermark
+        return count
+
+    def save(self, path: str) -> None:
+        """Write a snapshot of the index to *path*."""
+        with open(path, "wb") as f:
+            pickle.dump((_SEARCH_SNAPSHOT_FORMAT, self), f, protocol=pickle.HIGHEST_PROTOCOL)
+
+    @classmethod
+    def load(cls, path: str) -> Optional["KosisSearchIndex"]:
+        """Read a snapshot written by ``save``; ``None`` if unusable."""
+        try:
+            with open(path, "rb") as f:
+                fmt, index = pickle.load(f)
+        except Exception:
+            return None
+        if fmt != _SEARCH_SNAPSHOT_FORMAT or not isinstance(index, cls):
+            return None
+        return index
+
+    # ------------------------------------------------------------------
+    # Query
+    # ------------------------------------------------------------------
+    def search(
+        self,
+        query: str,
+        limit: int = 20,
+        tables_only: bool = True,
+        vw_cd: Optional[str] = None,
+    ) -> pd.DataFrame:
+        """
+        Documents matching *query*, best first, with a ``score`` column.
+        """
+        grams = set(_kosis_ngrams(query))
+        n_docs = len(self._titles)
+        if not grams or not n_docs:
+            return self.docs.head(0).assign(score=pd.Series(dtype="float32"))
+
+        n_alive = max(1, int(self._alive.sum()))
+        scores = np.zeros(n_docs, dtype=np.float32)
+        for gram in grams:
+            posting = self._postings.get(gram)
+            if posting is None:
+                continue
+            ids, ws = posting
+            idf = np.log1p(n_alive / len(ids))
+            np.add.at(scores, ids, ws * idf)
+
+        mask = self._alive & (scores > 0)
+        if tables_only:
+            mask &= (self.docs["tbl_id"] != "").to_numpy()
+        if vw_cd is not None:
+            mask &= (self.docs["vw_cd"] == vw_cd).to_numpy()
+
+        candidates = np.flatnonzero(mask)
+        if candidates.size > limit:
+            top = np.argpartition(-scores[candidates], limit)[:limit]
+            candidates = candidates[top]
+
+        # Whole query found in the title ranks first
+        phrase = _SEARCH_SPLIT.sub("", str(query).lower())
+        bonus = np.array([phrase in self._titles[i] for i in candidates], dtype=np.float32)
+        final = scores[candidates] + bonus * scores.max()
+
+        order = candidates[np.argsort(-final, kind="stable")]
+        result = self.docs.iloc[order].reset_index(drop=True)
+        result["score"] = np.sort(final)[::-1]
+        return result
+
+
+_search_index: Optional[KosisSearchIndex] = None
+
+
+def search_kosis_stats(
+    query: str,
+    limit: int = 20,
+    tables_only: bool = True,
+    vw_cd: Optional[str] = None,
+    snapshot: Optional[str] = None,
+    refresh: bool = False,
+    update: bool = False,
+) -> pd.DataFrame:
+    """
+    Search the KOSIS catalog by table/list name and survey explanation.
+
+    Parameters
+    ----------
+    query : str
+        Search words; partial Korean words match (character bigrams).
+    limit : int, default 20
+        Maximum number of results.
+    tables_only : bool, default True
+        Return statistics tables only (not the lists containing them).
+    vw_cd : str, optional
+        Restrict the results to one view code.
+    snapshot : str, optional
+        Index file. Loaded when present (then brought up to date
+        incrementally) and rewritten whenever the index changes.
+    refresh : bool, default False
+        Rebuild the index from the database.
+    update : bool, default False
+        Index the rows changed since the index was built before searching.
+
+    Returns
+    -------
+    pd.DataFrame
+        Matching ``mt_kosis_stat`` rows with the ``stat_nm`` of the survey
+        and a ``score`` column, best first.
+    """
+    global _search_index
+
+    with _catalog_lock:
+        index = None if refresh else _search_index
+        changed = False
+
+        if index is None and snapshot and not refresh and os.path.exists(snapshot):
+            index = KosisSearchIndex.load(snapshot)
+            update = True
+
+        if index is None:
+            index = KosisSearchIndex.from_db()
+            changed = True
+        elif update:
+            changed = index.update() > 0
+
+        if snapshot and changed:
+            index.save(snapshot)
+
+        _search_index = index
+
+    result = index.search(query, limit=limit, tables_only=tables_only, vw_cd=vw_cd)
+    return result[[c for c in result.columns if c not in _SEARCH_EXPL_COLUMNS[1:]]]
+
+
+# ----------------------------------------------------------------------
+# Crawler of the KOSIS statistics list (AU0001) into mt_kosis_stat
+# ----------------------------------------------------------------------
+_KOSIS_STAT_PK: List[str] = ["parent_id", "vw_cd", "list_id", "tbl_id"]
+
+
+def _kosis_list_children(
+    vw_cd: str,
+    parent_id: str,
+    api_key: str,
+    timeout: Optional[float] = None,
+) -> pd.DataFrame:
+    """One ``statisticsList.do`` call: the children of *parent_id*."""
+    api_url = (
+        "https://kosis.kr/openapi/statisticsList.do"
+        "?method=getList"
+        f"&apiKey={api_key}"
+        f"&vwCd={vw_cd}"
+        f"&parentListId={parent_id}"
+        "&format=json"
+        "&jsonVD=Y"
     )
+    response = http_get(api_url, timeout=timeout)
+    response.raise_for_status()
+    content = response.json()
+
+    if isinstance(content, dict):
+        # 조회결과 없음: a leaf list
+        if str(content.get("err")) == "30":
+            return pd.DataFrame(columns=_CATALOG_COLUMNS)
+        raise RuntimeError(f"KOSIS request failed: {content}")
+
+    df_list = pd.json_normalize(content)
+    df_list.columns = df_list.columns.str.lower()
+    df_list = df_list.reindex(columns=_CATALOG_COLUMNS)
+    df_list["parent_id"] = parent_id
+    df_list["vw_cd"] = df_list["vw_cd"].fillna(vw_cd)
+    for col in ("list_id", "tbl_id", "vw_nm", "stat_id"):
+        df_list[col] = df_list[col].fillna("").astype(str)
+
+    return df_list
+
+
+def _write_crawl_checkpoint(path: str, state: Dict[str, Any]) -> None:
+    """Write the crawler state atomically (a crash never leaves half a file)."""
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        json.dump(state, f, ensure_ascii=False)
+    os.replace(tmp_path, path)
+
+
+def crawl_kosis_catalog(
+    vw_cds: Optional[List[str]] = None,
+    checkpoint: Optional[str] = None,
+    max_workers: int = 4,
+    max_level: int = KOSIS_LIST_MAX_DEPTH,
+    api_key: Optional[str] = None,
+    timeout: Optional[float] = 30,
+    verbose: bool = True,
+) -> pd.DataFrame:
+    """
+    Crawl the KOSIS statistics list into ``ecodi_meta.mt_kosis_stat``.
 
-    # Separate rows that contain actual statistics (tbl_id != '') from
-    # those that are just containers (tbl_id == '')
-    is_stats_list = result[result["tbl_id"] != ""].copy()
-    no_stats_list = result[result["tbl_id"] == ""].copy()
+    The hierarchy of every view code is traversed breadth‑first: all lists
+    of one level are requested concurrently by *max_workers* threads, the
+    rows are de‑duplicated on the table's primary key (parent_id, vw_cd,
+    list_id, tbl_id) and upserted in one write per level.
 
-    # Recurse into each container node
-    if not no_stats_list.empty:
-        for _, row in no_stats_list.iterrows():
-            if verbose:
-                print(
-                    f"Processing recursive parent_id: {row['list_id']}"
-                )
-            # Recursive call – note that we pass the already‑computed
-            # hierarchical name for the child as ``parent_nm``.
-            temp_result = kosis_list_stats(
-                vw_cd=vw_cd,
-                parent_id=row["list_id"],
-                parent_nm=row["parent_nm"],
-                recursive=True,
-                verbose=verbose,
-            )
-            is_stats_list = pd.concat([is_stats_list, temp_result], ignore_index=True)
+    With *checkpoint* the frontier (the lists still to expand) is saved
+    as JSON after each level; a later call with the same file resumes
+    from there. The file is removed once the crawl completes, i.e. no
+    list failed and none was left unexpanded at *max_level*.
+
+    Parameters
+    ----------
+    vw_cds : list of str, optional
+        View codes to crawl; defaults to ``DEFAULT_VW_CD_LEVEL1``.
+    checkpoint : str, optional
+        Path of the JSON checkpoint file.
+    max_workers : int, default 4
+        Number of concurrent requests.
+    max_level : int, default KOSIS_LIST_MAX_DEPTH
+        Deepest level expanded.
+    api_key : str, optional
+        KOSIS API key. If omitted, taken from the KOSIS_API_KEY environment variable.
+    timeout : float, default 30
+        Read timeout of each request in seconds.
+    verbose : bool, default True
+        Print one line per level.
 
-    # Re‑order columns: bring ``parent_nm`` to the front
-    cols = is_stats_list.columns.tolist()
-    is_stats_list = is_stats_list[[cols[-1]] + cols[:-1]]
+    Returns
+    -------
+    pd.DataFrame
+        One row per level: lists expanded, rows found, rows written and
+        failed requests. ``attrs["failed"]`` lists the (vw_cd, parent_id)
+        pairs that failed; they are kept in the checkpoint for a retry.
+    """
+    api_key = api_key or os.getenv("KOSIS_API_KEY", "")
+    if not api_key:
+        raise ValueError("API key is missing. Set `api_key` argument or KOSIS_API_KEY env var.")
+
+    vw_cds = vw_cds or DEFAULT_VW_CD_LEVEL1
 
-    return is_stats_list
+    # ------------------------------------------------------------------
+    # Initial state, or the state of an interrupted crawl
+    # ------------------------------------------------------------------
+    state = {
+        "level": 1,
+        "frontier": [[vw_cd, ""] for vw_cd in vw_cds],
+        "expanded": [],
+        "failed": [],
+    }
+    if checkpoint and os.path.exists(checkpoint):
+        with open(checkpoint, encoding="utf-8") as f:
+            state = json.load(f)
+        # Retry what failed before
+        state["frontier"] = state["frontier"] + state.pop("failed", [])
+        state["failed"] = []
+        if verbose:
+            print(f"Resuming KOSIS crawl at level {state['level']} "
+                  f"with {len(state['frontier'])} lists")
+
+    expanded = {tuple(node) for node in state["expanded"]}
+    seen_pk = set()
+    level_stats = []
+
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        while state["frontier"] and state["level"] <= max_level:
+            frontier = [tuple(node) for node in state["frontier"] if tuple(node) not in expanded]
+            frontier = list(dict.fromkeys(frontier))
+
+            futures = {
+                executor.submit(_kosis_list_children, vw_cd, parent_id, api_key, timeout): (vw_cd, parent_id)
+                for vw_cd, parent_id in frontier
+            }
+
+            frames, failed = [], []
+            for future in as_completed(futures):
+                node = futures[future]
+                try:
+                    frames.append(future.result())
+                    expanded.add(node)
+                except Exception as e:
+                    failed.append(list(node))
+                    if verbose:
+                        print(f"Failed to list {node}: {e}")
+
+            df_level = pd.concat(frames, ignore_index=True) if frames else pd.DataFrame(columns=_CATALOG_COLUMNS)
+
+            # De‑duplicate on the primary key (within the level and the crawl)
+            df_level = df_level.drop_duplicates(subset=_KOSIS_STAT_PK, ignore_index=True)
+            is_new = [pk not in seen_pk for pk in df_level[_KOSIS_STAT_PK].itertuples(index=False, name=None)]
+            df_level = df_level[is_new].reset_index(drop=True)
+            seen_pk.update(df_level[_KOSIS_STAT_PK].itertuples(index=False, name=None))
+
+            written = 0
+            if not df_level.empty:
+                written = db_settable(
+                    name="mt_kosis_stat",
+                    value=df_level,
+                    schema="meta",
+                    mode="upsert",
+                    pk_cols=_KOSIS_STAT_PK,
+                )
+                if get_env("STATUS") == "0":
+                    raise RuntimeError(f"Writing mt_kosis_stat failed: {get_env('EMSG')}")
+
+            level_stats.append({
+                "level": state["level"],
+                "lists": len(frontier),
+                "rows": len(df_level),
+                "written": written or 0,
+                "failed": len(failed),
+            })
+            if verbose:
+                print(f"Level {state['level']}: {len(frontier)} lists, "
+                      f"{len(df_level)} rows, {len(failed)} failed")
+
+            # Containers (rows without tbl_id) are the next frontier
+            containers = df_level.loc[df_level["tbl_id"] == "", ["vw_cd", "list_id"]]
+            state = {
+                "level": state["level"] + 1,
+                "frontier": [[vw_cd, list_id] for vw_cd, list_id in containers.itertuples(index=False)
+                             if (vw_cd, list_id) not in expanded],
+                "expanded": [list(node) for node in expanded],
+                "failed": state["failed"] + failed,
+            }
+            if checkpoint:
+                _write_crawl_checkpoint(checkpoint, state)
+
+    # Keep the checkpoint while lists are left to expand (failed, or below
+    # max_level) so that the crawl can be resumed
+    finished = not state["failed"] and not state["frontier"]
+    if checkpoint and finished and os.path.exists(checkpoint):
+        os.remove(checkpoint)
+
+    result = pd.DataFrame(level_stats, columns=["level", "lists", "rows", "written", "failed"])
+    result.attrs["failed"] = [tuple(node) for node in state["failed"]]
+    return result
 
 
 def kosis_org_list(org_id: Optional[str] = None, is_short: bool = True) -> pd.DataFrame:
@@ -1018,18 +3043,6 @@ def kosis_org_list(org_id: Optional[str] = None, is_short: bool = True) -> pd.Da
     return result
   
 
-def db_settable(name: str, value: pd.DataFrame, append: bool, schema: str) -> bool:
-    """Insert a DataFrame into a DB table. Returns True on success."""
-    raise NotImplementedError("`db_settable` must be implemented.")
-
-def db_send_query(sql: str, schema: str) -> None:
-    """Execute a non‑SELECT statement (e.g., INSERT)."""
-    raise NotImplementedError("`db_send_query` must be implemented.")
-
-def db_commit(schema: str) -> None:
-    """Commit the current transaction for the given schema."""
-    raise NotImplementedError("`db_commit` must be implemented.")
-# ----------------------------------------------------------------------
 
 
 def import_kosis_indexpl(
@@ -1143,12 +3156,13 @@ def import_kosis_indexpl(
         cnt_before = getquery(cnt_before_query, schema).iloc[0, 0]
 
         # Append the DataFrame to the target table
-        is_ok = db_settable(
+        db_settable(
             name=table_id,
             value=df_data,
             append=True,
             schema=schema
         )
+        is_ok = get_env("STATUS") != "0"
 
         # Count rows after inserting
         cnt_after_query = f"SELECT COUNT(*) FROM ecodi_meta.{table_id}"
@@ -1178,11 +3192,10 @@ def import_kosis_indexpl(
     # Write the log entry into mt_log_dataimp
     # ------------------------------------------------------------------
     log_schema = "meta"
-    db_connect(log_schema)
-    db_send_query(insert_sql, log_schema)
-
-    if dbms.lower() == "mysql":
-        db_commit(log_schema)
+    if not is_connected(log_schema):
+        db_connect(log_schema)
+    with get_connection(log_schema).begin() as conn:
+        conn.execute(text(insert_sql))
 
     if verbose:
         logging.info(
@@ -1191,19 +3204,156 @@ def import_kosis_indexpl(
 
     # Return the success flag (True when data was appended)
     return is_ok
+
+
+def import_kosis_indexpl_many(
+    ind_ids: List[str],
+    max_workers: int = 4,
+    api_key: Optional[str] = None,
+    verbose: bool = True,
+) -> pd.DataFrame:
+    """
+    Import the explanations of many KOSIS indexes into `mt_kosis_indexpl`.
+
+    The explanations are fetched concurrently, upserted on ``ind_id`` in a
+    single write and one `mt_log_dataimp` row per index is inserted in a
+    single batch. Record counts come from the fetched rows of each index
+    (0 when the fetch or the write failed) instead of counting the table
+    before and after.
+
+    Parameters
+    ----------
+    ind_ids : list of str
+        Identifiers of the KOSIS indexes to import.
+    max_workers : int, default 4
+        Number of concurrent requests.
+    api_key : str, optional
+        KOSIS API key. If omitted, taken from the KOSIS_API_KEY environment variable.
+    verbose : bool, default True
+        Whether to print informational messages.
+
+    Returns
+    -------
+    pd.DataFrame
+        One row per index: ``ind_id``, ``record_cnt``, ``status`` and
+        ``error_msg``. ``attrs["affected"]`` holds the row count reported
+        by the upsert.
+    """
+    ind_ids = list(dict.fromkeys(str(ind_id) for ind_id in ind_ids if ind_id))
+    if not ind_ids:
+        raise ValueError("'ind_ids' must contain at least one index ID.")
+
+    schema = "meta"
+    table_id = "mt_kosis_indexpl"
+    table_nm = "KOSIS 지표설명"
+
+    def _fetch(ind_id: str) -> Dict[str, Any]:
+        fetched = {"start_dt": datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
+                   "data": pd.DataFrame(), "error_msg": ""}
+        try:
+            explain_info = get_kosis_indexpl(ind_id=ind_id, api_key=api_key)
+            if not isinstance(explain_info, pd.DataFrame):
+                fetched["error_msg"] = str(getattr(explain_info, "errMsg", explain_info))
+            elif explain_info.empty:
+                fetched["error_msg"] = "No data retrieved"
+            else:
+                fetched["data"] = explain_info
+        except Exception as exc:
+            fetched["error_msg"] = str(exc)
+        return fetched
+
+    # ------------------------------------------------------------------
+    # Fetch the explanations concurrently
+    # ------------------------------------------------------------------
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        fetched = dict(zip(ind_ids, executor.map(_fetch, ind_ids)))
+
+    frames = [f["data"] for f in fetched.values() if not f["data"].empty]
+
+    # ------------------------------------------------------------------
+    # One upsert for all indexes
+    # ------------------------------------------------------------------
+    affected = column_cnt = 0
+    status, emsg = "1", ""
+    if frames:
+        df_data = pd.concat(frames, ignore_index=True).drop_duplicates(subset=["IND_ID"], keep="last")
+        affected = db_settable(
+            name=table_id,
+            value=df_data,
+            schema=schema,
+            mode="upsert",
+            pk_cols=["IND_ID"],
+        ) or 0
+        status, emsg = get_env("STATUS"), get_env("EMSG")
+        column_cnt = df_data.shape[1]
+
+    end_dt = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+
+    # ------------------------------------------------------------------
+    # Log rows, written in one batch
+    # ------------------------------------------------------------------
+    summary, log_records = [], []
+    for ind_id, f in fetched.items():
+        if f["error_msg"]:
+            row_status, row_emsg, rcnt, ccnt = "0", f["error_msg"], 0, 0
+        else:
+            row_status, row_emsg = status, emsg
+            rcnt = 0 if status == "0" else len(f["data"])
+            ccnt = 0 if status == "0" else column_cnt
+
+        summary.append({"ind_id": ind_id, "record_cnt": rcnt,
+                        "status": row_status, "error_msg": row_emsg})
+        log_records.append({
+            "start_dt": f["start_dt"],
+            "end_dt": end_dt,
+            "data_id": "",
+            "table_id": table_id.upper(),
+            "table_nm": table_nm,
+            "api_params": f"explain for {ind_id}",
+            "record_cnt": rcnt,
+            "column_cnt": ccnt,
+            "status": row_status,
+            "error_msg": row_emsg,
+        })
+
+    write_log_dataimp(log_records, schema=schema)
+
+    result = pd.DataFrame(summary, columns=["ind_id", "record_cnt", "status", "error_msg"])
+    result.attrs["affected"] = affected
+
+    if verbose:
+        logging.info(
+            f"Imported {int(result['record_cnt'].sum())} record(s) for "
+            f"{len(ind_ids)} index ID(s), {int((result['status'] == '0').sum())} failed"
+        )
+
+    return result
   
   
 # Exported symbols (similar to R's @export)
 __all__ = [
     "desc_kosis_stats",
     "from_meta_kosisdesc",
+    "desc_kosis_stats_cached",
     "get_kosis_indexpl",
+    "get_kosis_stats",
+    "refresh_kosis_stats",
+    "write_kosis_parquet",
+    "read_kosis_parquet",
     "get_kosis_info",
+    "get_kosis_info_many",
     "get_kosis_explanation",
+    "import_kosis_statexpl",
     "kosis_stats_list",
     "kosis_list_level1",
     "kosis_list_parent",
     "kosis_list_stats",
+    "KosisCatalogIndex",
+    "get_kosis_catalog",
+    "KosisSearchIndex",
+    "search_kosis_stats",
+    "crawl_kosis_catalog",
     "kosis_org_list",
     "import_kosis_indexpl",
+    "import_kosis_indexpl_many",
 ]
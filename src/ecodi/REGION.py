@@ -0,0 +1,710 @@
+# -*- coding: utf-8 -*-
+"""
+In‑process index of the administrative regions in ``mt_region_mega``,
+``mt_region_cty`` and ``mt_region_admi``.
+
+Region codes form a hierarchy by length: 2 digits for 시도 (mega),
+5 digits for 시군구 (cty, prefixed by the mega code) and 8 digits for
+읍면동 (admi, prefixed by the cty code). The index resolves whole
+columns of codes to names, parent codes and land areas with array
+lookups instead of per‑row SQL or ``apply``.
+"""
+
+import importlib.resources
+import re
+import threading
+from typing import Any, Dict, List, Optional, Sequence, Union
+import numpy as np
+import pandas as pd
+from .DBMS import getquery
+
+# ----------------------------------------------------------------------
+# Region levels
+# ----------------------------------------------------------------------
+# level -> length of its code
+REGION_LEVELS: Dict[str, int] = {"mega": 2, "cty": 5, "admi": 8}
+
+_LEVEL_OF_LENGTH: Dict[int, str] = {length: level for level, length in REGION_LEVELS.items()}
+
+_REGION_FIELDS: List[str] = [
+    "level", "region_nm", "full_nm", "mega_cd", "cty_cd", "parent_cd", "land_area",
+]
+
+
+def _normalize_codes(codes: Union[pd.Series, Sequence[Any]]) -> pd.Series:
+    """
+    Region codes as strings: numbers lose any float suffix (``11.0`` ->
+    "11"), strings are stripped. Missing values stay ``<NA>``.
+    """
+    codes = codes if isinstance(codes, pd.Series) else pd.Series(list(codes))
+
+    if pd.api.types.is_numeric_dtype(codes):
+        return codes.astype("Int64").astype("string")
+    return codes.astype("string").str.strip()
+
+
+def region_level(codes: Union[pd.Series, Sequence[Any]]) -> pd.Series:
+    """Level ("mega", "cty", "admi") of each code from its length."""
+    codes = _normalize_codes(codes)
+    return codes.str.len().map(_LEVEL_OF_LENGTH).astype("string")
+
+
+def parent_code(codes: Union[pd.Series, Sequence[Any]], level: str = "mega") -> pd.Series:
+    """
+    Code of the ancestor at *level* ("mega" or "cty") of each code, by
+    prefix. Codes above *level* (e.g. a mega code for level="cty") map to
+    ``<NA>``.
+    """
+    if level not in ("mega", "cty"):
+        raise ValueError("level must be one of {'mega', 'cty'}")
+
+    codes = _normalize_codes(codes)
+    width = REGION_LEVELS[level]
+    return codes.str.slice(0, width).where(codes.str.len() >= width)
+
+
+# ----------------------------------------------------------------------
+# Region index
+# ----------------------------------------------------------------------
+class RegionIndex:
+    """
+    Lookup table of every mega, cty and admi region keyed by its code.
+
+    All attributes are stored as aligned arrays; ``lookup`` turns a column
+    of codes into positions with one ``Index.get_indexer`` call and takes
+    every field with it.
+    """
+
+    def __init__(self, mega: pd.DataFrame, cty: pd.DataFrame, admi: pd.DataFrame):
+        mega = mega.astype({"mega_cd": "string"})
+        cty = cty.astype({"mega_cd": "string", "cty_cd": "string"})
+        admi = admi.astype({"mega_cd": "string", "cty_cd": "string", "admi_cd": "string"})
+
+        frames = [
+            pd.DataFrame({
+                "region_cd": mega["mega_cd"],
+                "level": "mega",
+                "region_nm": mega["mega_nm"],
+                "full_nm": mega["mega_nm"],
+                "mega_cd": mega["mega_cd"],
+                "cty_cd": pd.NA,
+                "parent_cd": pd.NA,
+                "land_area": mega["land_area"],
+            }),
+            pd.DataFrame({
+                "region_cd": cty["cty_cd"],
+                "level": "cty",
+                "region_nm": cty["cty_nm"],
+                "full_nm": cty["mega_nm"] + " " + cty["cty_nm"],
+                "mega_cd": cty["mega_cd"],
+                "cty_cd": cty["cty_cd"],
+                "parent_cd": cty["mega_cd"],
+                "land_area": cty["land_area"],
+            }),
+            pd.DataFrame({
+                "region_cd": admi["admi_cd"],
+                "level": "admi",
+                "region_nm": admi["admi_nm"],
+                "full_nm": admi["mega_nm"] + " " + admi["cty_nm"] + " " + admi["admi_nm"],
+                "mega_cd": admi["mega_cd"],
+                "cty_cd": admi["cty_cd"],
+                "parent_cd": admi["cty_cd"],
+                "land_area": admi["land_area"],
+            }),
+        ]
+        table = pd.concat(frames, ignore_index=True)
+        table["land_area"] = pd.to_numeric(table["land_area"], errors="coerce")
+        table = table.drop_duplicates(subset="region_cd", keep="first").reset_index(drop=True)
+
+        self.table = table.astype({
+            "region_cd": "string", "level": "string", "region_nm": "string",
+            "full_nm": "string", "mega_cd": "string", "cty_cd": "string",
+            "parent_cd": "string", "land_area": "float64",
+        })
+        self._index = pd.Index(self.table["region_cd"].to_numpy(dtype=object))
+
+    # ------------------------------------------------------------------
+    # Construction
+    # ------------------------------------------------------------------
+    @classmethod
+    def from_csv(cls) -> "RegionIndex":
+        """Build the index from the CSV files packaged in ``ecodi.dbms.meta``."""
+        meta_path = importlib.resources.files("ecodi.dbms.meta")
+        code_types = {"mega_cd": str, "cty_cd": str, "admi_cd": str}
+
+        frames = []
+        for level in REGION_LEVELS:
+            with (meta_path / f"mt_region_{level}.csv").open(encoding="utf-8") as f:
+                frames.append(pd.read_csv(f, dtype=code_types))
+        return cls(*frames)
+
+    @classmethod
+    def from_db(cls) -> "RegionIndex":
+        """Build the index from the ``ecodi_meta.mt_region_*`` tables."""
+        columns = {
+            "mega": "mega_cd, mega_nm, land_area",
+            "cty": "mega_cd, mega_nm, cty_cd, cty_nm, land_area",
+            "admi": "mega_cd, mega_nm, cty_cd, cty_nm, admi_cd, admi_nm, land_area",
+        }
+        frames = [
+            getquery(f"SELECT {cols} FROM ecodi_meta.mt_region_{level}", schema="meta")
+            for level, cols in columns.items()
+        ]
+        return cls(*frames)
+
+    # ------------------------------------------------------------------
+    # Lookups
+    # ------------------------------------------------------------------
+    def positions(self, codes: Union[pd.Series, Sequence[Any]]) -> np.ndarray:
+        """Row of each code in ``table`` (-1 for unknown or missing codes)."""
+        codes = _normalize_codes(codes)
+        return self._index.get_indexer(codes.to_numpy(dtype=object, na_value=None))
+
+    def lookup(
+        self,
+        codes: Union[pd.Series, Sequence[Any]],
+        fields: Optional[List[str]] = None,
+    ) -> pd.DataFrame:
+        """
+        Region attributes of each code, aligned with *codes*.
+
+        Parameters
+        ----------
+        codes : pd.Series or sequence
+            2, 5 or 8 digit region codes (strings or numbers); levels may
+            be mixed.
+        fields : list of str, optional
+            Any of "level", "region_nm", "full_nm", "mega_cd", "cty_cd",
+            "parent_cd", "land_area" (all when omitted).
+
+        Returns
+        -------
+        pd.DataFrame
+            One row per code with the index of *codes* (when a Series);
+            unknown codes get missing values.
+        """
+        fields = fields or _REGION_FIELDS
+        unknown = [f for f in fields if f not in _REGION_FIELDS]
+        if unknown:
+            raise ValueError(f"Unknown region field(s): {unknown}")
+
+        index = codes.index if isinstance(codes, pd.Series) else None
+        pos = self.positions(codes)
+        found = pos >= 0
+
+        result = {}
+        for field_nm in fields:
+            column = self.table[field_nm]
+            if len(column):
+                values = column.iloc[np.where(found, pos, 0)].reset_index(drop=True)
+                result[field_nm] = values.mask(~found)
+            else:
+                result[field_nm] = pd.Series(pd.NA, index=range(len(pos)), dtype=column.dtype)
+
+        result = pd.DataFrame(result)
+        if index is not None:
+            result.index = index
+        return result
+
+    def name(self, codes: Union[pd.Series, Sequence[Any]], full: bool = False) -> pd.Series:
+        """Region name (or "mega cty admi" full name) of each code."""
+        field_nm = "full_nm" if full else "region_nm"
+        return self.lookup(codes, [field_nm])[field_nm]
+
+    def land_area(self, codes: Union[pd.Series, Sequence[Any]]) -> pd.Series:
+        """Land area of each region."""
+        return self.lookup(codes, ["land_area"])["land_area"]
+
+    def children(self, code: Optional[str] = None) -> pd.DataFrame:
+        """Regions directly below *code* (the mega regions when omitted)."""
+        if code is None:
+            return self.table[self.table["level"] == "mega"].reset_index(drop=True)
+        return self.table[self.table["parent_cd"] == str(code)].reset_index(drop=True)
+
+    def add_region_columns(
+        self,
+        df: pd.DataFrame,
+        code_col: str,
+        fields: Optional[List[str]] = None,
+        prefix: str = "",
+    ) -> pd.DataFrame:
+        """Return *df* with the region *fields* of *code_col* added as columns."""
+        attrs = self.lookup(df[code_col], fields)
+        attrs.columns = [f"{prefix}{c}" for c in attrs.columns]
+        return pd.concat([df, attrs], axis=1)
+
+
+_region_index: Optional[RegionIndex] = None
+_region_lock = threading.Lock()
+
+
+def get_region_index(source: str = "csv", refresh: bool = False) -> RegionIndex:
+    """
+    Return the in‑process ``RegionIndex``, loading it on first use.
+
+    Parameters
+    ----------
+    source : {"csv", "db"}, default "csv"
+        Load the packaged CSV files or the ``ecodi_meta.mt_region_*`` tables.
+    refresh : bool, default False
+        Reload the index.
+    """
+    global _region_index
+
+    if source not in ("csv", "db"):
+        raise ValueError("source must be one of {'csv', 'db'}")
+
+    with _region_lock:
+        if _region_index is None or refresh:
+            _region_index = RegionIndex.from_csv() if source == "csv" else RegionIndex.from_db()
+        return _region_index
+
+
+# ----------------------------------------------------------------------
+# Roll‑up aggregation
+# ----------------------------------------------------------------------
+def rollup_region(
+    df: pd.DataFrame,
+    code_col: str,
+    value_cols: List[str],
+    to: Union[str, List[str]] = "cty",
+    how: Union[str, Dict[str, str]] = "sum",
+    weights: Optional[str] = None,
+    density: Optional[List[str]] = None,
+    by: Optional[List[str]] = None,
+    index: Optional[RegionIndex] = None,
+) -> pd.DataFrame:
+    """
+    Aggregate region level data up to a higher level of the hierarchy.
+
+    The parent code of every row is taken from its code prefix and the
+    rows are aggregated in one ``groupby``; rows above the target level
+    are dropped. A row at or above the level of other rows under it
+    (e.g. a 시군구 total next to its 읍면동 rows, within the same *by*
+    group) is dropped too, so totals are not counted twice; it is used
+    when the region has no lower level rows. Sums of groups without any
+    value (``-`` in KOSIS) stay missing.
+
+    Parameters
+    ----------
+    df : pd.DataFrame
+        Data with a region code column and value columns.
+    code_col : str
+        Column of region codes (any level below or at *to*).
+    value_cols : list of str
+        Columns to aggregate.
+    to : {"cty", "mega"} or list of them, default "cty"
+        Target level(s). With several levels the results are stacked
+        with a ``level`` column.
+    how : {"sum", "mean", "wmean", "min", "max"} or dict, default "sum"
+        Aggregation of every value column, or ``{column: how}``. "wmean"
+        is the mean weighted by the *weights* column (e.g. population).
+    weights : str, optional
+        Weight column for "wmean".
+    density : list of str, optional
+        Value columns to also report per km² of the target region
+        (``{col}_density`` = aggregated value / ``land_area``).
+    by : list of str, optional
+        Additional grouping columns (e.g. ``PRD_DE``, ``ITM_ID``).
+    index : RegionIndex, optional
+        Region metadata; defaults to ``get_region_index()``.
+
+    Returns
+    -------
+    pd.DataFrame
+        ``region_cd``, the *by* columns, the aggregated values, ``n``
+        (number of source rows), ``region_nm``, ``land_area`` and the
+        densities.
+    """
+    index = index or get_region_index()
+    by = list(by or [])
+    density = list(density or [])
+
+    if isinstance(to, (list, tuple)):
+        results = [
+            rollup_region(df, code_col, value_cols, level, how, weights, density, by, index)
+            .assign(level=level)
+            for level in to
+        ]
+        return pd.concat(results, ignore_index=True)
+
+    if to not in ("cty", "mega"):
+        raise ValueError("to must be one of {'cty', 'mega'}")
+
+    how = how if isinstance(how, dict) else {col: how for col in value_cols}
+    unknown = {h for h in how.values() if h not in ("sum", "mean", "wmean", "min", "max")}
+    if unknown:
+        raise ValueError(f"Unknown aggregation(s): {sorted(unknown)}")
+    if "wmean" in how.values() and weights is None:
+        raise ValueError("'weights' must be provided for how='wmean'.")
+
+    # ------------------------------------------------------------------
+    # Working frame: group keys and helper columns of the weighted means
+    # ------------------------------------------------------------------
+    missing = [col for col in density if col not in value_cols]
+    if missing:
+        raise ValueError(f"density column(s) {missing} must be in value_cols.")
+
+    # Rows that have lower level rows in the same group (region totals)
+    codes = _normalize_codes(df[code_col]).reset_index(drop=True)
+    keys = df[by].reset_index(drop=True)
+    ancestors = pd.concat([
+        keys.assign(_cd=parent_code(codes, level).where(codes.str.len() > width))
+        for level, width in REGION_LEVELS.items() if level != "admi"
+    ]).dropna(subset=["_cd"])
+    has_children = pd.MultiIndex.from_frame(keys.assign(_cd=codes)).isin(
+        pd.MultiIndex.from_frame(ancestors.drop_duplicates())
+    )
+
+    work = df[by + list(value_cols)].reset_index(drop=True)
+    for col in value_cols:
+        # KOSIS values arrive as strings ("-" for missing)
+        work[col] = pd.to_numeric(work[col], errors="coerce")
+    work["region_cd"] = parent_code(codes, to).to_numpy()
+    work["n"] = 1
+    work = work.loc[~has_children]
+
+    aggregations: Dict[str, str] = {"n": "sum"}
+    for col in value_cols:
+        if how.get(col, "sum") == "wmean":
+            weight = pd.to_numeric(df[weights], errors="coerce").to_numpy()[~has_children]
+            weight = pd.Series(weight, index=work.index).where(work[col].notna())
+            work[f"_wx_{col}"] = work[col] * weight
+            work[f"_w_{col}"] = weight
+            aggregations[f"_wx_{col}"] = "sum"
+            aggregations[f"_w_{col}"] = "sum"
+        else:
+            aggregations[col] = how.get(col, "sum")
+            if aggregations[col] == "sum":
+                work[f"_cnt_{col}"] = work[col]
+                aggregations[f"_cnt_{col}"] = "count"
+
+    result = (
+        work.dropna(subset=["region_cd"])
+        .groupby(["region_cd"] + by, sort=True, observed=True, dropna=False)
+        .agg(aggregations)
+        .reset_index()
+    )
+
+    for col in value_cols:
+        if how.get(col, "sum") == "wmean":
+            result[col] = result.pop(f"_wx_{col}") / result.pop(f"_w_{col}").replace(0, np.nan)
+        elif how.get(col, "sum") == "sum":
+            # Like min_count=1: a group of missing values sums to NaN, not 0
+            result[col] = result[col].where(result.pop(f"_cnt_{col}") > 0)
+
+    # ------------------------------------------------------------------
+    # Names, areas and densities of the target regions
+    # ------------------------------------------------------------------
+    attrs = index.lookup(result["region_cd"], ["region_nm", "land_area"])
+    result["region_nm"] = attrs["region_nm"].to_numpy()
+    result["land_area"] = attrs["land_area"].to_numpy()
+
+    for col in density:
+        result[f"{col}_density"] = result[col] / result["land_area"].replace(0, np.nan)
+
+    return result[["region_cd"] + by + value_cols + ["n", "region_nm", "land_area"]
+                  + [f"{col}_density" for col in density]]
+
+
+# ----------------------------------------------------------------------
+# Fuzzy matching of Korean region names
+# ----------------------------------------------------------------------
+_CHOSEONG = "ㄱㄲㄴㄷㄸㄹㅁㅂㅃㅅㅆㅇㅈㅉㅊㅋㅌㅍㅎ"
+_JUNGSEONG = "ㅏㅐㅑㅒㅓㅔㅕㅖㅗㅘㅙㅚㅛㅜㅝㅞㅟㅠㅡㅢㅣ"
+_JONGSEONG = [
+    "", "ㄱ", "ㄲ", "ㄳ", "ㄴ", "ㄵ", "ㄶ", "ㄷ", "ㄹ", "ㄺ", "ㄻ", "ㄼ", "ㄽ", "ㄾ",
+    "ㄿ", "ㅀ", "ㅁ", "ㅂ", "ㅄ", "ㅅ", "ㅆ", "ㅇ", "ㅈ", "ㅊ", "ㅋ", "ㅌ", "ㅍ", "ㅎ",
+]
+
+# Suffixes of mega names dropped in their short form (서울특별시 -> 서울)
+_MEGA_SUFFIXES = ("특별자치시", "특별자치도", "특별시", "광역시")
+
+# Level suffixes that may be omitted in the input (충장동 -> 충장)
+_LEVEL_SUFFIXES = ("동", "읍", "면", "가", "구", "군", "시")
+
+
+def _normalize_region_name(name: Any) -> str:
+    """Region name without parentheses, spaces and punctuation."""
+    if name is None or (not isinstance(name, str) and pd.isna(name)):
+        return ""
+    name = re.sub(r"\(.*?\)", "", str(name))
+    return re.sub(r"[^0-9A-Za-z가-힣]", "", name)
+
+
+def _mega_aliases(mega_nm: str) -> List[str]:
+    """Short forms of a mega name: 광주광역시 -> 광주, 충청남도 -> 충남, 경기도 -> 경기."""
+    aliases = []
+    for suffix in _MEGA_SUFFIXES:
+        if mega_nm.endswith(suffix):
+            aliases.append(mega_nm[: -len(suffix)])
+            break
+    else:
+        if mega_nm.endswith("도") and len(mega_nm) == 4:
+            aliases.append(mega_nm[0] + mega_nm[2])
+        elif mega_nm.endswith("도"):
+            aliases.append(mega_nm[:-1])
+    return [alias for alias in aliases if alias]
+
+
+def _to_jamo(text: str) -> str:
+    """Decompose Hangul syllables into their jamo."""
+    jamo = []
+    for char in text:
+        code = ord(char) - 0xAC00
+        if 0 <= code < 11172:
+            jamo.append(_CHOSEONG[code // 588])
+            jamo.append(_JUNGSEONG[(code % 588) // 28])
+            jamo.append(_JONGSEONG[code % 28])
+        else:
+            jamo.append(char)
+    return "".join(jamo)
+
+
+def _jamo_ngrams(text: str, n: int = 3) -> set:
+    """Jamo n‑grams of a normalised name (typo tolerant matching)."""
+    jamo = _to_jamo(text)
+    if len(jamo) <= n:
+        return {jamo} if jamo else set()
+    return {jamo[i:i + n] for i in range(len(jamo) - n + 1)}
+
+
+class RegionMatcher:
+    """
+    Resolve Korean region names ("광주 동구", "충장동") to region codes.
+
+    Precomputed indexes:
+
+    * normalised full names ("광주광역시동구", also with the short mega
+      name "광주동구") for exact matches of complete names;
+    * normalised region names (and names without their level suffix)
+      for exact matches of the last word of the input;
+    * jamo trigrams of the region names for fuzzy (typo) matches.
+
+    The words before the last one are the parent context: candidates
+    whose mega/cty names contain them score higher. A result is flagged
+    ambiguous when the runner‑up scores within *ambiguity_margin* of the
+    best candidate. Results are cached per distinct input.
+    """
+
+    def __init__(
+        self,
+        index: Optional[RegionIndex] = None,
+        min_score: float = 0.5,
+        ambiguity_margin: float = 0.05,
+    ):
+        self.index = index or get_region_index()
+        self.min_score = min_score
+        self.ambiguity_margin = ambiguity_margin
+
+        table = self.index.table
+        self._levels = table["level"].to_numpy(dtype=object)
+        names = [_normalize_region_name(nm) for nm in table["region_nm"]]
+
+        # Parent context of each region: its normalised full name plus the
+        # short form of its mega name
+        mega_nm = table["mega_cd"].map(
+            dict(zip(table.loc[table["level"] == "mega", "region_cd"],
+                     table.loc[table["level"] == "mega", "region_nm"]))
+        )
+        self._context: List[str] = []
+        self._full: Dict[str, List[int]] = {}
+        self._exact: Dict[str, List[int]] = {}
+        self._partial: Dict[str, List[int]] = {}
+
+        for pos, (name, full_nm, mega) in enumerate(zip(names, table["full_nm"], mega_nm)):
+            full = _normalize_region_name(full_nm)
+            aliases = _mega_aliases(mega) if isinstance(mega, str) else []
+            self._context.append(full + "".join(aliases))
+
+            full_keys = {full}
+            for alias in aliases:
+                full_keys.add(alias + full[len(mega):])
+            for key in full_keys:
+                self._full.setdefault(key, []).append(pos)
+
+            exact_keys = {name}
+            if self._levels[pos] == "mega":
+                exact_keys.update(aliases)
+            # "수원시 장안구" is also known as "장안구"
+            exact_keys.add(_normalize_region_name(str(table["region_nm"].iat[pos]).split()[-1]))
+            for key in exact_keys:
+                self._exact.setdefault(key, []).append(pos)
+
+            if len(name) >= 3 and name.endswith(_LEVEL_SUFFIXES):
+                self._partial.setdefault(name[:-1], []).append(pos)
+
+        # Inverted index of jamo trigrams
+        postings: Dict[str, List[int]] = {}
+        gram_counts = []
+        for pos, name in enumerate(names):
+            grams = _jamo_ngrams(name)
+            gram_counts.append(len(grams))
+            for gram in grams:
+                postings.setdefault(gram, []).append(pos)
+        self._grams = {g: np.asarray(p, dtype=np.int32) for g, p in postings.items()}
+        self._gram_counts = np.asarray(gram_counts, dtype=np.float64)
+
+        self._cache: Dict[tuple, Dict[str, Any]] = {}
+
+    # ------------------------------------------------------------------
+    # Candidates
+    # ------------------------------------------------------------------
+    def _fuzzy(self, name: str, limit: int = 10) -> Dict[int, float]:
+        """Regions whose name is similar to *name* (Dice over jamo trigrams)."""
+        grams = _jamo_ngrams(name)
+        hits = [self._grams[g] for g in grams if g in self._grams]
+        if not hits:
+            return {}
+
+        common = np.bincount(np.concatenate(hits), minlength=len(self._gram_counts))
+        dice = 2.0 * common / (len(grams) + self._gram_counts)
+        candidates = np.flatnonzero(dice >= self.min_score)
+        if candidates.size > limit:
+            candidates = candidates[np.argsort(-dice[candidates])[:limit]]
+        return {int(pos): float(dice[pos]) for pos in candidates}
+
+    def _resolve(self, text: Any, level: Optional[str]) -> Dict[str, Any]:
+        """Best region of one input name."""
+        words = [w for w in (_normalize_region_name(t) for t in str(text).split()) if w]
+        query = "".join(words)
+
+        candidates: Dict[int, float] = {}
+        context: List[str] = []
+
+        if query in self._full:
+            candidates = {pos: 1.0 for pos in self._full[query]}
+        elif words:
+            target, context = words[-1], words[:-1]
+            candidates = {pos: 1.0 for pos in self._exact.get(target, [])}
+            for pos in self._partial.get(target, []):
+                candidates.setdefault(pos, 0.9)
+            if not candidates:
+                candidates = self._fuzzy(target)
+
+        if level is not None:
+            candidates = {pos: s for pos, s in candidates.items() if self._levels[pos] == level}
+
+        # Parent context
+        scored = []
+        for pos, similarity in candidates.items():
+            if context:
+                matched = sum(word in self._context[pos] for word in context)
+                similarity *= 0.6 + 0.4 * matched / len(context)
+            scored.append((similarity, pos))
+        scored.sort(key=lambda item: (-item[0], item[1]))
+
+        if not scored:
+            return {"pos": -1, "score": 0.0, "ambiguous": False, "n_candidates": 0}
+
+        best_score, best_pos = scored[0]
+        ambiguous = len(scored) > 1 and scored[1][0] >= best_score - self.ambiguity_margin
+        return {
+            "pos": best_pos,
+            "score": round(best_score, 4),
+            "ambiguous": ambiguous,
+            "n_candidates": len(scored),
+        }
+
+    # ------------------------------------------------------------------
+    # Batch matching
+    # ------------------------------------------------------------------
+    def match(
+        self,
+        names: Union[pd.Series, Sequence[Any]],
+        level: Optional[str] = None,
+    ) -> pd.DataFrame:
+        """
+        Resolve a column of region names to codes.
+
+        Parameters
+        ----------
+        names : pd.Series or sequence
+            Region names, optionally preceded by their parents
+            ("광주광역시 동구", "광주 동구 충장동").
+        level : {"mega", "cty", "admi"}, optional
+            Only match regions of this level.
+
+        Returns
+        -------
+        pd.DataFrame
+            Aligned with *names*: ``region_cd``, ``level``, ``region_nm``,
+            ``full_nm``, ``score`` (0–1), ``ambiguous`` and
+            ``n_candidates``. Unmatched names get missing values.
+        """
+        if level is not None and level not in REGION_LEVELS:
+            raise ValueError(f"level must be one of {set(REGION_LEVELS)}")
+
+        index = names.index if isinstance(names, pd.Series) else None
+        codes, uniques = pd.factorize(pd.Series(list(names), dtype=object), use_na_sentinel=True)
+
+        # Each distinct name is resolved once (and cached across calls)
+        resolved = []
+        for name in uniques:
+            key = (name, level)
+            if key not in self._cache:
+                self._cache[key] = self._resolve(name, level)
+            resolved.append(self._cache[key])
+
+        unmatched = {"pos": -1, "score": 0.0, "ambiguous": False, "n_candidates": 0}
+        per_unique = pd.DataFrame(resolved + [unmatched])
+        # Missing names (code -1) take the last, unmatched row
+        rows = per_unique.iloc[np.where(codes >= 0, codes, len(resolved))].reset_index(drop=True)
+
+        pos = rows["pos"].to_numpy()
+        found = pos >= 0
+        table = self.index.table
+        result = pd.DataFrame({
+            col: table[col].iloc[np.where(found, pos, 0)].reset_index(drop=True).mask(~found)
+            for col in ("region_cd", "level", "region_nm", "full_nm")
+        }) if len(table) else pd.DataFrame(columns=["region_cd", "level", "region_nm", "full_nm"])
+        result["score"] = rows["score"].to_numpy()
+        result["ambiguous"] = rows["ambiguous"].to_numpy(dtype=bool)
+        result["n_candidates"] = rows["n_candidates"].to_numpy()
+
+        if index is not None:
+            result.index = index
+        return result
+
+    def cache_clear(self) -> None:
+        """Forget the cached results."""
+        self._cache.clear()
+
+
+_region_matcher: Optional[RegionMatcher] = None
+_matcher_lock = threading.Lock()
+
+
+def match_region_names(
+    names: Union[pd.Series, Sequence[Any]],
+    level: Optional[str] = None,
+) -> pd.DataFrame:
+    """
+    Resolve region names to codes with a shared ``RegionMatcher``.
+
+    See ``RegionMatcher.match``; the matcher (and its cache) is built on
+    first use from ``get_region_index()``.
+    """
+    global _region_matcher
+
+    # get_region_index takes _region_lock itself
+    index = get_region_index()
+    with _matcher_lock:
+        if _region_matcher is None or _region_matcher.index is not index:
+            _region_matcher = RegionMatcher(index)
+        matcher = _region_matcher
+
+    return matcher.match(names, level=level)
+
+
+# Exported symbols (similar to R's @export)
+__all__ = [
+    "REGION_LEVELS",
+    "region_level",
+    "parent_code",
+    "RegionIndex",
+    "get_region_index",
+    "rollup_region",
+    "RegionMatcher",
+    "match_region_names",
+]
@@ -0,0 +1,27 @@
+import numpy as np
+import pandas as pd
+
+from ecodi.DBMS import _row_hashes
+
+
+def test_row_hashes_ignore_inferred_number_dtype():
+    as_int = pd.DataFrame({"k": ["a", "b"], "v": [1, 2]})
+    as_float = pd.DataFrame({"k": ["a", "b"], "v": [1.0, 2.0]})
+    as_object = pd.DataFrame({"k": ["a", "b"], "v": ["1", 2.0]}, dtype=object)
+
+    assert (_row_hashes(as_int) == _row_hashes(as_float)).all()
+    assert (_row_hashes(as_int) == _row_hashes(as_object)).all()
+
+
+def test_row_hashes_int_column_with_null():
+    stored = pd.DataFrame({"k": ["a", "b"], "v": [1, 2]})
+    fetched = pd.DataFrame({"k": ["a", "b", "c"], "v": [1, 2, np.nan]})
+
+    assert (_row_hashes(fetched).iloc[:2].to_numpy() == _row_hashes(stored).to_numpy()).all()
+
+
+def test_row_hashes_detect_changes():
+    before = pd.DataFrame({"k": ["a"], "v": [1.5]})
+    after = pd.DataFrame({"k": ["a"], "v": [1.25]})
+
+    assert (_row_hashes(before) != _row_hashes(after)).all()
@@ -0,0 +1,38 @@
+import pandas as pd
+
+from ecodi.REGION import get_region_index, match_region_names, rollup_region
+
+
+def test_match_region_names():
+    result = match_region_names(pd.Series(["광주 동구", "충장동", "서울 종로구", None]))
+
+    assert result["region_cd"].tolist()[:3] == ["29110", "29110525", "11110"]
+    assert not result["ambiguous"].iloc[0]
+    assert pd.isna(result["region_cd"].iloc[3])
+
+
+def test_match_region_names_ambiguous_without_context():
+    result = match_region_names(["동구"], level="cty")
+
+    assert result["ambiguous"].iloc[0]
+    assert result["n_candidates"].iloc[0] > 1
+
+
+def test_rollup_region_drops_totals_with_children():
+    df = pd.DataFrame({
+        "code": ["29110", "29110525", "29110545"],
+        "value": ["30", "10", "20"],
+    })
+
+    result = rollup_region(df, "code", ["value"], to="cty", index=get_region_index())
+
+    assert result["value"].tolist() == [30]
+    assert result["n"].tolist() == [2]
+
+
+def test_rollup_region_keeps_all_missing_sum_missing():
+    df = pd.DataFrame({"code": ["29110525", "29110545"], "value": ["-", "-"]})
+
+    result = rollup_region(df, "code", ["value"], to="cty")
+
+    assert pd.isna(result["value"].iloc[0])